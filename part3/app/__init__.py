@@ -30,10 +30,9 @@ def create_app(config_class=DevelopmentConfig):
     bcrypt.init_app(app)
     jwt.init_app(app)
     db.init_app(app)
-    
-    with app.app_context():
-        db.create_all()
-    
+    # No DDL at startup: the schema is created and upgraded by the versioned
+    # migrations (python init_db.py / flask db upgrade) before deploying
+
     from app.api.v1 import api_v1_bp
     app.register_blueprint(api_v1_bp)
     
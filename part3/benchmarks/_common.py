@@ -0,0 +1,87 @@
+"""
+Helpers shared by the benchmark scripts.
+
+Every benchmark runs against a throwaway SQLite database so it never
+touches development.db.
+"""
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+# Make the part3 directory importable when running `python benchmarks/x.py`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event  # noqa: E402
+
+from hbnb.app import create_app, db  # noqa: E402
+
+
+class BenchConfig:
+    """Minimal configuration pointing at a temporary SQLite file"""
+    SECRET_KEY = 'benchmark-secret-key-not-for-production'
+    JWT_SECRET_KEY = SECRET_KEY
+    TESTING = True
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def make_app(db_path=None, config=BenchConfig):
+    """
+    Create an app with a fresh schema.
+
+    Args:
+        db_path: SQLite file to use (default: a new temporary file)
+        config: Base configuration class
+
+    Returns:
+        (app, db_path)
+    """
+    if db_path is None:
+        fd, db_path = tempfile.mkstemp(suffix='.db', prefix='hbnb-bench-')
+        os.close(fd)
+        os.unlink(db_path)
+
+    class _Config(config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+
+    app = create_app(_Config)
+    with app.app_context():
+        db.create_all()
+    return app, db_path
+
+
+@contextmanager
+def count_statements():
+    """Count the SQL statements executed on the current app's engine"""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+
+@contextmanager
+def timer():
+    """Measure wall-clock time in seconds; read `result['elapsed']`"""
+    result = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result['elapsed'] = time.perf_counter() - start
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile of a list of numbers"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: bcrypt hash and verify time per cost factor.
+
+Prints the median hash and verify time for each cost on this machine,
+and the cost BCRYPT_TARGET_MS would calibrate to for a few budgets.
+
+Usage:
+    python benchmarks/bench_bcrypt_cost.py [max_cost] [samples]
+"""
+import statistics
+import sys
+
+from _common import timer  # noqa: F401 (also puts part3 on sys.path)
+
+from flask_bcrypt import Bcrypt
+
+from hbnb.app.utils.password_hashing import calibrate_rounds, hash_cost
+
+TARGETS_MS = (50, 100, 250, 500, 1000)
+
+
+def median_ms(func, samples):
+    times = []
+    for _ in range(samples):
+        with timer() as t:
+            func()
+        times.append(t['elapsed'] * 1000)
+    return statistics.median(times)
+
+
+def main(max_cost, samples):
+    bcrypt = Bcrypt()
+    print("=" * 60)
+    print(f"bcrypt cost factors 4..{max_cost} ({samples} samples each)")
+    print("=" * 60)
+    print(f"  {'cost':>4}  {'hash ms':>9}  {'verify ms':>9}")
+    for cost in range(4, max_cost + 1):
+        pw_hash = bcrypt.generate_password_hash('correct horse', cost)
+        assert hash_cost(pw_hash.decode()) == cost
+        hash_ms = median_ms(lambda: bcrypt.generate_password_hash('correct horse', cost),
+                            samples)
+        verify_ms = median_ms(lambda: bcrypt.check_password_hash(pw_hash, 'correct horse'),
+                              samples)
+        print(f"  {cost:>4}  {hash_ms:9.2f}  {verify_ms:9.2f}")
+    print()
+    for target in TARGETS_MS:
+        print(f"  BCRYPT_TARGET_MS={target:<5} -> cost {calibrate_rounds(bcrypt, target)}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 14,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5)
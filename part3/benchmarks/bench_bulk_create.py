@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark: creating places one by one vs. POST /api/v1/places/batch.
+
+Both runs go through the HTTP layer with the Flask test client against a
+file-backed SQLite database, and report rows per second.
+
+Usage:
+    python benchmarks/bench_bulk_create.py [n_places]
+"""
+import os
+import sys
+
+from _common import make_app, timer
+
+from flask_jwt_extended import create_access_token
+
+from hbnb.app import db
+from hbnb.app.services import facade
+
+
+def payload(owner_id, amenity_ids, i):
+    return {'title': f'Place {i}', 'description': '', 'price': 50.0 + i % 100,
+            'latitude': 45.0 + (i % 90) / 10, 'longitude': 5.0 + (i % 50) / 10,
+            'owner_id': owner_id, 'amenities': amenity_ids}
+
+
+def setup(app):
+    owner = facade.create_user({'first_name': 'Owner', 'last_name': 'Bench',
+                                'email': 'owner@bench.io', 'password': 'x'})
+    amenities = [facade.create_amenity({'name': f'Amenity {i}'}).id for i in range(3)]
+    token = create_access_token(identity=owner.id, additional_claims={'is_admin': False})
+    return owner.id, amenities, {'Authorization': f'Bearer {token}'}
+
+
+def run(n_places, batch):
+    app, path = make_app()
+    app.config['BATCH_MAX_ITEMS'] = max(n_places, 1)
+    try:
+        with app.app_context():
+            owner_id, amenities, headers = setup(app)
+            client = app.test_client()
+            items = [payload(owner_id, amenities, i) for i in range(n_places)]
+            with timer() as t:
+                if batch:
+                    response = client.post('/api/v1/places/batch', json=items, headers=headers)
+                    assert response.status_code == 201, response.json
+                else:
+                    for item in items:
+                        response = client.post('/api/v1/places/', json=item, headers=headers)
+                        assert response.status_code == 201, response.json
+            db.session.remove()
+            return t['elapsed']
+    finally:
+        os.unlink(path)
+
+
+def main(n_places):
+    print("=" * 60)
+    print(f"Creating {n_places:,} places with 3 amenities each")
+    print("=" * 60)
+    single = run(n_places, batch=False)
+    print(f"  one POST per place: {single:7.2f} s  {n_places / single:10,.0f} rows/s")
+    bulk = run(n_places, batch=True)
+    print(f"  one batch POST:     {bulk:7.2f} s  {n_places / bulk:10,.0f} rows/s")
+    print(f"✅ Batch is {single / bulk:.1f}x faster")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: peak memory of GET /api/v1/places/export as the table grows.
+
+Seeds a small and a large table (default 5,000 and 50,000 places with two
+amenities each), streams the export through the Flask test client without
+buffering, and compares the tracemalloc peak of both runs.
+
+Usage:
+    python benchmarks/bench_export_memory.py [small] [large]
+"""
+import os
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime
+
+from _common import make_app, timer
+
+from flask_jwt_extended import create_access_token
+
+from hbnb.app import db
+from hbnb.app.models import place_amenity
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+
+BATCH = 50000
+
+
+def seed(n_places):
+    now = datetime.utcnow()
+    owner_id = str(uuid.uuid4())
+    db.session.execute(User.__table__.insert(), [{
+        'id': owner_id, 'first_name': 'Owner', 'last_name': 'Bench',
+        'email': 'owner@bench.io', 'password': 'x', 'is_admin': True,
+        'created_at': now, 'updated_at': now,
+    }])
+    amenity_ids = [str(uuid.uuid4()) for _ in range(2)]
+    db.session.execute(Amenity.__table__.insert(), [
+        {'id': amenity_id, 'name': f'Amenity {i}', 'created_at': now, 'updated_at': now}
+        for i, amenity_id in enumerate(amenity_ids)
+    ])
+    for start in range(0, n_places, BATCH):
+        places, links = [], []
+        for i in range(start, min(start + BATCH, n_places)):
+            place_id = str(uuid.uuid4())
+            places.append({'id': place_id, 'title': f'Place {i}', 'description': '',
+                           'price': 100.0, 'latitude': 45.0, 'longitude': 5.0,
+                           'owner_id': owner_id, 'created_at': now, 'updated_at': now})
+            links.extend({'place_id': place_id, 'amenity_id': amenity_id}
+                         for amenity_id in amenity_ids)
+        db.session.execute(Place.__table__.insert(), places)
+        db.session.execute(place_amenity.insert(), links)
+    db.session.commit()
+    return owner_id
+
+
+def run(n_places):
+    app, path = make_app()
+    try:
+        with app.app_context():
+            owner_id = seed(n_places)
+            token = create_access_token(identity=owner_id, additional_claims={'is_admin': True})
+            db.session.remove()
+        client = app.test_client()
+
+        tracemalloc.start()
+        with timer() as t:
+            response = client.get('/api/v1/places/export',
+                                  headers={'Authorization': f'Bearer {token}'},
+                                  buffered=False)
+            assert response.status_code == 200
+            lines = sum(chunk.count(b'\n') for chunk in response.response)
+            response.close()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert lines == n_places, f"exported {lines} of {n_places} places"
+        return t['elapsed'], peak
+    finally:
+        os.unlink(path)
+
+
+def main(small, large):
+    print("=" * 60)
+    print(f"Streaming NDJSON export: {small:,} vs {large:,} places")
+    print("=" * 60)
+    peaks = {}
+    for n_places in (small, large):
+        elapsed, peak = run(n_places)
+        peaks[n_places] = peak
+        print(f"  {n_places:>9,} places: {elapsed:6.2f} s  "
+              f"{n_places / elapsed:9,.0f} rows/s  peak {peak / 2**20:6.1f} MiB")
+    growth = peaks[large] / peaks[small]
+    assert growth < 1.5, f"peak memory grew {growth:.1f}x with {large // small}x the rows"
+    print(f"✅ Peak memory stays flat ({growth:.2f}x for {large // small}x the rows)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50000)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Load test: 200 concurrent logins with each password hashing executor.
+
+All logins start at once from separate threads. While they run, one more
+thread keeps calling the cheap GET /api/v1/amenities/ to show how much a
+login storm slows down unrelated requests. The script reports login and
+probe p50/p99 for inline hashing, the thread pool and the process pool.
+
+Usage:
+    python benchmarks/bench_login_storm.py [concurrency] [bcrypt_rounds]
+"""
+import os
+import sys
+import threading
+
+from _common import BenchConfig, make_app, percentile, timer
+
+from hbnb.app import db
+from hbnb.app.extensions import password_hasher
+from hbnb.app.services import facade
+
+MODES = (None, 'thread', 'process')
+
+
+def run(mode, concurrency, rounds):
+    class Config(BenchConfig):
+        BCRYPT_LOG_ROUNDS = rounds
+        PASSWORD_HASH_EXECUTOR = mode
+
+    app, path = make_app(config=Config)
+    try:
+        with app.app_context():
+            facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                                'email': 'ann@bench.io', 'password': 'secret'})
+            db.session.remove()
+
+        start = threading.Barrier(concurrency + 1)
+        logins, probes, done = [], [], threading.Event()
+
+        def login():
+            client = app.test_client()
+            start.wait()
+            with timer() as t:
+                response = client.post('/api/v1/users/login',
+                                       json={'email': 'ann@bench.io', 'password': 'secret'})
+            assert response.status_code == 200, response.json
+            logins.append(t['elapsed'] * 1000)
+
+        def probe():
+            client = app.test_client()
+            start.wait()
+            while not done.is_set():
+                with timer() as t:
+                    client.get('/api/v1/amenities/')
+                probes.append(t['elapsed'] * 1000)
+
+        threads = [threading.Thread(target=login) for _ in range(concurrency)]
+        prober = threading.Thread(target=probe)
+        for thread in threads:
+            thread.start()
+        prober.start()
+        with timer() as wall:
+            for thread in threads:
+                thread.join()
+        done.set()
+        prober.join()
+        stats = password_hasher.stats()
+        password_hasher.shutdown()
+        return wall['elapsed'], logins, probes, stats
+    finally:
+        os.unlink(path)
+
+
+def main(concurrency, rounds):
+    print("=" * 72)
+    print(f"{concurrency} concurrent logins, bcrypt cost {rounds}, {os.cpu_count()} CPU(s)")
+    print("=" * 72)
+    print(f"  {'executor':<10} {'wall s':>7} {'login p50':>10} {'login p99':>10} "
+          f"{'probe p50':>10} {'probe p99':>10} {'peak queue':>11}")
+    for mode in MODES:
+        wall, logins, probes, stats = run(mode, concurrency, rounds)
+        print(f"  {mode or 'inline':<10} {wall:7.2f} {percentile(logins, 50):8.1f}ms "
+              f"{percentile(logins, 99):8.1f}ms {percentile(probes, 50):8.1f}ms "
+              f"{percentile(probes, 99):8.1f}ms {stats['peak_queue_depth']:>11}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SQL statements per GET /api/v1/places/ request.
+
+Seeds 10, 1,000 and 10,000 places (each with amenities and a review) and
+asserts that listing them always issues the same number of statements.
+
+Usage:
+    python benchmarks/bench_place_list_queries.py [size ...]
+"""
+import os
+import sys
+import uuid
+from datetime import datetime
+
+from _common import count_statements, make_app, timer
+
+from hbnb.app import db
+from hbnb.app.models import place_amenity
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+
+
+def seed(n_places):
+    """Insert n_places places, each with two amenities and one review"""
+    now = datetime.utcnow()
+    owner_id, guest_id = str(uuid.uuid4()), str(uuid.uuid4())
+    db.session.execute(User.__table__.insert(), [
+        {'id': owner_id, 'first_name': 'Owner', 'last_name': 'Bench',
+         'email': 'owner@bench.io', 'password': 'x', 'is_admin': False,
+         'created_at': now, 'updated_at': now},
+        {'id': guest_id, 'first_name': 'Guest', 'last_name': 'Bench',
+         'email': 'guest@bench.io', 'password': 'x', 'is_admin': False,
+         'created_at': now, 'updated_at': now},
+    ])
+    amenity_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    db.session.execute(Amenity.__table__.insert(), [
+        {'id': a_id, 'name': f'Amenity {i}', 'created_at': now, 'updated_at': now}
+        for i, a_id in enumerate(amenity_ids)
+    ])
+    places, links, reviews = [], [], []
+    for i in range(n_places):
+        place_id = str(uuid.uuid4())
+        places.append({'id': place_id, 'title': f'Place {i}', 'description': '',
+                       'price': 10.0 + i, 'latitude': 1.0, 'longitude': 2.0,
+                       'owner_id': owner_id, 'created_at': now, 'updated_at': now})
+        links.extend({'place_id': place_id, 'amenity_id': a_id} for a_id in amenity_ids)
+        reviews.append({'id': str(uuid.uuid4()), 'text': 'Nice', 'rating': 4,
+                        'user_id': guest_id, 'place_id': place_id,
+                        'created_at': now, 'updated_at': now})
+    db.session.execute(Place.__table__.insert(), places)
+    db.session.execute(place_amenity.insert(), links)
+    db.session.execute(Review.__table__.insert(), reviews)
+    db.session.commit()
+
+
+def run(size):
+    app, path = make_app()
+    try:
+        with app.app_context():
+            seed(size)
+            db.session.remove()
+            client = app.test_client()
+            with count_statements() as statements, timer() as t:
+                response = client.get('/api/v1/places/')
+            assert response.status_code == 200
+            assert len(response.json) == size
+            return len(statements), t['elapsed']
+    finally:
+        os.unlink(path)
+
+
+def main(sizes):
+    print("=" * 60)
+    print("GET /api/v1/places/ - SQL statements per request")
+    print("=" * 60)
+    counts = []
+    for size in sizes:
+        statements, elapsed = run(size)
+        counts.append(statements)
+        print(f"  {size:>7} places: {statements:>3} statements, {elapsed * 1000:8.1f} ms")
+    assert len(set(counts)) == 1, f"statement count grows with size: {counts}"
+    print(f"✅ Statement count is constant ({counts[0]})")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10, 1000, 10000])
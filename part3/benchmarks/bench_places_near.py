@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: radius lookups with the geohash index.
+
+Seeds N synthetic places (default 1,000,000) spread over a 20x20 degree
+region and times PlaceRepository.get_near() for random 5 km searches.
+
+Usage:
+    python benchmarks/bench_places_near.py [n_places] [n_queries]
+"""
+import os
+import random
+import sys
+import uuid
+from datetime import datetime
+
+from _common import make_app, percentile, timer
+
+from hbnb.app import db
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+from hbnb.app.services import facade
+from hbnb.app.utils.geo import encode_geohash
+
+REGION = (35.0, 55.0, -5.0, 15.0)  # min_lat, max_lat, min_lon, max_lon
+BATCH = 50000
+
+
+def seed(n_places, rng):
+    now = datetime.utcnow()
+    owner_id = str(uuid.uuid4())
+    db.session.execute(User.__table__.insert(), [{
+        'id': owner_id, 'first_name': 'Owner', 'last_name': 'Bench',
+        'email': 'owner@bench.io', 'password': 'x', 'is_admin': False,
+        'created_at': now, 'updated_at': now,
+    }])
+    min_lat, max_lat, min_lon, max_lon = REGION
+    for start in range(0, n_places, BATCH):
+        rows = []
+        for i in range(start, min(start + BATCH, n_places)):
+            lat = rng.uniform(min_lat, max_lat)
+            lon = rng.uniform(min_lon, max_lon)
+            rows.append({'id': str(uuid.uuid4()), 'title': f'Place {i}',
+                         'description': '', 'price': 100.0, 'latitude': lat,
+                         'longitude': lon, 'geohash': encode_geohash(lat, lon),
+                         'owner_id': owner_id, 'created_at': now, 'updated_at': now})
+        db.session.execute(Place.__table__.insert(), rows)
+    db.session.commit()
+
+
+def main(n_places, n_queries, radius_km=5.0, limit=20):
+    rng = random.Random(42)
+    app, path = make_app()
+    try:
+        with app.app_context():
+            print("=" * 60)
+            print(f"Radius search: {n_places:,} places, {radius_km} km, limit {limit}")
+            print("=" * 60)
+            with timer() as t:
+                seed(n_places, rng)
+            print(f"  seeded in {t['elapsed']:.1f} s")
+
+            min_lat, max_lat, min_lon, max_lon = REGION
+            samples, found = [], 0
+            for _ in range(n_queries):
+                lat = rng.uniform(min_lat, max_lat)
+                lon = rng.uniform(min_lon, max_lon)
+                db.session.expunge_all()
+                with timer() as t:
+                    results = facade.get_places_near(lat, lon, radius_km, limit)
+                samples.append(t['elapsed'] * 1000)
+                found += len(results)
+
+            p50, p99 = percentile(samples, 50), percentile(samples, 99)
+            print(f"  {n_queries} lookups, {found / n_queries:.1f} results on average")
+            print(f"  p50 {p50:.2f} ms   p99 {p99:.2f} ms   max {max(samples):.2f} ms")
+            assert p50 < 10, f"median lookup {p50:.2f} ms exceeds 10 ms"
+            print("✅ Median lookup under 10 ms")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else 1_000_000, args[1] if len(args) > 1 else 200)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serializing 10k places with nested owner, amenities and reviews.
+
+Compares the hand-built dicts the handlers used to return (one lambda per
+field, isoformat() on every timestamp, stdlib json) with the compiled
+serializers of hbnb.app.serializers, encoded with the fast encoder and
+with the stdlib fallback. Objects are built in memory, so only
+serialization and encoding are measured.
+
+Usage:
+    python benchmarks/bench_serialization.py [places]
+"""
+import json
+import sys
+from datetime import datetime, timedelta
+
+from _common import percentile, timer
+
+from hbnb.app import serializers
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+from hbnb.app.serializers import PLACE, dumps
+
+RUNS = 5
+
+# The place list serializer as it was before the serialization layer
+OLD_PLACE_FIELDS = {
+    'id': lambda place: place.id,
+    'title': lambda place: place.title,
+    'description': lambda place: place.description,
+    'price': lambda place: place.price,
+    'latitude': lambda place: place.latitude,
+    'longitude': lambda place: place.longitude,
+    'owner_id': lambda place: place.owner_id,
+    'owner': lambda place: {
+        'id': place.owner.id,
+        'first_name': place.owner.first_name,
+        'last_name': place.owner.last_name,
+        'email': place.owner.email
+    },
+    'amenities': lambda place: [
+        {'id': amenity.id, 'name': amenity.name}
+        for amenity in place.amenities
+    ],
+    'reviews': lambda place: [
+        {
+            'id': review.id,
+            'text': review.text,
+            'rating': review.rating,
+            'user_id': review.user_id
+        }
+        for review in place.reviews
+    ],
+    'review_count': lambda place: place.review_count,
+    'average_rating': lambda place: place.average_rating,
+    'rating_histogram': lambda place: place.rating_histogram,
+    'created_at': lambda place: place.created_at.isoformat(),
+    'updated_at': lambda place: place.updated_at.isoformat(),
+}
+
+
+def build(n):
+    now = datetime(2024, 1, 1)
+    owners = []
+    for i in range(max(1, n // 100)):
+        owner = User(first_name="Owner", last_name=str(i), email=f"owner{i}@bench.io")
+        owner.id = f"user-{i}"
+        owners.append(owner)
+    amenities = []
+    for i in range(10):
+        amenity = Amenity(name=f"Amenity {i}")
+        amenity.id = f"amenity-{i}"
+        amenities.append(amenity)
+    places = []
+    for i in range(n):
+        owner = owners[i % len(owners)]
+        place = Place(title=f"Place {i}", description="A nice place", price=50 + i % 100,
+                      latitude=1.0, longitude=2.0, owner_id=owner.id)
+        place.id = f"place-{i}"
+        place.created_at = place.updated_at = now + timedelta(seconds=i)
+        place.owner = owner
+        place.amenities = amenities[i % 7:i % 7 + 3]
+        reviews = []
+        for j in range(2):
+            review = Review(text="Lovely stay", rating=4 + j, user_id=owners[0].id,
+                            place_id=place.id)
+            review.id = f"review-{i}-{j}"
+            reviews.append(review)
+        place.reviews = reviews
+        place.review_count, place.rating_sum, place.rating_avg = 2, 9, 4.5
+        place.rating_count_4 = place.rating_count_5 = 1
+        places.append(place)
+    return places
+
+
+def measure(label, func, places):
+    samples = []
+    for _ in range(RUNS):
+        with timer() as t:
+            body = func(places)
+        samples.append(t['elapsed'] * 1000)
+    print(f"  {label:<34} {percentile(samples, 50):9.1f} {min(samples):9.1f} {len(body):>10,}")
+    return percentile(samples, 50), body
+
+
+def old(places):
+    return json.dumps([{name: get(place) for name, get in OLD_PLACE_FIELDS.items()}
+                       for place in places]).encode('utf-8')
+
+
+def new(places):
+    return dumps(PLACE.many(places))
+
+
+def new_stdlib(places):
+    fast, serializers.orjson = serializers.orjson, None
+    try:
+        return dumps(PLACE.many(places))
+    finally:
+        serializers.orjson = fast
+
+
+def main(n):
+    places = build(n)
+    print("=" * 68)
+    print(f"Serializing {n:,} places (owner, 3 amenities, 2 reviews each)")
+    print("=" * 68)
+    print(f"  {'':<34} {'p50 ms':>9} {'min ms':>9} {'bytes':>10}")
+    before, old_body = measure("hand-built dicts + json", old, places)
+    after, new_body = measure("compiled serializers + fast encoder", new, places)
+    measure("compiled serializers + json", new_stdlib, places)
+    assert json.loads(old_body) == json.loads(new_body), "payloads differ"
+    encoder = 'orjson' if serializers.orjson else 'json (orjson not installed)'
+    print(f"✅ Same payload, {before / after:.1f}x faster with {encoder}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
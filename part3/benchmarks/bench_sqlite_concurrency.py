@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Load test: concurrent readers and writers on one SQLite file.
+
+Reader threads keep calling GET /api/v1/amenities/<id> while writer
+threads keep renaming amenities through the facade, for a fixed
+duration. The entity and response caches are disabled so every request
+reaches the database. The script reports reads/s, writes/s, p50/p99
+latencies and "database is locked" failures for the default settings
+and for the SQLite production profile (WAL, synchronous=NORMAL,
+busy_timeout and a sized pool).
+
+Usage:
+    python benchmarks/bench_sqlite_concurrency.py [readers] [writers] [seconds]
+"""
+import os
+import sys
+import threading
+import time
+
+from _common import BenchConfig, make_app, percentile, timer
+from sqlalchemy.exc import OperationalError
+
+from config import SQLiteProductionConfig
+from hbnb.app import db
+from hbnb.app.services import facade
+
+AMENITIES = 200
+
+
+class DefaultConfig(BenchConfig):
+    ENTITY_CACHE_BACKEND = None
+    RESPONSE_CACHE_BACKEND = None
+
+
+class TunedConfig(DefaultConfig):
+    SQLITE_PRAGMAS = SQLiteProductionConfig.SQLITE_PRAGMAS
+    SQLALCHEMY_ENGINE_OPTIONS = SQLiteProductionConfig.SQLALCHEMY_ENGINE_OPTIONS
+
+
+def run(config, readers, writers, seconds):
+    app, path = make_app(config=config)
+    try:
+        with app.app_context():
+            ids = [facade.create_amenity({'name': f'Amenity {i}'}).id
+                   for i in range(AMENITIES)]
+            db.session.remove()
+
+        reads, writes, locked = [], [], []
+        start = threading.Barrier(readers + writers)
+        deadline = []
+
+        def reader(n):
+            client = app.test_client()
+            start.wait()
+            i = n
+            while time.perf_counter() < deadline[0]:
+                with timer() as t:
+                    response = client.get(f'/api/v1/amenities/{ids[i % AMENITIES]}')
+                if response.status_code == 200:
+                    reads.append(t['elapsed'] * 1000)
+                else:
+                    locked.append(response.status_code)
+                i += 7
+
+        def writer(n):
+            start.wait()
+            i = n
+            while time.perf_counter() < deadline[0]:
+                with app.app_context(), timer() as t:
+                    try:
+                        facade.update_amenity(ids[i % AMENITIES], {'name': f'Amenity {i}'})
+                    except OperationalError as e:
+                        if 'locked' not in str(e):
+                            raise
+                        locked.append('write')
+                        continue
+                    finally:
+                        db.session.remove()
+                writes.append(t['elapsed'] * 1000)
+                i += 13
+
+        deadline.append(time.perf_counter() + seconds)
+        threads = ([threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+                   + [threading.Thread(target=writer, args=(n,)) for n in range(writers)])
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with app.app_context():
+            db.engine.dispose()
+        return reads, writes, locked
+    finally:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+
+def main():
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    writers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 5
+    print(f"{readers} readers, {writers} writers, {seconds:g}s each")
+    print(f"{'profile':>10} {'reads/s':>9} {'read p50':>9} {'read p99':>9} "
+          f"{'writes/s':>9} {'write p50':>10} {'write p99':>10} {'locked':>7}")
+    for name, config in (('default', DefaultConfig), ('tuned', TunedConfig)):
+        reads, writes, locked = run(config, readers, writers, seconds)
+        print(f"{name:>10} {len(reads) / seconds:>9.0f} "
+              f"{percentile(reads, 50):>8.2f}ms {percentile(reads, 99):>8.2f}ms "
+              f"{len(writes) / seconds:>9.0f} "
+              f"{percentile(writes, 50):>9.2f}ms {percentile(writes, 99):>9.2f}ms "
+              f"{len(locked):>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Startup: import, create_app() and the first requests of a fresh worker.
+
+Each run is a new interpreter (bytecode caching on, as in production)
+that imports hbnb.app, calls create_app() with the default bcrypt
+settings, then sends GET /api/v1/amenities/, a validated
+POST /api/v1/users/ and GET /swagger.json. The 'eager' mode restores the
+previous behaviour in the child: bcrypt calibrated inside create_app(),
+the full Swagger document built by the first validated request and an
+admin account hashed at boot (as run.py used to). The script reports the
+median of each phase and the time from create_app() to the first
+response (the import is the same in both modes and varies most).
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from _common import make_app
+
+PART3 = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import config
+from hbnb.app import create_app
+t1 = time.perf_counter()
+
+class Config(config.Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///' + sys.argv[1]
+
+eager = sys.argv[2] == 'eager'
+if eager:
+    from flask_restx import Api
+    from hbnb.app.api.v1.docs import LazyDocApi
+    LazyDocApi.refresolver = Api.refresolver
+app = create_app(Config)
+if eager:
+    from hbnb.app.extensions import password_hasher
+    from hbnb.app.services import facade
+    password_hasher.rounds
+    with app.app_context():
+        if facade.get_user_by_email('admin@hbnb.com') is None:
+            facade.create_user({'first_name': 'Admin', 'last_name': 'User',
+                                'email': 'admin@hbnb.com', 'password': 'admin123',
+                                'is_admin': True})
+t2 = time.perf_counter()
+client = app.test_client()
+client.get('/api/v1/amenities/')
+t3 = time.perf_counter()
+# Invalid payload: validation runs, no user (and no bcrypt hash) is created
+client.post('/api/v1/users/', json={'first_name': 'Ann'})
+t4 = time.perf_counter()
+client.get('/swagger.json')
+t5 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'create_app': t2 - t1, 'first GET': t3 - t2,
+                  'first POST': t4 - t3, 'swagger.json': t5 - t4,
+                  'app to 1st response': t3 - t1, 'total': t5 - t0}))
+'''
+
+PHASES = ('import', 'create_app', 'first GET', 'first POST', 'swagger.json',
+          'app to 1st response', 'total')
+
+
+def run(db_path, mode):
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    out = subprocess.run([sys.executable, '-c', CHILD, db_path, mode], cwd=PART3,
+                         env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    _, db_path = make_app()
+    try:
+        run(db_path, 'lazy')  # warm the bytecode cache
+        print(f"median of {runs} fresh interpreters (ms)")
+        print(f"{'mode':>6} " + ' '.join(f'{phase:>19}' for phase in PHASES))
+        for mode in ('eager', 'lazy'):
+            results = [run(db_path, mode) for _ in range(runs)]
+            print(f"{mode:>6} " + ' '.join(
+                f"{statistics.median(r[phase] for r in results) * 1000:>19.1f}"
+                for phase in PHASES))
+    finally:
+        os.unlink(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Per-request cost of the token blocklist check.
+
+Fills revoked_tokens with N revocations, loads them into the in-memory
+blocklist and times the check Flask-JWT-Extended makes on every protected
+request: a token that was not revoked (the common case, answered by the
+bloom filter alone) and one that was (confirmed in the exact set). The
+naive alternative, one primary-key SELECT per request, is timed next to
+it. Also reports the memory of the filter.
+
+Usage:
+    python benchmarks/bench_token_blocklist.py [max_revoked]
+"""
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+from _common import make_app, percentile, timer
+
+from hbnb.app import db
+from hbnb.app.extensions import token_blocklist
+from hbnb.app.models.revoked_token import RevokedToken
+
+BATCH = 5000
+CHECKS = 20000
+QUERIES = 2000
+
+
+def grow(start, stop, expires_at, now):
+    jtis = []
+    for first in range(start, stop, BATCH):
+        rows = [{'jti': str(uuid.uuid4()), 'expires_at': expires_at, 'revoked_at': now}
+                for _ in range(first, min(first + BATCH, stop))]
+        db.session.execute(RevokedToken.__table__.insert(), rows)
+        jtis.extend(row['jti'] for row in rows)
+    db.session.commit()
+    return jtis
+
+
+def time_per_call(func, keys):
+    """Median and p99 of per-call time in microseconds (calls batched by 100)"""
+    samples = []
+    for first in range(0, len(keys), 100):
+        chunk = keys[first:first + 100]
+        with timer() as t:
+            for key in chunk:
+                func(key)
+        samples.append(t['elapsed'] / len(chunk) * 1e6)
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def main(max_revoked):
+    sizes = [n for n in (1000, 10000, 100000, 1000000) if n <= max_revoked] or [max_revoked]
+    app, path = make_app()
+    try:
+        with app.app_context():
+            now = datetime.utcnow()
+            expires_at = now + timedelta(hours=1)
+            print("=" * 72)
+            print("Token blocklist check per request")
+            print("=" * 72)
+            print(f"  {'revoked':>9}  {'miss us':>8}  {'hit us':>8}  {'SELECT us':>9}  "
+                  f"{'filter KiB':>10}  {'false +':>7}")
+            revoked, seeded = [], 0
+            for size in sizes:
+                revoked += grow(seeded, size, expires_at, now)
+                seeded = size
+                token_blocklist.init_app(app)
+                token_blocklist.sync()
+
+                fresh = [str(uuid.uuid4()) for _ in range(CHECKS)]
+                hits = revoked[:: max(1, len(revoked) // CHECKS)][:CHECKS]
+                miss, _ = time_per_call(token_blocklist.is_revoked, fresh)
+                hit, _ = time_per_call(token_blocklist.is_revoked, hits)
+                assert all(token_blocklist.is_revoked(jti) for jti in hits[:100])
+                false_positives = token_blocklist.false_positives
+
+                select, _ = time_per_call(
+                    lambda jti: db.session.get(RevokedToken, jti), fresh[:QUERIES])
+                db.session.remove()
+
+                stats = token_blocklist.stats()
+                print(f"  {size:>9,}  {miss:8.2f}  {hit:8.2f}  {select:9.1f}  "
+                      f"{stats['filter_bytes'] / 1024:10.0f}  "
+                      f"{false_positives / CHECKS:7.2%}")
+            print("✅ Revoked tokens are checked without a query")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
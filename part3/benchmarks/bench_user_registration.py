@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: POST /api/v1/users/ latency as the users table grows.
+
+Registration used to call get_all_users() to find out whether the first
+(admin-free) sign-up was still open. It now runs an EXISTS probe, cached
+once a user has been seen. This script grows the table to 1,000,000 users
+and reports registration latency with the bootstrap cache cleared before
+every request (the worst case), next to the cost of the old full load.
+
+bcrypt is set to its minimum cost so hashing does not hide the lookup.
+
+Usage:
+    python benchmarks/bench_user_registration.py [max_users]
+"""
+import os
+import sys
+import uuid
+from datetime import datetime
+
+from _common import BenchConfig, make_app, percentile, timer
+
+from flask_jwt_extended import create_access_token
+
+from hbnb.app import db
+from hbnb.app.models.user import User
+from hbnb.app.services import facade
+
+BATCH = 50000
+REQUESTS = 50
+OLD_CHECK_LIMIT = 100000  # loading more users than this only proves the point slower
+
+
+class RegistrationConfig(BenchConfig):
+    BCRYPT_LOG_ROUNDS = 4
+
+
+def grow(start, stop, now):
+    for first in range(start, stop, BATCH):
+        db.session.execute(User.__table__.insert(), [{
+            'id': str(uuid.uuid4()), 'first_name': 'User', 'last_name': str(i),
+            'email': f'user{i}@bench.io', 'password': 'x', 'is_admin': False,
+            'created_at': now, 'updated_at': now,
+        } for i in range(first, min(first + BATCH, stop))])
+    db.session.commit()
+
+
+def main(max_users):
+    sizes = [n for n in (1000, 10000, 100000, 1000000) if n <= max_users] or [max_users]
+    app, path = make_app(config=RegistrationConfig)
+    try:
+        with app.app_context():
+            admin = facade.create_user({'first_name': 'Admin', 'last_name': 'Bench',
+                                        'email': 'admin@bench.io', 'password': 'x',
+                                        'is_admin': True})
+            token = create_access_token(identity=admin.id, additional_claims={'is_admin': True})
+            headers = {'Authorization': f'Bearer {token}'}
+            client = app.test_client()
+            now = datetime.utcnow()
+
+            print("=" * 60)
+            print("User registration latency vs. table size")
+            print("=" * 60)
+            print(f"  {'users':>9}  {'p50 ms':>8}  {'p99 ms':>8}  {'old check ms':>12}")
+            medians, seeded, sent = [], 1, 0
+            for size in sizes:
+                grow(seeded, size, now)
+                seeded = size
+                db.session.remove()
+
+                old = '-'
+                if size <= OLD_CHECK_LIMIT:
+                    with timer() as t:
+                        facade.get_all_users()
+                    old = f"{t['elapsed'] * 1000:.1f}"
+                    db.session.remove()
+
+                samples = []
+                for _ in range(REQUESTS):
+                    app.extensions.pop('hbnb_bootstrap', None)
+                    sent += 1
+                    payload = {'first_name': 'New', 'last_name': 'User',
+                               'email': f'new{sent}@bench.io', 'password': 'secret'}
+                    with timer() as t:
+                        response = client.post('/api/v1/users/', json=payload, headers=headers)
+                    assert response.status_code == 201, response.json
+                    samples.append(t['elapsed'] * 1000)
+                p50 = percentile(samples, 50)
+                medians.append(p50)
+                print(f"  {size:>9,}  {p50:8.2f}  {percentile(samples, 99):8.2f}  {old:>12}")
+
+            growth = medians[-1] / medians[0]
+            assert growth < 2, f"median latency grew {growth:.1f}x"
+            print(f"✅ Registration latency is flat ({growth:.2f}x from "
+                  f"{sizes[0]:,} to {sizes[-1]:,} users)")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
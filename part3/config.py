@@ -6,6 +6,66 @@ class Config:
     JWT_SECRET_KEY = SECRET_KEY
     DEBUG = False
     TESTING = False
+    # Collection endpoints: page size when ?limit= is omitted (None = no limit)
+    PAGINATION_DEFAULT_LIMIT = None
+    PAGINATION_MAX_LIMIT = 1000
+    # Bulk create endpoints (POST .../batch): maximum items per request
+    BATCH_MAX_ITEMS = 5000
+    # NDJSON export: rows fetched per round trip and per streamed chunk
+    EXPORT_BATCH_SIZE = 1000
+    # GET /places/near: largest accepted radius_km
+    PLACES_NEAR_MAX_RADIUS_KM = 1000
+    # Bind keys of SQLALCHEMY_BINDS holding read-only replicas of the primary;
+    # repository lookups are routed to them (see persistence/routing.py)
+    READ_REPLICA_BINDS = []
+    # Read-through entity cache for repository get()/get_by_attribute():
+    # 'memory' (per-process LRU), 'redis' (shared, needs ENTITY_CACHE_URL) or None
+    ENTITY_CACHE_BACKEND = 'memory'
+    ENTITY_CACHE_TTL = 300
+    ENTITY_CACHE_MAX_ENTRIES = 10000
+    ENTITY_CACHE_URL = os.environ.get('ENTITY_CACHE_URL')
+    # Full-response cache for GET /places/ and /amenities/, invalidated by
+    # facade writes: 'memory' (per-process LRU), 'redis' or None to disable.
+    # Clients revalidate with the ETag instead of trusting a max-age.
+    RESPONSE_CACHE_BACKEND = 'memory'
+    RESPONSE_CACHE_TTL = 60
+    RESPONSE_CACHE_MAX_ENTRIES = 1000
+    RESPONSE_CACHE_URL = os.environ.get('RESPONSE_CACHE_URL')
+    RESPONSE_CACHE_CONTROL = 'public, no-cache'
+    # bcrypt runs on a bounded pool: 'thread', 'process' or None (inline);
+    # PASSWORD_HASH_WORKERS defaults to the number of CPUs
+    PASSWORD_HASH_EXECUTOR = 'thread'
+    PASSWORD_HASH_WORKERS = None
+    # bcrypt cost: calibrated in the background at startup so one hash takes
+    # about BCRYPT_TARGET_MS on this machine (never below BCRYPT_MIN_ROUNDS).
+    # Set BCRYPT_TARGET_MS = None to use the fixed BCRYPT_LOG_ROUNDS instead.
+    # Logins re-hash passwords stored with a lower cost.
+    BCRYPT_TARGET_MS = 250
+    BCRYPT_MIN_ROUNDS = 10
+    BCRYPT_LOG_ROUNDS = 12
+    # Login throttling: token buckets per IP and per email, checked before
+    # any lookup or bcrypt work ('memory', 'redis' or None to disable)
+    LOGIN_THROTTLE_BACKEND = 'memory'
+    LOGIN_THROTTLE_URL = os.environ.get('LOGIN_THROTTLE_URL')
+    LOGIN_IP_BURST = 20
+    LOGIN_IP_PER_MINUTE = 10
+    LOGIN_EMAIL_BURST = 5
+    LOGIN_EMAIL_PER_MINUTE = 1
+    # Seconds an email that matched no user is answered without a query
+    LOGIN_UNKNOWN_EMAIL_TTL = 30
+    # Tokens are authorized from their claims while their 'ver' stamp matches
+    # the user's auth_version, cached per process for AUTH_VERSION_TTL seconds
+    AUTH_VERSION_TTL = 60
+    AUTH_VERSION_MAX_ENTRIES = 100000
+    # Revoked tokens (logout): bloom filter sized for TOKEN_BLOCKLIST_CAPACITY
+    # entries at TOKEN_BLOCKLIST_ERROR_RATE; each worker pulls revocations made
+    # elsewhere every TOKEN_BLOCKLIST_SYNC_INTERVAL seconds
+    TOKEN_BLOCKLIST_CAPACITY = 100000
+    TOKEN_BLOCKLIST_ERROR_RATE = 0.001
+    TOKEN_BLOCKLIST_SYNC_INTERVAL = 30
+    # Time each create_app() step and the first response; the report is
+    # logged and served under 'startup' by /api/v1/metrics
+    STARTUP_PROFILE = bool(os.environ.get('HBNB_STARTUP_PROFILE'))
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -17,10 +77,22 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     DEBUG = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    # Cheapest bcrypt cost: tests hash passwords constantly
+    BCRYPT_TARGET_MS = None
+    BCRYPT_LOG_ROUNDS = 4
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
 
 class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
+    # Read replicas: comma-separated URLs in DATABASE_REPLICA_URLS
+    SQLALCHEMY_BINDS = {
+        f'replica{i}': url.strip()
+        for i, url in enumerate(os.environ.get('DATABASE_REPLICA_URLS', '').split(','))
+        if url.strip()
+    }
+    READ_REPLICA_BINDS = list(SQLALCHEMY_BINDS)
     
     @classmethod
     def init_app(cls, app):
@@ -28,9 +100,35 @@ class ProductionConfig(Config):
         if not os.environ.get('SECRET_KEY'):
             raise ValueError("SECRET_KEY environment variable must be set in production")
 
+class SQLiteProductionConfig(ProductionConfig):
+    """Production on a single SQLite file, tuned for concurrent requests"""
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///production.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Applied to every new connection (see hbnb/app/persistence/sqlite.py)
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,            # ms a writer waits for the lock
+        'foreign_keys': True,
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64000,            # 64 MiB per connection
+        'temp_store': 'MEMORY',
+    }
+    # WAL lets every reader have its own connection while one writes; size
+    # the pool for the worker's threads, with a little overflow for bursts
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 8)),
+        'max_overflow': 4,
+        'pool_timeout': 10,
+        'pool_recycle': 3600,
+        # pysqlite's own busy wait, in seconds, for the initial PRAGMAs
+        'connect_args': {'timeout': 5},
+    }
+
 config = {
     'development': DevelopmentConfig,
     'testing': TestingConfig,
     'production': ProductionConfig,
+    'sqlite-production': SQLiteProductionConfig,
     'default': DevelopmentConfig
 }
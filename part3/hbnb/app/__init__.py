@@ -1,14 +1,37 @@
+import importlib
+
 from flask import Flask
-from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
-from hbnb.app.extensions import bcrypt, jwt
+from hbnb.app.extensions import (
+    bcrypt, jwt, login_throttle, password_hasher, token_blocklist
+)
+from hbnb.app.persistence.routing import RoutingSession
+
+# Objects stay loaded after COMMIT: a request serializes what it just wrote
+# without re-SELECTing it, and the session is discarded when the request ends.
+# RoutingSession sends lookups to READ_REPLICA_BINDS when they are configured.
+db = SQLAlchemy(session_options={'expire_on_commit': False, 'class_': RoutingSession})
+
 
-db = SQLAlchemy()
+# API namespaces: (module defining `api`, URL prefix)
+NAMESPACES = [
+    ('hbnb.app.api.v1.users', '/api/v1/users'),
+    ('hbnb.app.api.v1.amenities', '/api/v1/amenities'),
+    ('hbnb.app.api.v1.places', '/api/v1/places'),
+    ('hbnb.app.api.v1.reviews', '/api/v1/reviews'),
+    ('hbnb.app.api.v1.metrics', '/api/v1/metrics'),
+]
 
 
 def create_app(config_class="config.DevelopmentConfig"):
     """
     Application factory for creating Flask app instances.
+
+    Nothing here touches the database or hashes a password: the schema is
+    managed by `flask db upgrade`, the admin account by `flask
+    create-admin`, and the bcrypt cost is calibrated on a background
+    thread. Each step is timed when STARTUP_PROFILE is enabled (see
+    utils/startup.py).
     
     Args:
         config_class: Configuration class to use (default: DevelopmentConfig)
@@ -16,31 +39,69 @@ def create_app(config_class="config.DevelopmentConfig"):
     Returns:
         Flask application instance
     """
+    from hbnb.app.utils.startup import StartupProfile, init_startup_profile
+    profile = StartupProfile()
     app = Flask(__name__)
     app.config.from_object(config_class)
-    
+    profile.enabled = bool(app.config.get('STARTUP_PROFILE'))
+    step = profile.step
+
     # Initialize extensions
-    db.init_app(app)
-    bcrypt.init_app(app)
-    jwt.init_app(app)
-    
-    api = Api(
-        app,
-        version="1.0",
-        title="HBnB API",
-        description="HBnB Application API",
-        doc="/api/v1/",
-    )
+    with step('db'):
+        db.init_app(app)
+        from hbnb.app.persistence.sqlite import init_sqlite
+        init_sqlite(app, db)
+        from hbnb.app.persistence.routing import init_read_routing
+        init_read_routing(app, db)
+    with step('bcrypt'):
+        bcrypt.init_app(app)
+        password_hasher.init_app(app)
+    with step('jwt'):
+        jwt.init_app(app)
+        token_blocklist.init_app(app)
+    with step('login_throttle'):
+        login_throttle.init_app(app)
+
+    with step('entity_cache'):
+        from hbnb.app.persistence.cache import init_entity_cache
+        init_entity_cache(app)
+
+    with step('response_cache'):
+        from hbnb.app.utils.response_cache import init_response_cache
+        init_response_cache(app)
+
+    with step('facade'):
+        from hbnb.app.services import facade
+        facade.init_app(app)
+
+    with step('api'):
+        from hbnb.app.api.v1.docs import LazyDocApi
+        api = LazyDocApi(
+            app,
+            version="1.0",
+            title="HBnB API",
+            description="HBnB Application API",
+            doc="/api/v1/",
+        )
+        # Encode JSON responses with the fast encoder when it is installed
+        from hbnb.app.serializers import output_json
+        api.representations['application/json'] = output_json
 
     # Import and register namespaces
-    from hbnb.app.api.v1.users import api as users_ns
-    from hbnb.app.api.v1.amenities import api as amenities_ns
-    from hbnb.app.api.v1.places import api as places_ns
-    from hbnb.app.api.v1.reviews import api as reviews_ns
+    for module, path in NAMESPACES:
+        with step(f'import {module}'):
+            namespace = importlib.import_module(module).api
+        with step(f'register {path}'):
+            api.add_namespace(namespace, path=path)
+    with step('security'):
+        from hbnb.app.api.v1 import security
+        security.init_app(app, api)
 
-    api.add_namespace(users_ns, path='/api/v1/users')
-    api.add_namespace(amenities_ns, path='/api/v1/amenities')
-    api.add_namespace(places_ns, path='/api/v1/places')
-    api.add_namespace(reviews_ns, path='/api/v1/reviews')
+    # Register CLI commands (flask export-places, ...)
+    with step('cli'):
+        from hbnb.app.cli import register_commands
+        register_commands(app)
 
+    profile.finish()
+    init_startup_profile(app, profile)
     return app
@@ -1,18 +1,20 @@
 """Amenity API endpoints for HBnB application"""
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt
+from flask_jwt_extended import jwt_required
+from hbnb.app.serializers import AMENITY
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.api.v1.batch import batch_result_model, batch_status, read_batch
+from hbnb.app.api.v1.security import is_admin
+from hbnb.app.utils.response_cache import cached_response
+from hbnb.app.api.v1.conditional import collection_validators, not_modified, validators
+from hbnb.app.api.v1.pagination import (
+    COLLECTION_PARAMS, page_headers, parse_collection_args
+)
 
 api = Namespace('amenities', description='Amenity operations')
 
 facade = HBnBFacade()
 
-
-def is_admin():
-    """Helper function to check if the current user is an admin"""
-    claims = get_jwt()
-    return claims.get('is_admin', False)
-
 # Define the amenity model for input validation
 amenity_model = api.model('Amenity', {
     'name': fields.String(required=True, description='Amenity name', min_length=1, max_length=50)
@@ -26,25 +28,31 @@ amenity_response_model = api.model('AmenityResponse', {
     'updated_at': fields.String(description='Last update date')
 })
 
+amenity_batch_result_model = batch_result_model(api)
+
 
 @api.route('/')
 class AmenityList(Resource):
     """Handles operations on the amenity collection"""
 
-    @api.doc('list_amenities')
+    @api.doc('list_amenities', params=COLLECTION_PARAMS)
     @api.response(200, 'List of amenities retrieved successfully')
+    @api.response(304, 'Not modified since the ETag sent in If-None-Match')
+    @api.response(400, 'Invalid pagination or field parameters')
+    @cached_response('amenities')
     def get(self):
-        """Get list of all amenities"""
-        amenities = facade.get_all_amenities()
-        return [
-            {
-                'id': amenity.id,
-                'name': amenity.name,
-                'created_at': amenity.created_at.isoformat(),
-                'updated_at': amenity.updated_at.isoformat()
-            }
-            for amenity in amenities
-        ], 200
+        """Get list of amenities (supports limit, cursor and fields)"""
+        limit, cursor, fields = parse_collection_args(api, AMENITY)
+        # Version first: a write landing in between only costs a refetch
+        headers = collection_validators(facade.get_amenities_version())
+        cached = not_modified(headers)
+        if cached:
+            return cached
+        try:
+            amenities, next_cursor = facade.get_amenities_page(limit, cursor, fields)
+        except ValueError as e:
+            api.abort(400, str(e))
+        return AMENITY.many(amenities, fields), 200, {**headers, **page_headers(next_cursor)}
 
     @api.doc('create_amenity')
     @api.expect(amenity_model, validate=True)
@@ -68,16 +76,32 @@ class AmenityList(Resource):
 
         try:
             new_amenity = facade.create_amenity(amenity_data)
-            return {
-                'id': new_amenity.id,
-                'name': new_amenity.name,
-                'created_at': new_amenity.created_at.isoformat(),
-                'updated_at': new_amenity.updated_at.isoformat()
-            }, 201
+            return AMENITY(new_amenity), 201
         except ValueError as e:
             api.abort(400, str(e))
 
 
+@api.route('/batch')
+class AmenityBatch(Resource):
+    """Handles bulk creation of amenities"""
+
+    @api.doc('create_amenities_batch')
+    @api.expect([amenity_model], validate=True)
+    @api.response(201, 'All amenities created', [amenity_batch_result_model])
+    @api.response(207, 'Some amenities could not be created', [amenity_batch_result_model])
+    @api.response(400, 'Invalid input data')
+    @api.response(403, 'Admin privileges required')
+    @api.response(413, 'Batch too large')
+    @jwt_required()
+    def post(self):
+        """Create many amenities in one request (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+        amenities_data = read_batch(api)
+        results = facade.create_amenities_bulk(amenities_data)
+        return results, batch_status(results)
+
+
 @api.route('/<amenity_id>')
 @api.param('amenity_id', 'The amenity identifier')
 class AmenityResource(Resource):
@@ -85,6 +109,7 @@ class AmenityResource(Resource):
 
     @api.doc('get_amenity')
     @api.response(200, 'Amenity details retrieved successfully')
+    @api.response(304, 'Not modified (If-None-Match / If-Modified-Since)')
     @api.response(404, 'Amenity not found')
     def get(self, amenity_id):
         """Get amenity details by ID"""
@@ -92,12 +117,12 @@ class AmenityResource(Resource):
         if not amenity:
             api.abort(404, 'Amenity not found')
 
-        return {
-            'id': amenity.id,
-            'name': amenity.name,
-            'created_at': amenity.created_at.isoformat(),
-            'updated_at': amenity.updated_at.isoformat()
-        }, 200
+        headers = validators((amenity.id, amenity.updated_at), amenity.updated_at)
+        cached = not_modified(headers)
+        if cached:
+            return cached
+
+        return AMENITY(amenity), 200, headers
 
     @api.doc('update_amenity')
     @api.expect(amenity_model, validate=True)
@@ -129,11 +154,6 @@ class AmenityResource(Resource):
 
         try:
             updated_amenity = facade.update_amenity(amenity_id, amenity_data)
-            return {
-                'id': updated_amenity.id,
-                'name': updated_amenity.name,
-                'created_at': updated_amenity.created_at.isoformat(),
-                'updated_at': updated_amenity.updated_at.isoformat()
-            }, 200
+            return AMENITY(updated_amenity), 200
         except ValueError as e:
             api.abort(400, str(e))
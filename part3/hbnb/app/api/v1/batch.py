@@ -0,0 +1,37 @@
+"""
+Shared handling for the bulk create endpoints (POST .../batch).
+
+A batch is a JSON array of items with the same shape as the single-item
+POST body. The response lists one result per item, in order; the status
+is 201 when every item was created and 207 (Multi-Status) otherwise.
+"""
+from flask import current_app
+from flask_restx import fields
+
+
+def batch_result_model(api):
+    """Register and return the per-item result model on a namespace"""
+    return api.model('BatchResult', {
+        'index': fields.Integer(description='Position of the item in the request'),
+        'status': fields.String(description="'created' or 'failed'"),
+        'id': fields.String(description='ID of the created entity'),
+        'error': fields.String(description='Why the item was rejected'),
+    })
+
+
+def read_batch(api):
+    """Return the request's item list, aborting on an empty or oversized batch"""
+    items = api.payload
+    if not isinstance(items, list) or not items:
+        api.abort(400, 'Expected a non-empty JSON array')
+    max_items = current_app.config.get('BATCH_MAX_ITEMS', 5000)
+    if len(items) > max_items:
+        api.abort(413, f'A batch may contain at most {max_items} items')
+    return items
+
+
+def batch_status(results):
+    """HTTP status for a batch: 201 if everything was created, else 207"""
+    if all(result['status'] == 'created' for result in results):
+        return 201
+    return 207
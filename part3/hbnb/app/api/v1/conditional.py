@@ -0,0 +1,70 @@
+"""
+HTTP conditional requests (ETag / Last-Modified / 304) for read endpoints.
+
+An endpoint computes a cheap version of the representation it is about to
+send (the updated_at of the row, or aggregate versions for a collection),
+turns it into validators and answers 304 Not Modified when the client's
+If-None-Match or If-Modified-Since still matches, before loading or
+serializing anything else:
+
+    headers = validators((user.id, user.updated_at), user.updated_at)
+    cached = not_modified(headers)
+    if cached:
+        return cached
+    ...
+    return body, 200, headers
+
+If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+Last-Modified is only sent where a deletion also moves it; collection
+versions include a row count instead and are validated by ETag alone.
+"""
+import hashlib
+from datetime import timezone
+
+from flask import Response, request
+from werkzeug.http import http_date, parse_date
+
+
+def make_etag(version):
+    """Opaque (unquoted) entity tag for a version tuple"""
+    return hashlib.blake2b(repr(version).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def validators(version, last_modified=None):
+    """
+    Build the ETag (and Last-Modified) response headers.
+
+    Args:
+        version: Tuple that changes whenever the representation does
+        last_modified: Naive UTC datetime of the last change, if exact
+
+    Returns:
+        Dict of headers to send with the 200 or 304 response
+    """
+    headers = {'ETag': f'"{make_etag(version)}"'}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified.replace(tzinfo=timezone.utc))
+    return headers
+
+
+def collection_validators(version):
+    """ETag for a collection page: its aggregate version plus the query string"""
+    return validators((request.full_path, *version))
+
+
+def not_modified(headers):
+    """
+    Return a 304 response if the request's validators match headers.
+
+    Returns:
+        A body-less 304 Response carrying the validators, or None
+    """
+    if request.if_none_match:
+        matched = request.if_none_match.contains_weak(headers['ETag'].strip('"'))
+    elif request.if_modified_since and 'Last-Modified' in headers:
+        matched = parse_date(headers['Last-Modified']) <= request.if_modified_since
+    else:
+        matched = False
+    if matched:
+        return Response(status=304, headers=headers)
+    return None
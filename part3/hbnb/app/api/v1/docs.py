@@ -0,0 +1,26 @@
+"""
+Flask-RESTX Api whose Swagger specification is built on the first doc hit.
+
+Api.refresolver, used by every @api.expect(..., validate=True) endpoint,
+builds the complete Swagger document just to resolve the $refs between
+models, so the first validated request of a worker paid for the whole
+specification. LazyDocApi resolves them from the registered models
+alone; the specification is generated the first time /swagger.json is
+requested (and then cached by Flask-RESTX as before).
+"""
+from flask_restx import Api
+from referencing import Registry
+
+SCHEMA_ID = 'http://localhost/schema.json'
+
+
+class LazyDocApi(Api):
+    """Api validating payloads without generating the Swagger document"""
+
+    @property
+    def refresolver(self):
+        if not self._refresolver:
+            definitions = {name: model.__schema__ for name, model in self.models.items()}
+            self._refresolver = Registry().with_resource(
+                SCHEMA_ID, {'$id': SCHEMA_ID, 'definitions': definitions})
+        return self._refresolver
@@ -0,0 +1,22 @@
+"""Metrics API endpoint for HBnB application"""
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required
+from hbnb.app.api.v1.security import is_admin
+from hbnb.app.utils.metrics import collect_metrics
+
+api = Namespace('metrics', description='Runtime counters')
+
+
+@api.route('/')
+class Metrics(Resource):
+    """Exposes the counters of this worker process"""
+
+    @api.doc('get_metrics')
+    @api.response(200, 'Counters retrieved successfully')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def get(self):
+        """Get cache and throughput counters (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+        return collect_metrics(), 200
@@ -0,0 +1,68 @@
+"""
+Shared query-string handling for collection endpoints.
+
+Every list endpoint accepts:
+- limit:  page size (capped by PAGINATION_MAX_LIMIT)
+- cursor: opaque cursor taken from the previous page's X-Next-Cursor header
+- fields: comma-separated list of top-level fields to return
+
+The response body stays a plain JSON list; the next page is advertised in
+the X-Next-Cursor and Link headers.
+"""
+from urllib.parse import urlencode
+
+from flask import current_app, request
+
+COLLECTION_PARAMS = {
+    'limit': 'Maximum number of items to return',
+    'cursor': 'Opaque cursor from the X-Next-Cursor header of the previous page',
+    'fields': 'Comma-separated list of fields to include',
+}
+
+
+def parse_collection_args(api, allowed_fields):
+    """
+    Read limit, cursor and fields from the query string.
+
+    Args:
+        api: Namespace used to abort with 400 on invalid input
+        allowed_fields: Field names the endpoint knows how to serialize
+
+    Returns:
+        (limit, cursor, fields) where fields is None when not requested
+    """
+    max_limit = current_app.config.get('PAGINATION_MAX_LIMIT', 1000)
+    limit = request.args.get('limit', current_app.config.get('PAGINATION_DEFAULT_LIMIT'))
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            api.abort(400, 'limit must be an integer')
+        if limit < 1:
+            api.abort(400, 'limit must be a positive integer')
+        limit = min(limit, max_limit)
+
+    cursor = request.args.get('cursor') or None
+
+    fields = None
+    raw_fields = request.args.get('fields')
+    if raw_fields:
+        fields = [f.strip() for f in raw_fields.split(',') if f.strip()]
+        unknown = [f for f in fields if f not in allowed_fields]
+        if unknown:
+            api.abort(400, f"Unknown field(s): {', '.join(unknown)}")
+
+    return limit, cursor, fields
+
+
+def page_headers(next_cursor):
+    """Build the response headers advertising the next page, if any"""
+    if not next_cursor:
+        return {}
+    args = [(k, v) for k, v in request.args.items(multi=True) if k != 'cursor']
+    args.append(('cursor', next_cursor))
+    next_url = f"{request.base_url}?{urlencode(args)}"
+    return {
+        'X-Next-Cursor': next_cursor,
+        'Link': f'<{next_url}>; rel="next"',
+    }
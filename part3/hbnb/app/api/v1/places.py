@@ -1,18 +1,24 @@
 """Place API endpoints for HBnB application"""
+import math
+
+from flask import Response, current_app, request, stream_with_context
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import jwt_required
+from hbnb.app.serializers import PLACE, PLACE_WRITE
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.services.export import gzip_chunks, iter_ndjson
+from hbnb.app.api.v1.batch import batch_result_model, batch_status, read_batch
+from hbnb.app.api.v1.security import get_current_user_id, is_admin
+from hbnb.app.utils.response_cache import cached_response
+from hbnb.app.api.v1.conditional import collection_validators, not_modified, validators
+from hbnb.app.api.v1.pagination import (
+    COLLECTION_PARAMS, page_headers, parse_collection_args
+)
 
 api = Namespace('places', description='Place operations')
 
 facade = HBnBFacade()
 
-
-def is_admin():
-    """Helper function to check if the current user is an admin"""
-    claims = get_jwt()
-    return claims.get('is_admin', False)
-
 # Define the place model for input validation
 place_model = api.model('Place', {
     'title': fields.String(required=True, description='Place title', min_length=1, max_length=100),
@@ -43,53 +49,87 @@ place_response_model = api.model('PlaceResponse', {
         'id': fields.String(description='Amenity ID'),
         'name': fields.String(description='Amenity name')
     }))),
+    'review_count': fields.Integer(description='Number of reviews'),
+    'average_rating': fields.Float(description='Average rating (null without reviews)'),
+    'rating_histogram': fields.Raw(description="Number of reviews per rating '1'..'5'"),
     'created_at': fields.String(description='Creation date'),
     'updated_at': fields.String(description='Last update date')
 })
 
+place_batch_result_model = batch_result_model(api)
+
+# Search filters accepted by GET /places/
+PLACE_FILTER_PARAMS = {
+    'min_price': 'Minimum price per night',
+    'max_price': 'Maximum price per night',
+    'min_rating': 'Minimum average rating',
+    'owner_id': 'Only places owned by this user',
+    'amenity': 'Amenity ID (repeat or comma-separate for several)',
+    'amenity_match': "'all' (default) or 'any' of the given amenities",
+    'min_lat': 'Bounding box south edge',
+    'max_lat': 'Bounding box north edge',
+    'min_lon': 'Bounding box west edge',
+    'max_lon': 'Bounding box east edge',
+    'sort': "'created_at' (default) or 'rating' (highest average first)",
+}
+_FLOAT_FILTERS = ('min_price', 'max_price', 'min_rating',
+                  'min_lat', 'max_lat', 'min_lon', 'max_lon')
+
+
+def parse_place_filters():
+    """Read the place search filters from the query string"""
+    filters = {}
+    for name in _FLOAT_FILTERS:
+        value = request.args.get(name)
+        if value is None or value == '':
+            continue
+        try:
+            filters[name] = float(value)
+        except ValueError:
+            api.abort(400, f'{name} must be a number')
+        if not math.isfinite(filters[name]):
+            api.abort(400, f'{name} must be a finite number')
+
+    if request.args.get('owner_id'):
+        filters['owner_id'] = request.args['owner_id']
+
+    amenity_ids = [
+        amenity_id.strip()
+        for value in request.args.getlist('amenity')
+        for amenity_id in value.split(',')
+        if amenity_id.strip()
+    ]
+    if amenity_ids:
+        filters['amenities'] = amenity_ids
+        filters['amenity_match'] = request.args.get('amenity_match', 'all').lower()
+
+    return filters
+
 
 @api.route('/')
 class PlaceList(Resource):
     """Handles operations on the place collection"""
 
-    @api.doc('list_places')
+    @api.doc('list_places', params={**COLLECTION_PARAMS, **PLACE_FILTER_PARAMS})
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(304, 'Not modified since the ETag sent in If-None-Match')
+    @api.response(400, 'Invalid pagination, field or filter parameters')
+    @cached_response('places')
     def get(self):
-        """Get list of all places"""
-        places = facade.get_all_places()
-        return [
-            {
-                'id': place.id,
-                'title': place.title,
-                'description': place.description,
-                'price': place.price,
-                'latitude': place.latitude,
-                'longitude': place.longitude,
-                'owner_id': place.owner.id,
-                'owner': {
-                    'id': place.owner.id,
-                    'first_name': place.owner.first_name,
-                    'last_name': place.owner.last_name,
-                    'email': place.owner.email
-                },
-                'amenities': [
-                    {'id': amenity.id, 'name': amenity.name}
-                    for amenity in place.amenities
-                ],
-                'reviews': [
-                    {
-                        'id': review.id,
-                        'text': review.text,
-                        'rating': review.rating,
-                        'user_id': review.user.id
-                    }
-                    for review in place.reviews
-                ],
-                'created_at': place.created_at.isoformat(),
-                'updated_at': place.updated_at.isoformat()
-            }
-            for place in places
-        ], 200
+        """Search places (supports filters, limit, cursor and fields)"""
+        limit, cursor, fields = parse_collection_args(api, PLACE)
+        filters = parse_place_filters()
+        sort = request.args.get('sort') or None
+        # Version first: a write landing in between only costs a refetch
+        headers = collection_validators(facade.get_places_version())
+        cached = not_modified(headers)
+        if cached:
+            return cached
+        try:
+            places, next_cursor = facade.get_places_page(limit, cursor, fields, filters, sort)
+        except ValueError as e:
+            api.abort(400, str(e))
+        return PLACE.many(places, fields), 200, {**headers, **page_headers(next_cursor)}
 
     @api.doc('create_place')
     @api.expect(place_model, validate=True)
@@ -103,17 +143,12 @@ class PlaceList(Resource):
         place_data = api.payload
         
         # Get the current user from JWT token
-        current_user_id = get_jwt_identity()
+        current_user_id = get_current_user_id()
         
         # Ensure the owner_id in the payload matches the authenticated user
         if place_data['owner_id'] != current_user_id:
             api.abort(401, 'Unauthorized: You can only create places for yourself')
 
-        # Validate owner exists
-        owner = facade.get_user(place_data['owner_id'])
-        if not owner:
-            api.abort(404, 'Owner not found')
-
         # Validate amenities if provided
         amenity_ids = place_data.get('amenities', [])
         amenities = []
@@ -125,29 +160,94 @@ class PlaceList(Resource):
 
         try:
             new_place = facade.create_place(place_data)
-            return {
-                'id': new_place.id,
-                'title': new_place.title,
-                'description': new_place.description,
-                'price': new_place.price,
-                'latitude': new_place.latitude,
-                'longitude': new_place.longitude,
-                'owner_id': new_place.owner.id,
-                'owner': {
-                    'id': new_place.owner.id,
-                    'first_name': new_place.owner.first_name,
-                    'last_name': new_place.owner.last_name,
-                    'email': new_place.owner.email
-                },
-                'amenities': [
-                    {'id': amenity.id, 'name': amenity.name}
-                    for amenity in new_place.amenities
-                ],
-                'created_at': new_place.created_at.isoformat(),
-                'updated_at': new_place.updated_at.isoformat()
-            }, 201
+            return PLACE_WRITE(new_place), 201
+        except ValueError as e:
+            api.abort(400, str(e))
+
+
+@api.route('/batch')
+class PlaceBatch(Resource):
+    """Handles bulk creation of places"""
+
+    @api.doc('create_places_batch')
+    @api.expect([place_model], validate=True)
+    @api.response(201, 'All places created', [place_batch_result_model])
+    @api.response(207, 'Some places could not be created', [place_batch_result_model])
+    @api.response(400, 'Invalid input data')
+    @api.response(401, 'Unauthorized')
+    @api.response(413, 'Batch too large')
+    @jwt_required()
+    def post(self):
+        """Create many places in one request (requires authentication)"""
+        places_data = read_batch(api)
+        results = facade.create_places_bulk(places_data, owner_id=get_current_user_id())
+        return results, batch_status(results)
+
+
+@api.route('/export')
+class PlaceExport(Resource):
+    """Handles the streaming NDJSON export of all places"""
+
+    @api.doc('export_places', params={'gzip': 'Set to 1 to download a gzip file'})
+    @api.produces(['application/x-ndjson', 'application/gzip'])
+    @api.response(200, 'One JSON object per line, with owner and amenities')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def get(self):
+        """Stream every place as newline-delimited JSON (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+
+        batch_size = current_app.config.get('EXPORT_BATCH_SIZE', 1000)
+        chunks = iter_ndjson(facade.iter_places_for_export(batch_size), batch_size)
+        if request.args.get('gzip', '').lower() in ('1', 'true', 'yes'):
+            return Response(
+                stream_with_context(gzip_chunks(chunks)),
+                mimetype='application/gzip',
+                headers={'Content-Disposition': 'attachment; filename=places.ndjson.gz'},
+            )
+        return Response(
+            stream_with_context(chunks),
+            mimetype='application/x-ndjson',
+            headers={'Content-Disposition': 'attachment; filename=places.ndjson'},
+        )
+
+
+@api.route('/near')
+class PlaceNearList(Resource):
+    """Handles radius searches around a point"""
+
+    @api.doc('list_places_near', params={
+        'lat': 'Latitude of the centre point',
+        'lon': 'Longitude of the centre point',
+        'radius_km': 'Search radius in kilometres',
+        'limit': 'Maximum number of places to return (default 20)',
+    })
+    @api.response(200, 'Places ordered by distance retrieved successfully')
+    @api.response(400, 'Invalid search parameters')
+    def get(self):
+        """Get places within radius_km of a point, nearest first"""
+        try:
+            latitude = float(request.args['lat'])
+            longitude = float(request.args['lon'])
+            radius_km = float(request.args['radius_km'])
+            limit = int(request.args.get('limit', 20))
+        except KeyError as e:
+            api.abort(400, f'{e.args[0]} is required')
+        except ValueError:
+            api.abort(400, 'lat, lon, radius_km and limit must be numbers')
+        if limit < 1:
+            api.abort(400, 'limit must be a positive integer')
+        limit = min(limit, current_app.config.get('PAGINATION_MAX_LIMIT', 1000))
+
+        try:
+            results = facade.get_places_near(latitude, longitude, radius_km, limit)
         except ValueError as e:
             api.abort(400, str(e))
+        return [
+            {**PLACE(place), 'distance_km': round(distance, 3)}
+            for place, distance in results
+        ], 200
 
 
 @api.route('/<place_id>')
@@ -157,43 +257,25 @@ class PlaceResource(Resource):
 
     @api.doc('get_place')
     @api.response(200, 'Place details retrieved successfully')
+    @api.response(304, 'Not modified (If-None-Match / If-Modified-Since)')
     @api.response(404, 'Place not found')
     def get(self, place_id):
         """Get place details by ID"""
+        # One indexed query decides a 304 before the place or its
+        # owner, amenities and reviews are loaded
+        version = facade.get_place_version(place_id)
+        if version is None:
+            api.abort(404, 'Place not found')
+        headers = validators((place_id, *version), max(v for v in version if v is not None))
+        cached = not_modified(headers)
+        if cached:
+            return cached
+
         place = facade.get_place(place_id)
         if not place:
             api.abort(404, 'Place not found')
 
-        return {
-            'id': place.id,
-            'title': place.title,
-            'description': place.description,
-            'price': place.price,
-            'latitude': place.latitude,
-            'longitude': place.longitude,
-            'owner_id': place.owner.id,
-            'owner': {
-                'id': place.owner.id,
-                'first_name': place.owner.first_name,
-                'last_name': place.owner.last_name,
-                'email': place.owner.email
-            },
-            'amenities': [
-                {'id': amenity.id, 'name': amenity.name}
-                for amenity in place.amenities
-            ],
-            'reviews': [
-                {
-                    'id': review.id,
-                    'text': review.text,
-                    'rating': review.rating,
-                    'user_id': review.user.id
-                }
-                for review in place.reviews
-            ],
-            'created_at': place.created_at.isoformat(),
-            'updated_at': place.updated_at.isoformat()
-        }, 200
+        return PLACE(place), 200, headers
 
     @api.doc('update_place')
     @api.expect(place_model, validate=True)
@@ -207,26 +289,19 @@ class PlaceResource(Resource):
         place_data = api.payload
         
         # Get the current user from JWT token
-        current_user_id = get_jwt_identity()
+        current_user_id = get_current_user_id()
 
         # Check if place exists
         existing_place = facade.get_place(place_id)
         if not existing_place:
             api.abort(404, 'Place not found')
         
-        # Debug: print the IDs for troubleshooting
-        print(f"\n[DEBUG] Update Place:")
-        print(f"  Current User ID (from token): {current_user_id}")
-        print(f"  Place Owner ID: {existing_place.owner.id}")
-        print(f"  Match: {existing_place.owner.id == current_user_id}")
-        print(f"  Is Admin: {is_admin()}")
-        
         # Check if the current user is the owner of the place or is admin
-        if str(existing_place.owner.id) != str(current_user_id) and not is_admin():
+        if str(existing_place.owner_id) != str(current_user_id) and not is_admin():
             api.abort(403, 'Unauthorized: You can only modify your own places')
 
-        # Validate owner if being updated
-        if 'owner_id' in place_data:
+        # Validate owner if being transferred (the caller is known to exist)
+        if place_data.get('owner_id', current_user_id) != current_user_id:
             owner = facade.get_user(place_data['owner_id'])
             if not owner:
                 api.abort(404, 'Owner not found')
@@ -241,27 +316,7 @@ class PlaceResource(Resource):
 
         try:
             updated_place = facade.update_place(place_id, place_data)
-            return {
-                'id': updated_place.id,
-                'title': updated_place.title,
-                'description': updated_place.description,
-                'price': updated_place.price,
-                'latitude': updated_place.latitude,
-                'longitude': updated_place.longitude,
-                'owner_id': updated_place.owner.id,
-                'owner': {
-                    'id': updated_place.owner.id,
-                    'first_name': updated_place.owner.first_name,
-                    'last_name': updated_place.owner.last_name,
-                    'email': updated_place.owner.email
-                },
-                'amenities': [
-                    {'id': amenity.id, 'name': amenity.name}
-                    for amenity in updated_place.amenities
-                ],
-                'created_at': updated_place.created_at.isoformat(),
-                'updated_at': updated_place.updated_at.isoformat()
-            }, 200
+            return PLACE_WRITE(updated_place), 200
         except ValueError as e:
             api.abort(400, str(e))
     
@@ -273,7 +328,7 @@ class PlaceResource(Resource):
     def delete(self, place_id):
         """Delete a place (requires authentication and ownership)"""
         # Get the current user from JWT token
-        current_user_id = get_jwt_identity()
+        current_user_id = get_current_user_id()
         
         # Check if place exists
         place = facade.get_place(place_id)
@@ -281,9 +336,9 @@ class PlaceResource(Resource):
             api.abort(404, 'Place not found')
         
         # Check if the current user is the owner of the place or is admin
-        if place.owner.id != current_user_id and not is_admin():
+        if place.owner_id != current_user_id and not is_admin():
             api.abort(403, 'Unauthorized: You can only delete your own places')
         
         # Delete the place
-        facade.place_repo.delete(place_id)
+        facade.delete_place(place_id)
         return {'message': 'Place deleted successfully'}, 200
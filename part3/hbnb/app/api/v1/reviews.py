@@ -1,18 +1,19 @@
 """Review API endpoints for HBnB application"""
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import jwt_required
+from hbnb.app.serializers import PLACE_REVIEW, REVIEW
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.services.exceptions import DuplicateReviewError
+from hbnb.app.api.v1.batch import batch_result_model, batch_status, read_batch
+from hbnb.app.api.v1.security import get_current_user_id, is_admin
+from hbnb.app.api.v1.pagination import (
+    COLLECTION_PARAMS, page_headers, parse_collection_args
+)
 
 api = Namespace('reviews', description='Review operations')
 
 facade = HBnBFacade()
 
-
-def is_admin():
-    """Helper function to check if the current user is an admin"""
-    claims = get_jwt()
-    return claims.get('is_admin', False)
-
 # Define the review model for input validation
 review_model = api.model('Review', {
     'text': fields.String(required=True, description='Review text', min_length=1),
@@ -37,33 +38,24 @@ review_response_model = api.model('ReviewResponse', {
     'updated_at': fields.String(description='Last update date')
 })
 
+review_batch_result_model = batch_result_model(api)
+
 
 @api.route('/')
 class ReviewList(Resource):
     """Handles operations on the review collection"""
 
-    @api.doc('list_reviews')
+    @api.doc('list_reviews', params=COLLECTION_PARAMS)
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(400, 'Invalid pagination or field parameters')
     def get(self):
-        """Get list of all reviews"""
-        reviews = facade.get_all_reviews()
-        return [
-            {
-                'id': review.id,
-                'text': review.text,
-                'rating': review.rating,
-                'user_id': review.user.id,
-                'place_id': review.place.id,
-                'user': {
-                    'id': review.user.id,
-                    'first_name': review.user.first_name,
-                    'last_name': review.user.last_name
-                },
-                'created_at': review.created_at.isoformat(),
-                'updated_at': review.updated_at.isoformat()
-            }
-            for review in reviews
-        ], 200
+        """Get list of reviews (supports limit, cursor and fields)"""
+        limit, cursor, fields = parse_collection_args(api, REVIEW)
+        try:
+            reviews, next_cursor = facade.get_reviews_page(limit, cursor, fields)
+        except ValueError as e:
+            api.abort(400, str(e))
+        return REVIEW.many(reviews, fields), 200, page_headers(next_cursor)
 
     @api.doc('create_review')
     @api.expect(review_model, validate=True)
@@ -78,52 +70,54 @@ class ReviewList(Resource):
         review_data = api.payload
         
         # Get the current user from JWT token
-        current_user_id = get_jwt_identity()
+        current_user_id = get_current_user_id()
         
         # Ensure the user_id in the payload matches the authenticated user
         if review_data['user_id'] != current_user_id:
             api.abort(401, 'Unauthorized: You can only create reviews as yourself')
 
-        # Validate user exists
-        user = facade.get_user(review_data['user_id'])
-        if not user:
-            api.abort(404, 'User not found')
-
         # Validate place exists
         place = facade.get_place(review_data['place_id'])
         if not place:
             api.abort(404, 'Place not found')
         
         # Prevent users from reviewing their own places
-        if place.owner.id == current_user_id:
+        if place.owner_id == current_user_id:
             api.abort(403, 'You cannot review your own place')
         
-        # Prevent duplicate reviews - check if user already reviewed this place
-        existing_reviews = facade.get_reviews_by_place(review_data['place_id'])
-        for review in existing_reviews:
-            if review.user.id == current_user_id:
-                api.abort(403, 'You have already reviewed this place')
+        # Prevent duplicate reviews (one index probe; the unique index on
+        # (user_id, place_id) also rejects a concurrent duplicate)
+        if facade.has_reviewed(current_user_id, review_data['place_id']):
+            api.abort(403, 'You have already reviewed this place')
 
         try:
             new_review = facade.create_review(review_data)
-            return {
-                'id': new_review.id,
-                'text': new_review.text,
-                'rating': new_review.rating,
-                'user_id': new_review.user.id,
-                'place_id': new_review.place.id,
-                'user': {
-                    'id': new_review.user.id,
-                    'first_name': new_review.user.first_name,
-                    'last_name': new_review.user.last_name
-                },
-                'created_at': new_review.created_at.isoformat(),
-                'updated_at': new_review.updated_at.isoformat()
-            }, 201
+            return REVIEW(new_review), 201
+        except DuplicateReviewError as e:
+            api.abort(403, str(e))
         except ValueError as e:
             api.abort(400, str(e))
 
 
+@api.route('/batch')
+class ReviewBatch(Resource):
+    """Handles bulk creation of reviews"""
+
+    @api.doc('create_reviews_batch')
+    @api.expect([review_model], validate=True)
+    @api.response(201, 'All reviews created', [review_batch_result_model])
+    @api.response(207, 'Some reviews could not be created', [review_batch_result_model])
+    @api.response(400, 'Invalid input data')
+    @api.response(401, 'Unauthorized')
+    @api.response(413, 'Batch too large')
+    @jwt_required()
+    def post(self):
+        """Create many reviews in one request (requires authentication)"""
+        reviews_data = read_batch(api)
+        results = facade.create_reviews_bulk(reviews_data, user_id=get_current_user_id())
+        return results, batch_status(results)
+
+
 @api.route('/<review_id>')
 @api.param('review_id', 'The review identifier')
 class ReviewResource(Resource):
@@ -138,53 +132,33 @@ class ReviewResource(Resource):
         if not review:
             api.abort(404, 'Review not found')
 
-        return {
-            'id': review.id,
-            'text': review.text,
-            'rating': review.rating,
-            'user_id': review.user.id,
-            'place_id': review.place.id,
-            'user': {
-                'id': review.user.id,
-                'first_name': review.user.first_name,
-                'last_name': review.user.last_name
-            },
-            'created_at': review.created_at.isoformat(),
-            'updated_at': review.updated_at.isoformat()
-        }, 200
+        return REVIEW(review), 200
 
     @api.doc('update_review')
     @api.expect(review_model, validate=True)
     @api.response(200, 'Review updated successfully')
     @api.response(404, 'Review not found')
     @api.response(400, 'Invalid input data')
-    @api.response(403, 'Unauthorized to modify this review')
+    @api.response(403, 'Unauthorized to modify this review, or duplicate review')
     @jwt_required()
     def put(self, review_id):
         """Update review information (requires authentication and ownership)"""
         review_data = api.payload
         
         # Get the current user from JWT token
-        current_user_id = get_jwt_identity()
+        current_user_id = get_current_user_id()
 
         # Check if review exists
         existing_review = facade.get_review(review_id)
         if not existing_review:
             api.abort(404, 'Review not found')
         
-        # Debug: print the IDs for troubleshooting
-        print(f"\n[DEBUG] Update Review:")
-        print(f"  Current User ID (from token): {current_user_id}")
-        print(f"  Review Author ID: {existing_review.user.id}")
-        print(f"  Match: {existing_review.user.id == current_user_id}")
-        print(f"  Is Admin: {is_admin()}")
-        
         # Check if the current user is the author of the review or is admin
-        if str(existing_review.user.id) != str(current_user_id) and not is_admin():
+        if str(existing_review.user_id) != str(current_user_id) and not is_admin():
             api.abort(403, 'Unauthorized: You can only modify your own reviews')
 
-        # Validate user if being updated
-        if 'user_id' in review_data:
+        # Validate user if being reassigned (the caller is known to exist)
+        if review_data.get('user_id', current_user_id) != current_user_id:
             user = facade.get_user(review_data['user_id'])
             if not user:
                 api.abort(404, 'User not found')
@@ -197,20 +171,9 @@ class ReviewResource(Resource):
 
         try:
             updated_review = facade.update_review(review_id, review_data)
-            return {
-                'id': updated_review.id,
-                'text': updated_review.text,
-                'rating': updated_review.rating,
-                'user_id': updated_review.user.id,
-                'place_id': updated_review.place.id,
-                'user': {
-                    'id': updated_review.user.id,
-                    'first_name': updated_review.user.first_name,
-                    'last_name': updated_review.user.last_name
-                },
-                'created_at': updated_review.created_at.isoformat(),
-                'updated_at': updated_review.updated_at.isoformat()
-            }, 200
+            return REVIEW(updated_review), 200
+        except DuplicateReviewError as e:
+            api.abort(403, str(e))
         except ValueError as e:
             api.abort(400, str(e))
 
@@ -222,14 +185,14 @@ class ReviewResource(Resource):
     def delete(self, review_id):
         """Delete a review (requires authentication and ownership)"""
         # Get the current user from JWT token
-        current_user_id = get_jwt_identity()
+        current_user_id = get_current_user_id()
         
         review = facade.get_review(review_id)
         if not review:
             api.abort(404, 'Review not found')
         
         # Check if the current user is the author of the review or is admin
-        if review.user.id != current_user_id and not is_admin():
+        if review.user_id != current_user_id and not is_admin():
             api.abort(403, 'Unauthorized: You can only delete your own reviews')
 
         facade.delete_review(review_id)
@@ -251,19 +214,4 @@ class PlaceReviewList(Resource):
             api.abort(404, 'Place not found')
 
         reviews = facade.get_reviews_by_place(place_id)
-        return [
-            {
-                'id': review.id,
-                'text': review.text,
-                'rating': review.rating,
-                'user_id': review.user.id,
-                'user': {
-                    'id': review.user.id,
-                    'first_name': review.user.first_name,
-                    'last_name': review.user.last_name
-                },
-                'created_at': review.created_at.isoformat(),
-                'updated_at': review.updated_at.isoformat()
-            }
-            for review in reviews
-        ], 200
+        return PLACE_REVIEW.many(reviews), 200
@@ -0,0 +1,80 @@
+"""
+Claims-first authorization helpers shared by every namespace.
+
+Access tokens carry the user's is_admin flag and auth_version ('ver'), a
+stamp bumped whenever the user's email, password or admin status changes.
+While the stamp matches the user's current version the claims are
+trusted as-is and authorization needs no database access; the current
+version comes from a short-lived per-process cache (AUTH_VERSION_TTL).
+Only a stale or unstamped token makes the helpers load the user.
+"""
+from flask import g
+from flask_jwt_extended import create_access_token, get_jwt, get_jwt_identity
+from flask_jwt_extended.exceptions import JWTExtendedException
+from flask_restx import abort
+from jwt import PyJWTError
+
+from hbnb.app.services import facade
+
+
+def init_app(app, api):
+    """Forget the resolved authorization when each request ends; answer JWT errors"""
+    app.teardown_request(lambda exc=None: g.pop('hbnb_authorization', None))
+    api.errorhandler(JWTExtendedException)(_jwt_error)
+    api.errorhandler(PyJWTError)(_jwt_error)
+
+
+def _jwt_error(error):
+    """
+    401 for a missing, invalid, expired or revoked token.
+
+    Flask-RESTX handles the exceptions raised by resources itself, so the
+    JWTManager's app error handlers only ran when exceptions propagate
+    (TESTING/DEBUG); otherwise these errors answered 500.
+    """
+    return {'message': str(error) or 'Invalid token'}, 401
+
+
+def create_token(user):
+    """Issue an access token stamped with the user's current auth_version"""
+    facade.remember_auth_version(user)
+    return create_access_token(
+        identity=str(user.id),
+        additional_claims={'is_admin': user.is_admin, 'ver': user.auth_version},
+    )
+
+
+def get_current_user_id():
+    """ID of the authenticated user (None without a token on optional routes)"""
+    return _authorization()[0]
+
+
+def _authorization():
+    """(user_id, is_admin) for the caller, resolved once per request"""
+    if 'hbnb_authorization' not in g:
+        claims = get_jwt()
+        user_id = get_jwt_identity()
+        version = claims.get('ver')
+        if user_id is None:
+            g.hbnb_authorization = (None, False)
+        elif version is not None and version == facade.get_auth_version(user_id):
+            g.hbnb_authorization = (user_id, bool(claims.get('is_admin', False)))
+            facade.remember_caller(user_id)
+        else:
+            # Stale stamp: decide from the stored user, not a cached snapshot
+            user = facade.get_user_fresh(user_id)
+            if user is None:
+                abort(401, 'User no longer exists')
+            g.hbnb_authorization = (user.id, user.is_admin)
+    return g.hbnb_authorization
+
+
+def is_admin():
+    """True if the caller is an admin, trusting the token when it is current"""
+    return _authorization()[1]
+
+
+def require_admin():
+    """Abort with 403 unless the caller is an admin"""
+    if not is_admin():
+        abort(403, 'Admin privileges required')
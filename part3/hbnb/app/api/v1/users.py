@@ -1,9 +1,17 @@
 """
 User API endpoints for HBnB application
 """
+from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import get_jwt, jwt_required
+from hbnb.app.extensions import login_throttle
+from hbnb.app.serializers import LOGIN_USER, USER
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.api.v1.security import create_token, get_current_user_id, is_admin
+from hbnb.app.api.v1.conditional import collection_validators, not_modified, validators
+from hbnb.app.api.v1.pagination import (
+    COLLECTION_PARAMS, page_headers, parse_collection_args
+)
 
 api = Namespace('users', description='User operations')
 
@@ -11,12 +19,6 @@ api = Namespace('users', description='User operations')
 facade = HBnBFacade()
 
 
-def is_admin():
-    """Helper function to check if the current user is an admin"""
-    claims = get_jwt()
-    return claims.get('is_admin', False)
-
-
 # Define the user model for input validation and documentation
 user_model = api.model('User', {
     'first_name': fields.String(required=True, description='First name of the user', min_length=1, max_length=50),
@@ -48,29 +50,38 @@ user_response_model = api.model('UserResponse', {
 class UserList(Resource):
     """Handles operations on the user collection"""
 
-    @api.doc('list_users')
-    @api.marshal_list_with(user_response_model)
-    @api.response(200, 'List of users retrieved successfully')
+    @api.doc('list_users', params=COLLECTION_PARAMS)
+    @api.response(200, 'List of users retrieved successfully', [user_response_model])
+    @api.response(304, 'Not modified since the ETag sent in If-None-Match')
+    @api.response(400, 'Invalid pagination or field parameters')
     def get(self):
-        """Get list of all users"""
-        users = facade.get_all_users()
-        return users, 200
+        """Get list of users (supports limit, cursor and fields)"""
+        limit, cursor, fields = parse_collection_args(api, USER)
+        # Version first: a write landing in between only costs a refetch
+        headers = collection_validators(facade.get_users_version())
+        cached = not_modified(headers)
+        if cached:
+            return cached
+        try:
+            users, next_cursor = facade.get_users_page(limit, cursor, fields)
+        except ValueError as e:
+            api.abort(400, str(e))
+        # Only the requested fields are read, so deferred columns are never touched
+        return USER.many(users, fields), 200, {
+            **headers, **page_headers(next_cursor)}
 
     @api.doc('create_user')
     @api.expect(user_model, validate=True)
-    @api.marshal_with(user_response_model, code=201)
-    @api.response(201, 'User successfully created')
+    @api.response(201, 'User successfully created', user_response_model)
     @api.response(400, 'Invalid input data')
     @api.response(409, 'Email already registered')
     @api.response(403, 'Admin privileges required')
     @jwt_required(optional=True)
     def post(self):
         """Register a new user (requires admin privileges, except for first user)"""
-        # Allow first user creation without authentication
-        all_users = facade.get_all_users()
-        
-        # If there are existing users, require admin privileges
-        if all_users:
+        # Allow first user creation without authentication;
+        # if there are existing users, require admin privileges
+        if facade.has_users():
             if not is_admin():
                 api.abort(403, 'Admin privileges required')
         
@@ -83,7 +94,7 @@ class UserList(Resource):
 
         try:
             new_user = facade.create_user(user_data)
-            return new_user, 201
+            return USER(new_user), 201
         except ValueError as e:
             api.abort(400, str(e))
 
@@ -94,20 +105,23 @@ class UserResource(Resource):
     """Handles operations on a single user"""
 
     @api.doc('get_user')
-    @api.marshal_with(user_response_model)
-    @api.response(200, 'User details retrieved successfully')
+    @api.response(200, 'User details retrieved successfully', user_response_model)
+    @api.response(304, 'Not modified (If-None-Match / If-Modified-Since)')
     @api.response(404, 'User not found')
     def get(self, user_id):
         """Get user details by ID"""
         user = facade.get_user(user_id)
         if not user:
             api.abort(404, 'User not found')
-        return user, 200
+        headers = validators((user.id, user.updated_at), user.updated_at)
+        cached = not_modified(headers)
+        if cached:
+            return cached
+        return USER(user), 200, headers
 
     @api.doc('update_user')
     @api.expect(user_model, validate=True)
-    @api.marshal_with(user_response_model)
-    @api.response(200, 'User updated successfully')
+    @api.response(200, 'User updated successfully', user_response_model)
     @api.response(404, 'User not found')
     @api.response(400, 'Invalid input data')
     @api.response(409, 'Email already registered')
@@ -118,7 +132,7 @@ class UserResource(Resource):
         user_data = api.payload
         
         # Get the current user from JWT token
-        current_user_id = get_jwt_identity()
+        current_user_id = get_current_user_id()
         
         # Users can only update their own profile unless they are admin
         if current_user_id != user_id and not is_admin():
@@ -137,7 +151,7 @@ class UserResource(Resource):
 
         try:
             updated_user = facade.update_user(user_id, user_data)
-            return updated_user, 200
+            return USER(updated_user), 200
         except ValueError as e:
             api.abort(400, str(e))
 
@@ -150,33 +164,51 @@ class UserLogin(Resource):
     @api.expect(login_model, validate=True)
     @api.response(200, 'Login successful')
     @api.response(401, 'Invalid credentials')
+    @api.response(429, 'Too many login attempts')
     def post(self):
         """Authenticate user and return JWT token"""
         credentials = api.payload
-        
+
+        # Shed credential-stuffing traffic before any lookup or bcrypt work
+        retry_after = login_throttle.check(request.remote_addr, credentials['email'])
+        if retry_after is not None:
+            return {'message': 'Too many login attempts'}, 429, {
+                'Retry-After': str(max(1, round(retry_after)))}
+        if login_throttle.is_unknown(credentials['email']):
+            api.abort(401, 'Invalid credentials')
+
         # Get user by email
         user = facade.get_user_by_email(credentials['email'])
+        if not user:
+            login_throttle.remember_unknown(credentials['email'])
         
         # Verify user exists and password is correct
         if not user or not user.verify_password(credentials['password']):
             api.abort(401, 'Invalid credentials')
+
+        # Upgrade hashes made with an outdated cost while we know the password
+        if user.password_needs_rehash():
+            facade.rehash_password(user, credentials['password'])
         
-        # Create JWT token with user identity and additional claims
-        additional_claims = {
-            'is_admin': user.is_admin
-        }
-        access_token = create_access_token(
-            identity=str(user.id),
-            additional_claims=additional_claims
-        )
+        # Create JWT token carrying is_admin and the user's auth_version
+        access_token = create_token(user)
         
         return {
             'access_token': access_token,
-            'user': {
-                'id': user.id,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'is_admin': user.is_admin
-            }
+            'user': LOGIN_USER(user)
         }, 200
+
+
+@api.route('/logout')
+class UserLogout(Resource):
+    """Handles revocation of the caller's token"""
+
+    @api.doc('user_logout')
+    @api.response(200, 'Logout successful')
+    @api.response(401, 'Missing or revoked token')
+    @jwt_required()
+    def post(self):
+        """Revoke the access token used for this request"""
+        claims = get_jwt()
+        facade.revoke_token(claims['jti'], claims.get('exp'))
+        return {'message': 'Successfully logged out'}, 200
@@ -0,0 +1,82 @@
+"""
+Flask CLI commands for the HBnB application.
+
+Run with the app factory, e.g.:
+    flask --app "hbnb.app:create_app()" export-places -o places.ndjson.gz --gzip
+    flask --app "hbnb.app:create_app()" db upgrade
+    flask --app "hbnb.app:create_app()" create-admin --email admin@hbnb.com
+"""
+import click
+from flask import current_app
+
+
+def register_commands(app):
+    """Attach the HBnB commands to app.cli"""
+
+    @app.cli.command('export-places')
+    @click.option('--output', '-o', default='-', type=click.Path(dir_okay=False),
+                  help='File to write (default: stdout)')
+    @click.option('--gzip', 'use_gzip', is_flag=True, help='Gzip the output')
+    @click.option('--batch-size', type=int, default=None,
+                  help='Rows fetched per round trip (default: EXPORT_BATCH_SIZE)')
+    def export_places(output, use_gzip, batch_size):
+        """Stream every place with owner and amenities as NDJSON"""
+        from hbnb.app.services import facade
+        from hbnb.app.services.export import gzip_chunks, iter_ndjson
+
+        batch_size = batch_size or current_app.config.get('EXPORT_BATCH_SIZE', 1000)
+        chunks = iter_ndjson(facade.iter_places_for_export(batch_size), batch_size)
+        if use_gzip:
+            chunks = gzip_chunks(chunks)
+        with click.open_file(output, 'wb') as out:
+            for chunk in chunks:
+                out.write(chunk)
+
+    @app.cli.command('create-admin')
+    @click.option('--email', default='admin@hbnb.com', show_default=True)
+    @click.option('--password', prompt=True, hide_input=True, confirmation_prompt=True)
+    @click.option('--first-name', default='Admin', show_default=True)
+    @click.option('--last-name', default='User', show_default=True)
+    def create_admin(email, password, first_name, last_name):
+        """Create the administrator account unless the email is taken"""
+        from hbnb.app.services import facade
+
+        existing = facade.get_user_by_email(email)
+        if existing is not None:
+            click.echo(f"User {existing.email} already exists")
+            return
+        admin = facade.create_user({'first_name': first_name, 'last_name': last_name,
+                                    'email': email, 'password': password,
+                                    'is_admin': True})
+        click.echo(f"Admin created: {admin.email}")
+
+    @app.cli.group('db')
+    def db_commands():
+        """Versioned schema migrations"""
+
+    @db_commands.command('upgrade')
+    @click.option('--target', type=int, default=None,
+                  help='Highest revision number to apply (default: all)')
+    @click.option('--chunk-size', type=int, default=None,
+                  help='Rows per backfill transaction (default: BACKFILL_CHUNK_SIZE)')
+    def db_upgrade(target, chunk_size):
+        """Apply pending schema migrations"""
+        from hbnb.app import db
+        from hbnb.app.persistence import migrations
+
+        applied = migrations.upgrade(db.engine, target, log=click.echo,
+                                     chunk_size=chunk_size or migrations.BACKFILL_CHUNK_SIZE)
+        if not applied:
+            click.echo("Database is up to date")
+
+    @db_commands.command('status')
+    def db_status():
+        """List schema migrations not applied yet"""
+        from hbnb.app import db
+        from hbnb.app.persistence import migrations
+
+        revisions = migrations.pending(db.engine)
+        for revision in revisions:
+            click.echo(f"Pending {revision.version:04d} {revision.name}: {revision.description}")
+        if not revisions:
+            click.echo("Database is up to date")
@@ -6,6 +6,17 @@ then initialized in the application factory.
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 
+from hbnb.app.utils.password_hashing import PasswordHasher
+from hbnb.app.utils.rate_limit import LoginThrottle
+from hbnb.app.utils.token_blocklist import TokenBlocklist
+
 # Create extension instances without binding to app
 bcrypt = Bcrypt()
 jwt = JWTManager()
+# Runs bcrypt on a bounded executor (see PASSWORD_HASH_EXECUTOR)
+password_hasher = PasswordHasher(bcrypt)
+# Token buckets in front of POST /users/login (see LOGIN_THROTTLE_BACKEND)
+login_throttle = LoginThrottle()
+# Revoked tokens, checked in memory on every protected request
+token_blocklist = TokenBlocklist()
+jwt.token_in_blocklist_loader(token_blocklist.check_payload)
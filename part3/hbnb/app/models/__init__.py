@@ -4,11 +4,14 @@ from hbnb.app.models.user import User
 from hbnb.app.models.place import Place
 from hbnb.app.models.review import Review
 from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.revoked_token import RevokedToken
 
 # Association table for many-to-many relationship between Place and Amenity
 place_amenity = db.Table('place_amenity',
     db.Column('place_id', db.String(36), db.ForeignKey('places.id'), primary_key=True),
-    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True)
+    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True),
+    # The primary key leads with place_id; amenity filters need the reverse
+    db.Index('idx_place_amenity_amenity_id', 'amenity_id', 'place_id')
 )
 
-__all__ = ["BaseModel", "User", "Place", "Review", "Amenity", "place_amenity"]
\ No newline at end of file
+__all__ = ["BaseModel", "User", "Place", "Review", "Amenity", "RevokedToken", "place_amenity"]
\ No newline at end of file
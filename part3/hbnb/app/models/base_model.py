@@ -7,6 +7,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 from hbnb.app import db
+from hbnb.app.persistence.unit_of_work import commit
 
 
 class BaseModel(db.Model):
@@ -22,13 +23,16 @@ class BaseModel(db.Model):
     __abstract__ = True  # This ensures SQLAlchemy does not create a table for BaseModel
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Indexed: collection endpoints paginate by keyset on (created_at, id)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    # Indexed: conditional GETs read MAX(updated_at) of whole tables
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
+                           index=True)
 
     def save(self) -> None:
-        """Update the updated_at timestamp and commit to database"""
+        """Update the updated_at timestamp and commit (deferred inside a unit of work)"""
         self.updated_at = datetime.utcnow()
-        db.session.commit()
+        commit()
 
     def validate(self) -> None:
         """Override in subclasses."""
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
+
+from sqlalchemy import case, event
 
 from hbnb.app.models.base_model import BaseModel
 from hbnb.app import db
+from hbnb.app.utils.geo import encode_geohash
 
 
 class Place(BaseModel):
@@ -15,9 +18,22 @@ class Place(BaseModel):
     - latitude  (-90..90)
     - longitude (-180..180)
     - owner_id (foreign key to User)
+    - geohash (derived from latitude/longitude, indexed for radius search)
+    - review_count, rating_sum, rating_avg, rating_count_1..5
+      (denormalized rating aggregates, maintained by the facade)
     Relationships: owner, reviews, amenities
     """
     __tablename__ = 'places'
+    # Indexes backing the place search filters (see PlaceRepository)
+    __table_args__ = (
+        db.Index('idx_places_owner_price', 'owner_id', 'price'),
+        db.Index('idx_places_price', 'price'),
+        db.Index('idx_places_lat_lon', 'latitude', 'longitude'),
+        # Covering index for radius search: candidates never touch the table
+        db.Index('idx_places_geohash', 'geohash', 'latitude', 'longitude', 'id'),
+        # Matches the ?sort=rating keyset order (rating_avg DESC, id ASC)
+        db.Index('idx_places_rating', db.text('rating_avg DESC'), 'id'),
+    )
 
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.String(1000), nullable=True, default="")
@@ -25,6 +41,17 @@ class Place(BaseModel):
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
     owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    geohash = db.Column(db.String(12), nullable=True)
+
+    # Rating aggregates, so averages never require loading reviews
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_avg = db.Column(db.Float, nullable=False, default=0.0)
+    rating_count_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_count_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_count_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_count_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_count_5 = db.Column(db.Integer, nullable=False, default=0)
     
     # Relationships
     reviews = db.relationship('Review', backref='place', lazy=True, cascade='all, delete-orphan')
@@ -50,8 +77,55 @@ class Place(BaseModel):
         self.longitude = longitude
         self.owner_id = owner_id
 
+        self.review_count = 0
+        self.rating_sum = 0
+        self.rating_avg = 0.0
+        for rating in range(1, 6):
+            setattr(self, f'rating_count_{rating}', 0)
+
         self.validate()
 
+    def refresh_geohash(self) -> None:
+        """Recompute the geohash column from latitude/longitude"""
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+
+    @property
+    def average_rating(self) -> float | None:
+        """Mean rating, or None if the place has no reviews"""
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 2)
+
+    @property
+    def rating_histogram(self) -> dict[str, int]:
+        """Number of reviews per rating, keyed '1'..'5'"""
+        return {str(r): getattr(self, f'rating_count_{r}') or 0 for r in range(1, 6)}
+
+    def change_ratings(self, added: Sequence[int] = (), removed: Sequence[int] = ()) -> None:
+        """
+        Adjust the rating aggregates for reviews added to/removed from this place.
+
+        The new values are written as SQL expressions relative to the
+        stored ones, so they are applied in the same UPDATE (and the same
+        transaction) as the review change and concurrent writers cannot
+        lose increments. The attributes are refreshed after the flush.
+        """
+        count_delta = len(added) - len(removed)
+        sum_delta = sum(added) - sum(removed)
+        cls = type(self)
+        new_count = cls.review_count + count_delta
+        new_sum = cls.rating_sum + sum_delta
+
+        self.review_count = new_count
+        self.rating_sum = new_sum
+        self.rating_avg = case((new_count > 0, new_sum * 1.0 / new_count), else_=0.0)
+        for rating in range(1, 6):
+            delta = added.count(rating) - removed.count(rating)
+            if delta:
+                column = f'rating_count_{rating}'
+                setattr(self, column, getattr(cls, column) + delta)
+
     def validate(self) -> None:
         if not isinstance(self.title, str) or not self.title.strip():
             raise ValueError("title is required")
@@ -75,4 +149,11 @@ class Place(BaseModel):
             raise ValueError("longitude must be a number")
         if not (-180 <= float(self.longitude) <= 180):
             raise ValueError("longitude must be between -180 and 180")
-        self.longitude = float(self.longitude)
\ No newline at end of file
+        self.longitude = float(self.longitude)
+
+
+@event.listens_for(Place, 'before_insert')
+@event.listens_for(Place, 'before_update')
+def _sync_geohash(mapper, connection, place):
+    """Keep the geohash column in step with latitude/longitude"""
+    place.refresh_geohash()
@@ -15,6 +15,11 @@ class Review(BaseModel):
     - place_id (foreign key to Place)
     """
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # One review per user and place; also serves exists_for() lookups
+        db.Index('uq_reviews_user_place', 'user_id', 'place_id', unique=True),
+        db.Index('idx_reviews_place_id', 'place_id'),
+    )
 
     text = db.Column(db.String(1000), nullable=False)
     rating = db.Column(db.Integer, nullable=False)
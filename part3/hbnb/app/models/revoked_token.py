@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from hbnb.app import db
+
+
+class RevokedToken(db.Model):
+    """
+    A revoked JWT, kept until the token would have expired anyway:
+    - jti (the token's unique identifier, primary key)
+    - expires_at (UTC expiry of the token; NULL if it never expires)
+    - revoked_at (UTC time of revocation)
+    """
+    __tablename__ = 'revoked_tokens'
+
+    jti = db.Column(db.String(36), primary_key=True)
+    # Indexed: expired rows are purged by range
+    expires_at = db.Column(db.DateTime, nullable=True, index=True)
+    # Indexed: workers pull the revocations made since their last sync
+    revoked_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
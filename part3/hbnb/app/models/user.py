@@ -4,7 +4,7 @@ import re
 from typing import Any
 
 from hbnb.app.models.base_model import BaseModel
-from hbnb.app.extensions import bcrypt
+from hbnb.app.extensions import password_hasher
 from hbnb.app import db
 
 _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
@@ -27,6 +27,9 @@ class User(BaseModel):
     email = db.Column(db.String(120), nullable=False, unique=True, index=True)
     password = db.Column(db.String(128), nullable=False)
     is_admin = db.Column(db.Boolean, default=False, nullable=False)
+    # Bumped when email, password or admin status change; access tokens
+    # carry it so stale claims are detected (see api/v1/security.py)
+    auth_version = db.Column(db.Integer, default=1, nullable=False)
     
     # Relationships
     places = db.relationship('Place', backref='owner', lazy=True, cascade='all, delete-orphan')
@@ -45,6 +48,7 @@ class User(BaseModel):
         self.last_name = last_name
         self.email = email
         self.is_admin = is_admin
+        self.auth_version = 1
         # Password should be set using hash_password() method after initialization
         self.password = None
         self.validate()
@@ -53,13 +57,17 @@ class User(BaseModel):
         """Hash the password using bcrypt"""
         if not password:
             raise ValueError("password is required")
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password = password_hasher.hash(password)
+
+    def password_needs_rehash(self) -> bool:
+        """True if the stored hash uses an outdated bcrypt cost"""
+        return bool(self.password) and password_hasher.needs_rehash(self.password)
 
     def verify_password(self, password: str) -> bool:
         """Verify a password against the hashed password"""
         if not self.password:
             return False
-        return bcrypt.check_password_hash(self.password, password)
+        return password_hasher.verify(self.password, password)
 
     def validate(self) -> None:
         if not isinstance(self.first_name, str) or not self.first_name.strip():
@@ -0,0 +1,299 @@
+"""
+Read-through entity cache in front of SQLAlchemyRepository.
+
+get() and get_by_attribute() look in the cache before querying the
+database. The cache holds plain column snapshots, never live ORM
+objects: on a hit the instance is rebuilt and merged into the current
+session without a SELECT. Relationships are not cached and lazy-load as
+usual.
+
+Entries changed or deleted by a transaction are dropped when it ends:
+after its COMMIT, so a concurrent reader cannot re-cache the old row
+between the flush and the commit, or after its rollback. A session whose
+transaction has written never stores snapshots, since they may hold
+uncommitted values. Entries expire after ENTITY_CACHE_TTL seconds in any
+case, which bounds staleness when another process writes.
+
+Backends:
+    memory  In-process LRU with per-entry TTL (per worker process)
+    redis   Shared cache; any client with get/set(ex=)/delete works,
+            e.g. redis-py or a local stand-in for tests and development
+
+Configuration (see config.py):
+    ENTITY_CACHE_BACKEND      'memory', 'redis' or None to disable
+    ENTITY_CACHE_TTL          Seconds an entry stays valid
+    ENTITY_CACHE_MAX_ENTRIES  LRU capacity of the memory backend
+    ENTITY_CACHE_URL          Redis URL for the redis backend
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+class MemoryCacheBackend:
+    """Thread-safe LRU cache whose entries expire after a TTL"""
+
+    def __init__(self, max_entries=10000, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the value stored under key, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """Store value under key for ttl seconds, evicting the LRU entry if full"""
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        """Remove key if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Cache stored in Redis (or anything speaking the same client API).
+
+    Values are pickled, so the Redis instance must only be writable by
+    trusted application servers.
+    """
+
+    def __init__(self, client, prefix='hbnb:entity:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        """Connect with redis-py, which is only needed for this backend"""
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "ENTITY_CACHE_BACKEND='redis' requires the redis package") from e
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def get(self, key):
+        """Return the value stored under key, or None if absent or expired"""
+        data = self.client.get(self.prefix + key)
+        return None if data is None else pickle.loads(data)
+
+    def set(self, key, value, ttl):
+        """Store value under key for ttl seconds"""
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=max(1, int(ttl)))
+
+    def delete(self, key):
+        """Remove key if present"""
+        self.client.delete(self.prefix + key)
+
+
+class EntityCache:
+    """
+    Column snapshots of entities, keyed by table and primary key.
+
+    Attribute lookups (e.g. users by email) are cached as a pointer to the
+    primary key, so they share the entity entry and its invalidation.
+    """
+
+    def __init__(self, backend, ttl=300):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def entity_key(model, obj_id):
+        return f"{model.__tablename__}:{obj_id}"
+
+    @staticmethod
+    def attribute_key(model, attr_name, attr_value):
+        return f"{model.__tablename__}:{attr_name}={attr_value}"
+
+    def _lookup(self, key):
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def load(self, session, model, obj_id):
+        """
+        Return a persistent instance built from the cached snapshot.
+
+        Returns:
+            The instance, or None on a cache miss
+        """
+        row = self._lookup(self.entity_key(model, obj_id))
+        if row is None:
+            return None
+        obj = inspect(model).class_manager.new_instance()
+        for name, value in row.items():
+            set_committed_value(obj, name, value)
+        make_transient_to_detached(obj)
+        return session.merge(obj, load=False)
+
+    def store(self, obj):
+        """
+        Snapshot obj's column values if they match the committed row.
+
+        Returns:
+            True if the snapshot was stored
+        """
+        state = inspect(obj)
+        if not state.persistent or state.modified or _has_written(state.session):
+            return False
+        names = [attr.key for attr in state.mapper.column_attrs]
+        if any(name not in state.dict for name in names):
+            return False  # expired or deferred columns: the snapshot would be partial
+        row = {name: state.dict[name] for name in names}
+        self.backend.set(self.entity_key(type(obj), obj.id), row, self.ttl)
+        return True
+
+    def lookup_id(self, model, attr_name, attr_value):
+        """Return the cached primary key for an attribute lookup, or None"""
+        return self._lookup(self.attribute_key(model, attr_name, attr_value))
+
+    def store_id(self, model, attr_name, attr_value, obj_id):
+        """Remember which primary key an attribute lookup resolved to"""
+        self.backend.set(self.attribute_key(model, attr_name, attr_value), obj_id, self.ttl)
+
+    def forget_id(self, model, attr_name, attr_value):
+        """Drop a stale attribute lookup"""
+        self.backend.delete(self.attribute_key(model, attr_name, attr_value))
+
+    def invalidate(self, model, obj_id):
+        """Drop the snapshot of one entity"""
+        self.invalidations += 1
+        self.backend.delete(self.entity_key(model, obj_id))
+
+    def stats(self):
+        """Counters for the metrics endpoint"""
+        lookups = self.hits + self.misses
+        stats = {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            'invalidations': self.invalidations,
+        }
+        if isinstance(self.backend, MemoryCacheBackend):
+            stats['entries'] = len(self.backend)
+            stats['evictions'] = self.backend.evictions
+        return stats
+
+
+def get_entity_cache():
+    """Return the current app's entity cache, or None if disabled"""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('hbnb_entity_cache')
+
+
+# session.info key: (model, id) of the entities written by the open
+# transaction; present as soon as the transaction has written anything
+PENDING = 'hbnb_cache_pending'
+
+
+def _has_written(session):
+    return session is not None and PENDING in session.info
+
+
+def _written(session):
+    return session.info.setdefault(PENDING, set())
+
+
+def invalidate_on_commit(session, model, obj_id):
+    """Drop the snapshot of an entity when the session's transaction ends"""
+    if session.in_transaction():
+        _written(session).add((model, obj_id))
+        return
+    cache = get_entity_cache()
+    if cache is not None:
+        cache.invalidate(model, obj_id)
+
+
+def _record_flushed(session, flush_context):
+    """Remember every entity changed or deleted by a flush"""
+    written = _written(session)
+    for obj in list(session.dirty) + list(session.deleted):
+        obj_id = inspect(obj).identity
+        if obj_id is not None:
+            written.add((type(obj), obj_id[0]))
+
+
+def _record_statement(orm_execute_state):
+    """Mark the transaction as writing on INSERT/UPDATE/DELETE statements"""
+    if (orm_execute_state.is_insert or orm_execute_state.is_update
+            or orm_execute_state.is_delete):
+        _written(orm_execute_state.session)
+
+
+def _invalidate_written(session, transaction):
+    """Drop the snapshots written by a transaction once it has ended"""
+    if transaction.parent is not None:
+        return  # savepoint: the enclosing transaction decides
+    written = session.info.pop(PENDING, None)
+    cache = get_entity_cache()
+    if written and cache is not None:
+        for model, obj_id in written:
+            cache.invalidate(model, obj_id)
+
+
+def init_entity_cache(app):
+    """Create the cache configured for app and register it on app.extensions"""
+    from hbnb.app import db
+    from hbnb.app.utils.metrics import register_metrics
+
+    backend_name = app.config.get('ENTITY_CACHE_BACKEND')
+    if not backend_name:
+        return None
+    if backend_name == 'memory':
+        backend = MemoryCacheBackend(app.config.get('ENTITY_CACHE_MAX_ENTRIES', 10000))
+    elif backend_name == 'redis':
+        backend = RedisCacheBackend.from_url(app.config['ENTITY_CACHE_URL'])
+    else:
+        raise ValueError(f"Unknown ENTITY_CACHE_BACKEND: {backend_name!r}")
+
+    cache = EntityCache(backend, ttl=app.config.get('ENTITY_CACHE_TTL', 300))
+    app.extensions['hbnb_entity_cache'] = cache
+    register_metrics(app, 'entity_cache', cache.stats)
+
+    for name, listener in (('after_flush', _record_flushed),
+                           ('do_orm_execute', _record_statement),
+                           ('after_transaction_end', _invalidate_written)):
+        if not event.contains(db.session, name, listener):
+            event.listen(db.session, name, listener)
+    return cache
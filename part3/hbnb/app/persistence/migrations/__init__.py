@@ -0,0 +1,252 @@
+"""
+Versioned schema migrations.
+
+The schema of a database is created and evolved only by revisions,
+modules in the versions/ package named NNNN_<slug>.py that define:
+
+    description     One line shown by `flask db status`
+    upgrade(op)     Apply the change through an Operations object
+
+Revisions run in number order and the numbers applied are recorded in
+the schema_migrations table, so running the pipeline again only applies
+what is new. Nothing runs at application startup; deploys run
+
+    flask --app "hbnb.app:create_app()" db upgrade
+    flask --app "hbnb.app:create_app()" db status
+
+before starting (or while running) the new code.
+
+Operations are safe to run against a live database:
+
+- each one is its own short transaction, so the write lock is never held
+  across a whole revision;
+- columns are only added (nullable or with a constant default, which
+  SQLite applies without rewriting the table);
+- backfills update rows in keyset-ordered chunks, committing after each
+  one, so requests keep writing in between (they wait at most one chunk,
+  within busy_timeout);
+- every operation is idempotent and a backfill only selects rows still to
+  fill, so a revision interrupted half-way is simply run again.
+
+Revisions are frozen SQL: they never import the models, which keep
+changing after the revision is written.
+"""
+import importlib
+import pkgutil
+import re
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, DateTime, Integer, MetaData, String, Table, bindparam, inspect, text
+)
+
+# Rows updated per transaction by Operations.backfill()
+BACKFILL_CHUNK_SIZE = 1000
+
+# Kept out of db.metadata: create_all()/drop_all() never touch it
+metadata = MetaData()
+schema_migrations = Table(
+    'schema_migrations', metadata,
+    Column('version', Integer, primary_key=True),
+    Column('name', String(100), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+_REVISION_NAME = re.compile(r'^(\d{4})_(\w+)$')
+
+
+class Revision:
+    """One revision module"""
+
+    def __init__(self, version, name, module):
+        self.version = version
+        self.name = name
+        self.module = module
+        self.description = getattr(module, 'description', name)
+        self.upgrade = module.upgrade
+
+    def __repr__(self):
+        return f'<Revision {self.version:04d} {self.name}>'
+
+
+def load_revisions():
+    """
+    Import every revision of the versions package.
+
+    Returns:
+        Revisions sorted by number
+
+    Raises:
+        ValueError: If two revisions share a number
+    """
+    from hbnb.app.persistence.migrations import versions
+
+    revisions = {}
+    for info in pkgutil.iter_modules(versions.__path__):
+        match = _REVISION_NAME.match(info.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in revisions:
+            raise ValueError(f"Duplicate migration number {version:04d}")
+        module = importlib.import_module(f'{versions.__name__}.{info.name}')
+        revisions[version] = Revision(version, match.group(2), module)
+    return [revisions[version] for version in sorted(revisions)]
+
+
+def applied_versions(conn):
+    """Numbers of the revisions already applied to the database"""
+    metadata.create_all(conn)
+    return {row.version for row in conn.execute(schema_migrations.select())}
+
+
+def pending(engine):
+    """Revisions not yet applied to the database behind engine"""
+    with engine.begin() as conn:
+        applied = applied_versions(conn)
+    return [revision for revision in load_revisions() if revision.version not in applied]
+
+
+def upgrade(engine, target=None, log=None, chunk_size=BACKFILL_CHUNK_SIZE):
+    """
+    Apply pending revisions up to target (default: all).
+
+    Args:
+        engine: SQLAlchemy engine of the database to migrate
+        target: Highest revision number to apply
+        log: Optional callable receiving progress lines
+        chunk_size: Rows per backfill transaction
+
+    Returns:
+        The revisions applied
+    """
+    op = Operations(engine, log=log, chunk_size=chunk_size)
+    applied = []
+    for revision in pending(engine):
+        if target is not None and revision.version > target:
+            break
+        revision.upgrade(op)
+        with engine.begin() as conn:
+            conn.execute(schema_migrations.insert().values(
+                version=revision.version, name=revision.name, applied_at=datetime.utcnow()))
+        applied.append(revision)
+        op.log(f"Applied {revision.version:04d} {revision.name}: {revision.description}")
+    return applied
+
+
+class Operations:
+    """Online-safe schema operations handed to revision upgrade() functions"""
+
+    def __init__(self, engine, log=None, chunk_size=BACKFILL_CHUNK_SIZE):
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self._log = log
+
+    def log(self, message):
+        if self._log is not None:
+            self._log(message)
+
+    def execute(self, sql, params=None):
+        """Run one SQL statement in its own transaction"""
+        with self.engine.begin() as conn:
+            return conn.execute(text(sql), params or {}).rowcount
+
+    def select(self, sql, params=None):
+        """Run one query and return all its rows"""
+        with self.engine.connect() as conn:
+            return conn.execute(text(sql), params or {}).all()
+
+    def has_table(self, table):
+        """True if table exists"""
+        with self.engine.connect() as conn:
+            return inspect(conn).has_table(table)
+
+    def has_column(self, table, column):
+        """True if table has column"""
+        with self.engine.connect() as conn:
+            return any(c['name'] == column for c in inspect(conn).get_columns(table))
+
+    def create_table(self, table, definition):
+        """
+        CREATE TABLE IF NOT EXISTS table (definition).
+
+        Args:
+            definition: Column and constraint definitions, in SQL
+        """
+        self.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definition})")
+
+    def add_column(self, table, column, definition):
+        """
+        ALTER TABLE table ADD COLUMN, unless the column exists.
+
+        Args:
+            definition: Type and constraints, e.g. 'INTEGER NOT NULL DEFAULT 0'.
+                        NOT NULL columns need a constant DEFAULT so existing
+                        rows are valid without rewriting the table.
+        """
+        if not self.has_column(table, column):
+            self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def create_index(self, name, table, columns, unique=False):
+        """
+        CREATE INDEX IF NOT EXISTS name ON table (columns).
+
+        SQLite builds the index in one pass holding the write lock; readers
+        are not blocked (WAL) and writers wait, within busy_timeout.
+
+        Args:
+            columns: Column names or SQL expressions (e.g. 'rating_avg DESC')
+        """
+        unique = 'UNIQUE ' if unique else ''
+        self.execute(
+            f"CREATE {unique}INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+
+    def backfill(self, table, values, where='1 = 1', columns=(), key='id'):
+        """
+        Fill columns of existing rows, chunk by chunk.
+
+        Rows matching where are visited in key order, chunk_size at a time,
+        each chunk updated and committed in its own transaction. where must
+        stop matching a row once it is filled so a rerun resumes the work.
+
+        Args:
+            table: Table to update
+            values: Either {column: SQL expression} evaluated per row by an
+                    UPDATE (the row's columns are in scope), or a callable
+                    receiving a row of `columns` and returning {column: value}
+            where: SQL condition selecting the rows still to fill
+            columns: Columns read for a callable values
+            key: Unique column giving the chunk order
+
+        Returns:
+            Number of rows updated
+        """
+        select = text(
+            f"SELECT {', '.join([key, *columns])} FROM {table} "
+            f"WHERE ({where}) AND (:last IS NULL OR {key} > :last) "
+            f"ORDER BY {key} LIMIT :limit")
+        if callable(values):
+            update = None
+        else:
+            assignments = ', '.join(f"{column} = {expr}" for column, expr in values.items())
+            update = text(f"UPDATE {table} SET {assignments} WHERE {key} IN :keys").bindparams(
+                bindparam('keys', expanding=True))
+
+        total, last = 0, None
+        while True:
+            with self.engine.begin() as conn:
+                rows = conn.execute(select, {'last': last, 'limit': self.chunk_size}).all()
+                if not rows:
+                    break
+                if update is not None:
+                    conn.execute(update, {'keys': [row[0] for row in rows]})
+                else:
+                    params = [dict(values(row), _key=row[0]) for row in rows]
+                    assignments = ', '.join(f"{column} = :{column}" for column in params[0]
+                                            if column != '_key')
+                    conn.execute(
+                        text(f"UPDATE {table} SET {assignments} WHERE {key} = :_key"), params)
+            total += len(rows)
+            last = rows[-1][0]
+            self.log(f"  {table}: {total} rows backfilled")
+        return total
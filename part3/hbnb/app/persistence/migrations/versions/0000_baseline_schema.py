@@ -0,0 +1,60 @@
+"""
+The tables of the first release. On databases created by that release
+(or by db.create_all() since), every statement is a no-op.
+"""
+description = "Create the users, amenities, places, place_amenity and reviews tables"
+
+
+def upgrade(op):
+    op.create_table('users', """
+        first_name VARCHAR(50) NOT NULL,
+        last_name VARCHAR(50) NOT NULL,
+        email VARCHAR(120) NOT NULL,
+        password VARCHAR(128) NOT NULL,
+        is_admin BOOLEAN NOT NULL,
+        id VARCHAR(36) NOT NULL,
+        created_at DATETIME,
+        updated_at DATETIME,
+        PRIMARY KEY (id)
+    """)
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_table('amenities', """
+        name VARCHAR(50) NOT NULL,
+        id VARCHAR(36) NOT NULL,
+        created_at DATETIME,
+        updated_at DATETIME,
+        PRIMARY KEY (id),
+        UNIQUE (name)
+    """)
+    op.create_table('places', """
+        title VARCHAR(100) NOT NULL,
+        description VARCHAR(1000),
+        price FLOAT NOT NULL,
+        latitude FLOAT NOT NULL,
+        longitude FLOAT NOT NULL,
+        owner_id VARCHAR(36) NOT NULL,
+        id VARCHAR(36) NOT NULL,
+        created_at DATETIME,
+        updated_at DATETIME,
+        PRIMARY KEY (id),
+        FOREIGN KEY(owner_id) REFERENCES users (id)
+    """)
+    op.create_table('place_amenity', """
+        place_id VARCHAR(36) NOT NULL,
+        amenity_id VARCHAR(36) NOT NULL,
+        PRIMARY KEY (place_id, amenity_id),
+        FOREIGN KEY(place_id) REFERENCES places (id),
+        FOREIGN KEY(amenity_id) REFERENCES amenities (id)
+    """)
+    op.create_table('reviews', """
+        text VARCHAR(1000) NOT NULL,
+        rating INTEGER NOT NULL,
+        user_id VARCHAR(36) NOT NULL,
+        place_id VARCHAR(36) NOT NULL,
+        id VARCHAR(36) NOT NULL,
+        created_at DATETIME,
+        updated_at DATETIME,
+        PRIMARY KEY (id),
+        FOREIGN KEY(user_id) REFERENCES users (id),
+        FOREIGN KEY(place_id) REFERENCES places (id)
+    """)
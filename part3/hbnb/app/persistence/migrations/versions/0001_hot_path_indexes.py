@@ -0,0 +1,55 @@
+"""
+Indexes behind the hot query paths, for databases created before the
+models declared them. tests/test_query_plans.py checks that no repository
+query falls back to a full table scan once they exist.
+"""
+description = "Index foreign keys, search filters and timestamps"
+
+INDEXES = [
+    # Places of an owner, with the price filter; also serves owner_id alone
+    ('idx_places_owner_price', 'places', ['owner_id', 'price']),
+    ('idx_places_price', 'places', ['price']),
+    ('idx_places_lat_lon', 'places', ['latitude', 'longitude']),
+    # Places having an amenity (the primary key leads with place_id)
+    ('idx_place_amenity_amenity_id', 'place_amenity', ['amenity_id', 'place_id']),
+    ('idx_reviews_place_id', 'reviews', ['place_id']),
+] + [
+    # Keyset pagination on created_at and conditional GETs on MAX(updated_at)
+    (f'ix_{table}_{column}', table, [column])
+    for table in ('users', 'places', 'amenities', 'reviews')
+    for column in ('created_at', 'updated_at')
+]
+
+# Reviews superseded by a more recent one of the same user for the same
+# place (newest by updated_at, then created_at, then id): the unique
+# index cannot be built while they exist
+_SUPERSEDED_REVIEWS = """
+    FROM reviews WHERE EXISTS (
+        SELECT 1 FROM reviews AS newer
+        WHERE newer.user_id = reviews.user_id AND newer.place_id = reviews.place_id
+          AND (COALESCE(newer.updated_at, newer.created_at, ''), newer.id)
+              > (COALESCE(reviews.updated_at, reviews.created_at, ''), reviews.id))
+"""
+
+UNIQUE_INDEXES = [
+    # One review per user and place; also serves reviews of a user
+    ('uq_reviews_user_place', 'reviews', ['user_id', 'place_id']),
+]
+
+
+def drop_duplicate_reviews(op):
+    """Keep the newest review of each (user, place); log the ones removed"""
+    duplicates = op.select(f"SELECT id, user_id, place_id {_SUPERSEDED_REVIEWS}")
+    for review_id, user_id, place_id in duplicates:
+        op.log(f"  reviews: dropping duplicate {review_id} (user {user_id}, place {place_id})")
+    if duplicates:
+        op.execute(f"DELETE {_SUPERSEDED_REVIEWS}")
+
+
+def upgrade(op):
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    # After idx_reviews_place_id, which the duplicate probe uses
+    drop_duplicate_reviews(op)
+    for name, table, columns in UNIQUE_INDEXES:
+        op.create_index(name, table, columns, unique=True)
@@ -0,0 +1,20 @@
+"""
+Geohash of each place for radius search. The column is filled from
+latitude/longitude in chunks; new and updated places get it from the
+model's mapper events.
+"""
+from hbnb.app.utils.geo import encode_geohash
+
+description = "Add and backfill places.geohash, index it for radius search"
+
+
+def upgrade(op):
+    op.add_column('places', 'geohash', 'VARCHAR(12)')
+    op.backfill(
+        'places',
+        lambda row: {'geohash': encode_geohash(row.latitude, row.longitude)},
+        where='geohash IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL',
+        columns=['latitude', 'longitude'],
+    )
+    # Covering index: radius-search candidates never touch the table
+    op.create_index('idx_places_geohash', 'places', ['geohash', 'latitude', 'longitude', 'id'])
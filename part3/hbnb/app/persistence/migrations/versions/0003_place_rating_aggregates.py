@@ -0,0 +1,31 @@
+"""
+Review count, rating sum, average and histogram stored on each place.
+Existing reviews are aggregated place by place, in chunks; from then on
+the facade keeps the columns in step with every review write.
+"""
+description = "Add and backfill the rating aggregates of places, index the average"
+
+COUNTS = ['review_count', 'rating_sum'] + [f'rating_count_{r}' for r in range(1, 6)]
+
+
+def _of_place(aggregate, condition=''):
+    return (f"(SELECT {aggregate} FROM reviews "
+            f"WHERE reviews.place_id = places.id{condition})")
+
+
+def upgrade(op):
+    for column in COUNTS:
+        op.add_column('places', column, 'INTEGER NOT NULL DEFAULT 0')
+    op.add_column('places', 'rating_avg', 'FLOAT NOT NULL DEFAULT 0.0')
+
+    values = {
+        'review_count': _of_place('COUNT(*)'),
+        'rating_sum': _of_place('COALESCE(SUM(rating), 0)'),
+        'rating_avg': _of_place('COALESCE(AVG(rating), 0.0)'),
+    }
+    for rating in range(1, 6):
+        values[f'rating_count_{rating}'] = _of_place('COUNT(*)', f' AND rating = {rating}')
+    op.backfill('places', values,
+                where=f"review_count = 0 AND EXISTS {_of_place('1')}")
+
+    op.create_index('idx_places_rating', 'places', ['rating_avg DESC', 'id'])
@@ -0,0 +1,9 @@
+"""
+Version stamp of each user's authorization, carried by access tokens.
+Existing users start at 1, the value new users get.
+"""
+description = "Add users.auth_version"
+
+
+def upgrade(op):
+    op.add_column('users', 'auth_version', 'INTEGER NOT NULL DEFAULT 1')
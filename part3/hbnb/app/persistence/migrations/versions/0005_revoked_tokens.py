@@ -0,0 +1,17 @@
+"""
+Revoked access tokens (logout), shared by every worker.
+"""
+description = "Create the revoked_tokens table"
+
+
+def upgrade(op):
+    op.create_table('revoked_tokens', """
+        jti VARCHAR(36) NOT NULL,
+        expires_at DATETIME,
+        revoked_at DATETIME NOT NULL,
+        PRIMARY KEY (jti)
+    """)
+    # Expired rows are purged by range
+    op.create_index('ix_revoked_tokens_expires_at', 'revoked_tokens', ['expires_at'])
+    # Workers pull the revocations made since their last sync
+    op.create_index('ix_revoked_tokens_revoked_at', 'revoked_tokens', ['revoked_at'])
@@ -0,0 +1 @@
+"""Migration revisions, applied in number order (see the parent package)"""
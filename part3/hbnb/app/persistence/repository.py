@@ -1,4 +1,58 @@
+import base64
+import json
+import uuid
 from abc import ABC, abstractmethod
+from datetime import datetime
+
+from sqlalchemy import DateTime, and_, func, or_
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.util import identity_key
+
+from hbnb.app.persistence.cache import get_entity_cache, invalidate_on_commit
+from hbnb.app.persistence.routing import reads_from_replica, replica_read
+from hbnb.app.persistence.unit_of_work import commit
+
+
+def encode_cursor(values):
+    """
+    Build an opaque keyset cursor from the sort-key values of a row.
+
+    The cursor is the URL-safe base64 of a JSON list; datetimes are sent
+    as ISO strings. Clients must treat it as an opaque token.
+    """
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor, columns):
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Opaque cursor string
+        columns: The sort-key columns the cursor was built from
+
+    Returns:
+        List of sort-key values, converted back to the column types
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii'))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        # Anything else would only fail (500) when bound as a parameter
+        if any(isinstance(v, bool) or not isinstance(v, (str, int, float, type(None)))
+               for v in values):
+            raise ValueError
+        return [
+            datetime.fromisoformat(v) if isinstance(c.type, DateTime) else v
+            for v, c in zip(values, columns)
+        ]
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError("invalid cursor")
 
 
 class Repository(ABC):
@@ -59,6 +113,16 @@ class InMemoryRepository(Repository):
             None,
         )
 
+    def exists(self, **filters):
+        return self.count(**filters) > 0
+
+    def count(self, **filters):
+        return sum(
+            1
+            for obj in self._storage.values()
+            if all(getattr(obj, k) == v for k, v in filters.items())
+        )
+
 
 class SQLAlchemyRepository(Repository):
     """SQLAlchemy-based repository for database persistence"""
@@ -81,11 +145,49 @@ class SQLAlchemyRepository(Repository):
         """
         from hbnb.app import db
         db.session.add(obj)
-        db.session.commit()
+        commit()
+
+    def add_many(self, objs):
+        """
+        Insert many validated objects with a single executemany INSERT.
+
+        The objects are not attached to the session and mapper events do
+        not run, so Python-side defaults (id, timestamps) are filled in
+        here and any other derived columns must already be set.
+
+        Args:
+            objs: Transient model instances
+        """
+        from hbnb.app import db
+        if not objs:
+            return
+        now = datetime.utcnow()
+        columns = [column.name for column in self.model.__table__.columns]
+        rows = []
+        for obj in objs:
+            if obj.id is None:
+                obj.id = str(uuid.uuid4())
+            if obj.created_at is None:
+                obj.created_at = now
+            if obj.updated_at is None:
+                obj.updated_at = now
+            rows.append({name: getattr(obj, name) for name in columns})
+        db.session.execute(self.model.__table__.insert(), rows)
+        commit()
     
+    def expire(self, obj):
+        """Discard loaded attribute values so they are reloaded on next access"""
+        from hbnb.app import db
+        db.session.expire(obj)
+
+    @replica_read
     def get(self, obj_id):
         """
         Retrieve an object by its ID.
+
+        Looks in the session, then in the entity cache (if enabled), and
+        only then queries the database, caching what it finds (unless a
+        possibly lagging read replica served it).
         
         Args:
             obj_id: The unique identifier of the object
@@ -93,8 +195,88 @@ class SQLAlchemyRepository(Repository):
         Returns:
             Object instance or None if not found
         """
-        return self.model.query.get(obj_id)
+        from hbnb.app import db
+        cache = get_entity_cache()
+        if cache is None or obj_id is None:
+            return db.session.get(self.model, obj_id)
+        obj = db.session.identity_map.get(identity_key(self.model, obj_id))
+        if obj is not None:
+            return obj
+        obj = cache.load(db.session, self.model, obj_id)
+        if obj is None:
+            obj = db.session.get(self.model, obj_id)
+            if obj is not None and not reads_from_replica():
+                cache.store(obj)
+        return obj
     
+    def remember(self, obj):
+        """
+        Snapshot an object just loaded in the entity cache (if enabled).
+
+        Args:
+            obj: Persistent instance matching its committed row
+        """
+        cache = get_entity_cache()
+        if cache is not None:
+            cache.store(obj)
+
+    def get_cached(self, obj_id):
+        """
+        Retrieve an object from the session or the entity cache only.
+
+        Never queries the database.
+
+        Args:
+            obj_id: The unique identifier of the object
+
+        Returns:
+            Object instance, or None if neither holds it
+        """
+        from hbnb.app import db
+        obj = db.session.identity_map.get(identity_key(self.model, obj_id))
+        cache = get_entity_cache()
+        if obj is None and cache is not None:
+            obj = cache.load(db.session, self.model, obj_id)
+        return obj
+
+    def get_fresh(self, obj_id):
+        """
+        Retrieve an object as currently stored on the primary.
+
+        Skips the entity cache and any replica, and overwrites the
+        instance the session may already hold. Use it when the values read
+        decide or feed a write (old ratings, version counters, privileges).
+
+        Args:
+            obj_id: The unique identifier of the object
+
+        Returns:
+            Object instance or None if not found
+        """
+        from hbnb.app import db
+        if obj_id is None:
+            return None
+        return db.session.get(self.model, obj_id, populate_existing=True,
+                              with_for_update=True)
+
+    @replica_read
+    def get_many(self, obj_ids):
+        """
+        Retrieve several objects by ID with a single query.
+
+        Args:
+            obj_ids: Iterable of identifiers
+
+        Returns:
+            Dict mapping id -> object for the IDs that exist
+        """
+        obj_ids = list(dict.fromkeys(obj_ids))
+        if not obj_ids:
+            return {}
+        rows = self.model.query.filter(self.model.id.in_(obj_ids)).all()
+        return {obj.id: obj for obj in rows}
+
+    @replica_read
     def get_all(self):
         """
         Retrieve all objects of this model type.
@@ -103,6 +285,122 @@ class SQLAlchemyRepository(Repository):
             List of all objects
         """
         return self.model.query.all()
+
+    def exists(self, **filters):
+        """
+        Check whether any object matches, without loading one.
+
+        Runs SELECT EXISTS(... LIMIT 1), a single index or table probe.
+
+        Args:
+            **filters: Optional attribute=value equality filters
+
+        Returns:
+            True if at least one object matches
+        """
+        from hbnb.app import db
+        return db.session.query(self.model.query.filter_by(**filters).exists()).scalar()
+
+    def count(self, **filters):
+        """
+        Count objects with SELECT COUNT(*), without loading them.
+
+        Args:
+            **filters: Optional attribute=value equality filters
+
+        Returns:
+            Number of matching objects
+        """
+        from hbnb.app import db
+        return db.session.query(func.count()).select_from(self.model).filter_by(
+            **filters).scalar()
+
+    @replica_read
+    def collection_version(self):
+        """
+        Version of the whole table for conditional GETs on collections.
+
+        Any insert or update moves MAX(updated_at) and any deletion changes
+        COUNT(*), so the pair changes whenever a listing could. Each
+        aggregate is its own scalar subquery so SQLite answers the MAX with
+        one probe of the updated_at index and the COUNT from the smallest
+        index, never reading the table.
+
+        Returns:
+            (count, max_updated_at) read with a single query
+        """
+        from hbnb.app import db
+        return tuple(db.session.query(*self._table_version()).one())
+
+    def _table_version(self):
+        """Scalar subqueries for COUNT(*) and MAX(updated_at) of the table"""
+        from hbnb.app import db
+        return [
+            db.select(func.count()).select_from(self.model).scalar_subquery(),
+            db.select(func.max(self.model.updated_at)).scalar_subquery(),
+        ]
+
+    @replica_read
+    def get_page(self, limit=None, cursor=None, fields=None, query=None, order_by=None):
+        """
+        Retrieve one page of objects in a stable keyset order.
+
+        Uses keyset pagination: the cursor carries the sort key of the
+        last row of the previous page, so every page is an index range
+        scan instead of an OFFSET over the whole table.
+
+        Args:
+            limit: Maximum number of objects to return (None for no limit)
+            cursor: Opaque cursor returned by a previous call
+            fields: Column names to load; other columns are deferred.
+                    Names that are not columns (e.g. relationships) are ignored.
+            query: Base query to paginate (default: self.model.query)
+            order_by: List of (column_name, descending) pairs; id is always
+                      appended ascending as the tie-breaker.
+                      Default: [('created_at', False)]
+
+        Returns:
+            (objects, next_cursor) where next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if query is None:
+            query = self.model.query
+        keys = list(order_by or [('created_at', False)]) + [('id', False)]
+        columns = [getattr(self.model, name) for name, _ in keys]
+
+        if fields:
+            table_columns = self.model.__table__.columns
+            names = {name for name, _ in keys} | {f for f in fields if f in table_columns}
+            query = query.options(
+                load_only(*[getattr(self.model, name) for name in sorted(names)])
+            )
+
+        query = query.order_by(*[
+            column.desc() if descending else column
+            for column, (_, descending) in zip(columns, keys)
+        ])
+
+        if cursor:
+            values = decode_cursor(cursor, columns)
+            # (k0, k1, ...) after (v0, v1, ...) in the mixed-direction order
+            conditions = []
+            for i, (column, (_, descending)) in enumerate(zip(columns, keys)):
+                equal = [columns[j] == values[j] for j in range(i)]
+                after = column < values[i] if descending else column > values[i]
+                conditions.append(and_(*equal, after))
+            query = query.filter(or_(*conditions))
+
+        if limit is None:
+            return query.all(), None
+
+        rows = query.limit(limit + 1).all()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            return rows, encode_cursor([getattr(last, name) for name, _ in keys])
+        return rows, None
     
     def update(self, obj_id, data):
         """
@@ -112,12 +410,12 @@ class SQLAlchemyRepository(Repository):
             obj_id: The unique identifier of the object
             data: Dictionary of attributes to update
         """
-        from hbnb.app import db
         obj = self.get(obj_id)
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
+            self.invalidate(obj_id)
+            commit()
     
     def delete(self, obj_id):
         """
@@ -130,8 +428,24 @@ class SQLAlchemyRepository(Repository):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            self.invalidate(obj_id)
+            commit()
+
+    def invalidate(self, obj_id):
+        """
+        Drop the cached snapshot of an object when the transaction ends.
+
+        Changes flushed through the session are invalidated automatically;
+        call this after writing rows with Core statements.
+
+        Args:
+            obj_id: The unique identifier of the object
+        """
+        from hbnb.app import db
+        if get_entity_cache() is not None:
+            invalidate_on_commit(db.session(), self.model, obj_id)
     
+    @replica_read
     def get_by_attribute(self, attr_name, attr_value):
         """
         Retrieve an object by a specific attribute value.
@@ -143,4 +457,16 @@ class SQLAlchemyRepository(Repository):
         Returns:
             First matching object or None
         """
-        return self.model.query.filter_by(**{attr_name: attr_value}).first()
+        cache = get_entity_cache()
+        if cache is None:
+            return self.model.query.filter_by(**{attr_name: attr_value}).first()
+        obj_id = cache.lookup_id(self.model, attr_name, attr_value)
+        if obj_id is not None:
+            obj = self.get(obj_id)
+            if obj is not None and getattr(obj, attr_name) == attr_value:
+                return obj
+            cache.forget_id(self.model, attr_name, attr_value)
+        obj = self.model.query.filter_by(**{attr_name: attr_value}).first()
+        if obj is not None and not reads_from_replica() and cache.store(obj):
+            cache.store_id(self.model, attr_name, attr_value, obj.id)
+        return obj
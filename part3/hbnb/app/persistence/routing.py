@@ -0,0 +1,156 @@
+"""
+Read/write routing of db.session between the primary and read replicas.
+
+READ_REPLICA_BINDS names entries of SQLALCHEMY_BINDS that hold read-only
+copies of the primary database (e.g. a replicated SQLite file opened with
+?mode=ro). RoutingSession, the session class of `db`, then sends:
+
+    flushes and INSERT/UPDATE/DELETE   the primary, always
+    reads inside replica_reads()       a replica, picked once per session
+    every other read                   the primary
+
+Repository lookups (get, get_many, get_all, get_by_attribute, get_page,
+collection versions) are decorated with @replica_read; relationships
+loaded lazily afterwards go to the primary, so list endpoints eager-load
+what they serialize.
+
+Reads stay on the primary when they could be stale for the caller:
+
+- inside a unit of work, whose reads usually decide a write;
+- for the rest of the session once it has written anything
+  (read-your-writes). db.session is scoped to the app context, so the
+  stickiness lasts for the request that wrote.
+
+Without READ_REPLICA_BINDS every statement goes to the primary, as before.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from flask import current_app
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from hbnb.app.persistence.unit_of_work import in_unit_of_work
+
+# True while the current context runs a read that a replica may serve
+_replica_reads = ContextVar('hbnb_replica_reads', default=False)
+
+# session.info keys
+WROTE = 'hbnb_wrote'
+REPLICA = 'hbnb_replica'
+
+
+@contextmanager
+def replica_reads():
+    """Let the reads issued inside the block go to a read replica"""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def replica_read(func):
+    """Run the decorated lookup inside replica_reads()"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with replica_reads():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class ReadRouter:
+    """Replica bind keys of an app and routing counters"""
+
+    def __init__(self, bind_keys):
+        self.bind_keys = list(bind_keys)
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    def choose(self):
+        """Bind key of the replica a new session reads from"""
+        return random.choice(self.bind_keys)
+
+    def stats(self):
+        """Counters for the metrics endpoint"""
+        return {
+            'replicas': self.bind_keys,
+            'replica_reads': self.replica_reads,
+            # Reads a replica could have served that stayed on the primary
+            # (inside a unit of work or after a write)
+            'primary_reads': self.primary_reads,
+        }
+
+
+def get_read_router():
+    """The ReadRouter of the current app, or None without replicas"""
+    return current_app.extensions.get('hbnb_read_routing')
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that routes reads as described above"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                self.info[WROTE] = True
+            elif _replica_reads.get():
+                engine = self._replica_engine()
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _reads_from_primary(self):
+        return in_unit_of_work() or self.info.get(WROTE, False)
+
+    def _replica_engine(self):
+        router = get_read_router()
+        if router is None:
+            return None
+        if self._reads_from_primary():
+            router.primary_reads += 1
+            return None
+        key = self.info.get(REPLICA)
+        if key is None:
+            key = self.info[REPLICA] = router.choose()
+        router.replica_reads += 1
+        return self._db.engines[key]
+
+
+def reads_from_replica():
+    """
+    True if a read issued now through db.session would be served by a
+    replica; the entity cache does not store such possibly stale rows.
+    """
+    from hbnb.app import db
+    session = db.session()
+    return (_replica_reads.get() and get_read_router() is not None
+            and isinstance(session, RoutingSession) and not session._reads_from_primary())
+
+
+def init_read_routing(app, db):
+    """Enable routing to app.config['READ_REPLICA_BINDS'] (if any)"""
+    from hbnb.app.utils.metrics import register_metrics
+
+    bind_keys = app.config.get('READ_REPLICA_BINDS') or []
+    if not bind_keys:
+        app.extensions.pop('hbnb_read_routing', None)
+        return None
+    binds = app.config.get('SQLALCHEMY_BINDS') or {}
+    missing = [key for key in bind_keys if key not in binds]
+    if missing:
+        raise ValueError(f"READ_REPLICA_BINDS not in SQLALCHEMY_BINDS: {missing}")
+
+    # Flask-SQLAlchemy made an empty MetaData per bind; replicas hold copies
+    # of the primary's tables, so db.create_all()/drop_all() must skip them
+    for key in bind_keys:
+        metadata = db.metadatas.get(key)
+        if metadata is not None and not metadata.tables:
+            del db.metadatas[key]
+
+    router = ReadRouter(bind_keys)
+    app.extensions['hbnb_read_routing'] = router
+    register_metrics(app, 'read_routing', router.stats)
+    return router
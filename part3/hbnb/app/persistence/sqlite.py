@@ -0,0 +1,60 @@
+"""
+SQLite connection tuning.
+
+SQLITE_PRAGMAS (a dict, see SQLiteProductionConfig) is applied to every
+new DB-API connection through a 'connect' event on the app's engine, so
+pooled connections are configured once and never per request:
+
+    journal_mode=WAL      Readers no longer block on, or block, the writer
+    synchronous=NORMAL    fsync at checkpoints instead of every commit
+                          (safe with WAL: a power loss can only drop the
+                          last commits, never corrupt the file)
+    mmap_size             Read pages through a memory map
+    cache_size            Page cache per connection (negative: KiB)
+    busy_timeout          Milliseconds a writer waits for the lock before
+                          failing with "database is locked"
+    foreign_keys=ON       Enforce the schema's foreign keys
+
+Nothing is applied to other database backends or without SQLITE_PRAGMAS.
+"""
+from sqlalchemy import event
+
+
+def _pragma_value(value):
+    if isinstance(value, bool):
+        return 'ON' if value else 'OFF'
+    if isinstance(value, int) or (isinstance(value, str) and value.isidentifier()):
+        return str(value)
+    raise ValueError(f"Unsupported PRAGMA value: {value!r}")
+
+
+def pragma_statements(pragmas):
+    """PRAGMA statements for a {name: value} mapping (validated, in order)"""
+    statements = []
+    for name, value in pragmas.items():
+        if not name.isidentifier():
+            raise ValueError(f"Invalid PRAGMA name: {name!r}")
+        statements.append(f"PRAGMA {name}={_pragma_value(value)}")
+    return statements
+
+
+def init_sqlite(app, db):
+    """Apply app.config['SQLITE_PRAGMAS'] to each connection of the app's SQLite engine"""
+    pragmas = app.config.get('SQLITE_PRAGMAS')
+    if not pragmas:
+        return
+    statements = pragma_statements(pragmas)
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return
+
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    event.listen(engine, 'connect', _on_connect)
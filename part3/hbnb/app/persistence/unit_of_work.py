@@ -0,0 +1,104 @@
+"""
+Unit of work: group repository writes into a single database transaction.
+
+Repositories and BaseModel.save() call commit() from this module instead
+of committing the session directly. Outside a unit of work that commits
+immediately, as before; inside one, the commit is deferred until the
+outermost block exits, so a whole request costs one COMMIT (one fsync).
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# Nesting depth of open units of work in the current thread/context
+_depth = ContextVar('hbnb_unit_of_work_depth', default=0)
+# Callbacks to run once the outermost open unit of work has committed
+_on_commit = ContextVar('hbnb_unit_of_work_on_commit', default=None)
+
+
+def in_unit_of_work():
+    """Return True if a unit of work is open in the current context"""
+    return _depth.get() > 0
+
+
+def on_commit(callback):
+    """
+    Call callback() after the outermost unit of work commits, or now if
+    none is open. Callbacks are dropped if the unit of work rolls back.
+    """
+    callbacks = _on_commit.get()
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+def commit():
+    """Commit the session unless a unit of work will commit it later"""
+    from hbnb.app import db
+    if not in_unit_of_work():
+        db.session.commit()
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Commit everything done inside the block once, or roll it all back.
+
+    Blocks may be nested; inner blocks join the outer transaction and
+    only the outermost one commits or rolls back.
+
+    Yields:
+        The SQLAlchemy session
+    """
+    from hbnb.app import db
+    outermost = not in_unit_of_work()
+    callbacks_token = _on_commit.set([]) if outermost else None
+    token = _depth.set(_depth.get() + 1)
+    try:
+        yield db.session
+    except BaseException:
+        _depth.reset(token)
+        if outermost:
+            _on_commit.reset(callbacks_token)
+            db.session.rollback()
+        raise
+    _depth.reset(token)
+    if outermost:
+        callbacks = _on_commit.get()
+        _on_commit.reset(callbacks_token)
+        db.session.commit()
+        for callback in callbacks:
+            callback()
+
+
+@contextmanager
+def savepoint():
+    """
+    Run the block in a SAVEPOINT: an error rolls back only the block,
+    leaving earlier writes of the enclosing unit of work in place.
+
+    pysqlite does not send BEGIN before a SAVEPOINT, so SQLite would
+    start the transaction with the SAVEPOINT itself and its RELEASE would
+    commit everything so far. A real transaction is begun first.
+
+    Yields:
+        The SQLAlchemy session
+    """
+    from hbnb.app import db
+    session = db.session
+    connection = session.connection()
+    if connection.dialect.name == 'sqlite':
+        if not connection.connection.dbapi_connection.in_transaction:
+            connection.exec_driver_sql('BEGIN')
+    with session.begin_nested():
+        yield session
+
+
+def transactional(func):
+    """Run the decorated function inside a unit of work"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with unit_of_work():
+            return func(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,256 @@
+"""
+Central serialization of models into JSON-ready dicts.
+
+Every endpoint (and the NDJSON export) builds its payloads with the
+serializers defined at the bottom of this module instead of hand-written
+dicts, so a model is rendered the same way everywhere.
+
+A Serializer is declared with a field table mapping output names to
+specs:
+
+    'title'                       attribute of the same name
+    Attr('owner_id')              another attribute
+    DateTime('created_at')        ISO 8601 string (None stays None)
+    Nested('owner', OWNER)        serialized related object (or None)
+    NestedList('amenities', REF)  list of serialized related objects
+    callable(obj)                 computed value
+
+The table is compiled once per field selection into a single function
+whose body is one dict display (`{'id': obj.id, ...}`), so serializing an
+object costs one call instead of a lambda call per field. ?fields=
+projections compile their own function on first use and are cached.
+
+dumps() encodes with orjson when it is installed and falls back to the
+standard library otherwise; output_json() is registered as the API's
+application/json representation.
+"""
+import json
+
+from flask import current_app, make_response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# ===== Encoding =====
+
+def dumps(data, indent=False):
+    """
+    Encode data as JSON bytes.
+
+    Uses orjson when available; values it refuses are retried with the
+    standard library encoder.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(data, indent=4).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX representation for application/json built on dumps()"""
+    response = make_response(dumps(data, indent=current_app.debug) + b'\n', code)
+    response.headers.extend(headers or {})
+    return response
+
+
+# ===== Datetime formatting =====
+
+_DATETIME_CACHE = {}
+_DATETIME_CACHE_SIZE = 8192
+
+
+def format_datetime(value):
+    """
+    ISO 8601 text of a datetime, memoized.
+
+    The same timestamps recur across a payload (an owner embedded in each
+    of their places, pages refetched while unchanged); the cache is
+    simply emptied when full.
+    """
+    if value is None:
+        return None
+    text = _DATETIME_CACHE.get(value)
+    if text is None:
+        if len(_DATETIME_CACHE) >= _DATETIME_CACHE_SIZE:
+            _DATETIME_CACHE.clear()
+        text = _DATETIME_CACHE[value] = value.isoformat()
+    return text
+
+
+# ===== Field specs =====
+
+class Attr:
+    """Copy an attribute"""
+    __slots__ = ('attr',)
+
+    def __init__(self, attr):
+        if not attr.isidentifier():
+            raise ValueError(f"Invalid attribute name: {attr!r}")
+        self.attr = attr
+
+
+class DateTime(Attr):
+    """Format a datetime attribute with format_datetime()"""
+    __slots__ = ()
+
+
+class Nested(Attr):
+    """Serialize a related object (None stays None)"""
+    __slots__ = ('serializer',)
+
+    def __init__(self, attr, serializer):
+        super().__init__(attr)
+        self.serializer = serializer
+
+
+class NestedList(Nested):
+    """Serialize each object of a related collection"""
+    __slots__ = ()
+
+
+class Serializer:
+    """Compiled renderer of one model into a dict (see the module docstring)"""
+    __slots__ = ('fields', '_compiled')
+
+    def __init__(self, fields):
+        self.fields = {
+            name: Attr(spec) if isinstance(spec, str) else spec
+            for name, spec in fields.items()
+        }
+        self._compiled = {}
+
+    def __contains__(self, name):
+        return name in self.fields
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def _compile(self, names):
+        """Build `serialize(obj) -> {name: value, ...}` for the given field names"""
+        namespace = {'_fmt': format_datetime}
+        items = []
+        for i, name in enumerate(names):
+            spec = self.fields[name]
+            if isinstance(spec, Nested):
+                # Call the nested serializer's compiled function directly
+                namespace[f'_s{i}'] = spec.serializer._function(tuple(spec.serializer.fields))
+            if isinstance(spec, NestedList):
+                value = f'[_s{i}(item) for item in obj.{spec.attr}]'
+            elif isinstance(spec, Nested):
+                value = f'(None if (v{i} := obj.{spec.attr}) is None else _s{i}(v{i}))'
+            elif isinstance(spec, DateTime):
+                value = f'_fmt(obj.{spec.attr})'
+            elif isinstance(spec, Attr):
+                value = f'obj.{spec.attr}'
+            else:
+                namespace[f'_f{i}'] = spec
+                value = f'_f{i}(obj)'
+            items.append(f'{name!r}: {value}')
+        source = 'def serialize(obj):\n    return {' + ', '.join(items) + '}\n'
+        exec(compile(source, f'<serializer {", ".join(names)}>', 'exec'), namespace)
+        return namespace['serialize']
+
+    def _function(self, names):
+        function = self._compiled.get(names)
+        if function is None:
+            function = self._compiled[names] = self._compile(names)
+        return function
+
+    def __call__(self, obj):
+        """Serialize obj with every field"""
+        return self._function(tuple(self.fields))(obj)
+
+    def many(self, objs, fields=None):
+        """Serialize a sequence of objects, optionally projected to fields"""
+        function = self._function(self._names(fields))
+        return [function(obj) for obj in objs]
+
+    def project(self, obj, fields=None):
+        """Serialize obj with only the requested fields (None for all)"""
+        return self._function(self._names(fields))(obj)
+
+    def _names(self, fields):
+        if fields is None:
+            return tuple(self.fields)
+        return tuple(name for name in self.fields if name in fields)
+
+    def select(self, *names):
+        """A serializer with only the given fields, in this one's order"""
+        return Serializer({name: spec for name, spec in self.fields.items() if name in names})
+
+    def exclude(self, *names):
+        """A serializer without the given fields"""
+        return Serializer({name: spec for name, spec in self.fields.items()
+                           if name not in names})
+
+
+# ===== Model serializers =====
+
+USER = Serializer({
+    'id': 'id',
+    'first_name': 'first_name',
+    'last_name': 'last_name',
+    'email': 'email',
+    'is_admin': 'is_admin',
+    'created_at': DateTime('created_at'),
+    'updated_at': DateTime('updated_at'),
+})
+# A place's owner as embedded in place payloads
+OWNER = USER.select('id', 'first_name', 'last_name', 'email')
+# A review's author as embedded in review payloads
+AUTHOR = USER.select('id', 'first_name', 'last_name')
+# The user returned by POST /users/login
+LOGIN_USER = USER.exclude('created_at', 'updated_at')
+
+AMENITY = Serializer({
+    'id': 'id',
+    'name': 'name',
+    'created_at': DateTime('created_at'),
+    'updated_at': DateTime('updated_at'),
+})
+AMENITY_REF = AMENITY.select('id', 'name')
+
+REVIEW = Serializer({
+    'id': 'id',
+    'text': 'text',
+    'rating': 'rating',
+    'user_id': 'user_id',
+    'place_id': 'place_id',
+    'user': Nested('user', AUTHOR),
+    'created_at': DateTime('created_at'),
+    'updated_at': DateTime('updated_at'),
+})
+# A review as embedded in place payloads
+REVIEW_REF = REVIEW.select('id', 'text', 'rating', 'user_id')
+# A review listed under /places/<id>/reviews (the place is implied)
+PLACE_REVIEW = REVIEW.exclude('place_id')
+
+PLACE = Serializer({
+    'id': 'id',
+    'title': 'title',
+    'description': 'description',
+    'price': 'price',
+    'latitude': 'latitude',
+    'longitude': 'longitude',
+    'owner_id': 'owner_id',
+    'owner': Nested('owner', OWNER),
+    'amenities': NestedList('amenities', AMENITY_REF),
+    'reviews': NestedList('reviews', REVIEW_REF),
+    'review_count': 'review_count',
+    'average_rating': 'average_rating',
+    'rating_histogram': 'rating_histogram',
+    'created_at': DateTime('created_at'),
+    'updated_at': DateTime('updated_at'),
+})
+# Responses to POST/PUT /places/ (reviews are not embedded)
+PLACE_WRITE = PLACE.exclude('reviews')
+# One line of the NDJSON export
+PLACE_EXPORT = PLACE.exclude('reviews', 'rating_histogram')
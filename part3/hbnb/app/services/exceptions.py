@@ -0,0 +1,13 @@
+"""
+Business-rule errors raised by the facade.
+
+They subclass ValueError so callers that only handle ValueError keep
+answering 400; endpoints that know better catch them first.
+"""
+
+
+class DuplicateReviewError(ValueError):
+    """The user has already reviewed this place"""
+
+    def __init__(self, message="You have already reviewed this place"):
+        super().__init__(message)
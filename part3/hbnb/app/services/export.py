@@ -0,0 +1,38 @@
+"""
+Newline-delimited JSON export of places.
+
+Used by GET /api/v1/places/export and the `flask export-places` command.
+Both consume the generators below chunk by chunk, so memory use does not
+depend on the size of the places table.
+"""
+import zlib
+
+from hbnb.app.serializers import PLACE_EXPORT, dumps
+
+
+def iter_ndjson(places, batch_size=1000):
+    """
+    Encode places as NDJSON, yielding one bytes chunk per batch.
+
+    Args:
+        places: Iterable of Place objects
+        batch_size: Number of records per yielded chunk
+    """
+    lines = []
+    for place in places:
+        lines.append(dumps(PLACE_EXPORT(place)))
+        if len(lines) >= batch_size:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def gzip_chunks(chunks, level=6):
+    """Compress a stream of bytes chunks into a gzip stream"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
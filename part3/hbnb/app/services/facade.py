@@ -1,11 +1,24 @@
+import math
+import uuid
+from datetime import datetime
+
+from flask import current_app, g, has_request_context
+
+from hbnb.app.extensions import login_throttle, token_blocklist
+from hbnb.app.persistence.cache import MemoryCacheBackend
 from hbnb.app.services.repositories.user_repository import UserRepository
 from hbnb.app.services.repositories.place_repository import PlaceRepository
 from hbnb.app.services.repositories.review_repository import ReviewRepository
 from hbnb.app.services.repositories.amenity_repository import AmenityRepository
+from hbnb.app.services.repositories.revoked_token_repository import RevokedTokenRepository
 from hbnb.app.models.user import User
 from hbnb.app.models.amenity import Amenity
 from hbnb.app.models.place import Place
 from hbnb.app.models.review import Review
+from hbnb.app.persistence.unit_of_work import transactional, unit_of_work
+from hbnb.app.services.exceptions import DuplicateReviewError
+from hbnb.app.utils.response_cache import invalidates
+from hbnb.app.utils.token_blocklist import to_utc_datetime
 
 
 class HBnBFacade:
@@ -29,8 +42,108 @@ class HBnBFacade:
             self.place_repo = PlaceRepository()
             self.review_repo = ReviewRepository()
             self.amenity_repo = AmenityRepository()
+            self.revoked_token_repo = RevokedTokenRepository()
             HBnBFacade._repositories_initialized = True
 
+    def init_app(self, app):
+        """Clear the request identity map when each request ends"""
+        app.teardown_request(self._clear_identity_map)
+        token_blocklist.use_source(self.revoked_token_repo.revoked_since)
+
+    @staticmethod
+    def _clear_identity_map(exc=None):
+        g.pop('hbnb_identity_map', None)
+        g.pop('hbnb_caller_id', None)
+
+    @staticmethod
+    def _identity_map():
+        """
+        Entities already fetched during the current request, keyed by
+        (model, id), or None outside a request.
+
+        The API layer and the facade methods it calls look up the same
+        rows (e.g. the place and its owner on PUT /places/<id>); the map
+        makes every lookup after the first free.
+        """
+        if not has_request_context():
+            return None
+        if 'hbnb_identity_map' not in g:
+            g.hbnb_identity_map = {}
+        return g.hbnb_identity_map
+
+    def _get(self, repo, obj_id):
+        """repo.get() through the request identity map"""
+        identity_map = self._identity_map()
+        if identity_map is None:
+            return repo.get(obj_id)
+        key = (repo.model, obj_id)
+        obj = identity_map.get(key)
+        if obj is None:
+            obj = repo.get(obj_id)
+            if obj is not None:
+                identity_map[key] = obj
+        return obj
+
+    def _user_exists(self, user_id):
+        """
+        Check that a user exists.
+
+        The caller of the current request is known to once their token was
+        found current: no query is made, and the row is only taken from the
+        entity cache (e.g. since login) for responses embedding the user.
+        """
+        if has_request_context() and g.get('hbnb_caller_id') == user_id:
+            user = self.user_repo.get_cached(user_id)
+            if user is not None:
+                self._identity_map()[(User, user_id)] = user
+            return True
+        return self._get(self.user_repo, user_id) is not None
+
+    def _get_fresh(self, repo, obj_id):
+        """repo.get_fresh(), recorded in the request identity map"""
+        obj = repo.get_fresh(obj_id)
+        identity_map = self._identity_map()
+        if obj is not None and identity_map is not None:
+            identity_map[(repo.model, obj_id)] = obj
+        return obj
+
+    def _get_many(self, repo, obj_ids):
+        """repo.get_many() through the request identity map, querying only unseen IDs"""
+        identity_map = self._identity_map()
+        if identity_map is None:
+            return repo.get_many(obj_ids)
+        found, missing = {}, []
+        for obj_id in obj_ids:
+            obj = identity_map.get((repo.model, obj_id))
+            if obj is not None:
+                found[obj_id] = obj
+            else:
+                missing.append(obj_id)
+        for obj_id, obj in repo.get_many(missing).items():
+            identity_map[(repo.model, obj_id)] = obj
+            found[obj_id] = obj
+        return found
+
+    def _forget(self, model, obj_id):
+        """Drop a deleted entity from the request identity map"""
+        identity_map = self._identity_map()
+        if identity_map is not None:
+            identity_map.pop((model, obj_id), None)
+
+    def transaction(self):
+        """
+        Group several facade calls into one database transaction.
+
+        Writes made inside the block are committed once when it exits, or
+        rolled back if it raises. Facade methods marked @transactional
+        already run in their own unit of work and join an enclosing one.
+
+            with facade.transaction():
+                place = facade.create_place(...)
+                facade.create_review(...)
+        """
+        return unit_of_work()
+
     # ===== User Management Methods =====
 
     def create_user(self, user_data):
@@ -41,26 +154,119 @@ class HBnBFacade:
         if password:
             user.hash_password(password)
         self.user_repo.add(user)
+        login_throttle.forget_unknown(user.email)
         return user
 
     def get_user(self, user_id):
         """Get a user by ID"""
-        return self.user_repo.get(user_id)
+        return self._get(self.user_repo, user_id)
+
+    def get_user_fresh(self, user_id):
+        """Get a user by ID as stored on the primary (no cached snapshot)"""
+        return self._get_fresh(self.user_repo, user_id)
 
     def get_all_users(self):
         """Get all users"""
         return self.user_repo.get_all()
 
+    def get_users_page(self, limit=None, cursor=None, fields=None):
+        """Get one page of users as (users, next_cursor)"""
+        return self.user_repo.get_page(limit, cursor, fields)
+
+    def get_users_version(self):
+        """Aggregate version of the user collection (for ETags)"""
+        return self.user_repo.collection_version()
+
+    def has_users(self):
+        """
+        Check whether any user is registered (first sign-up needs no admin).
+
+        Once a user exists the answer is remembered for the app, so the
+        EXISTS probe only runs while the table is empty.
+        """
+        state = current_app.extensions.setdefault('hbnb_bootstrap', {})
+        if not state.get('has_users'):
+            state['has_users'] = self.user_repo.exists()
+        return state['has_users']
+
+    @staticmethod
+    def _auth_versions():
+        versions = current_app.extensions.get('hbnb_auth_versions')
+        if versions is None:
+            versions = current_app.extensions['hbnb_auth_versions'] = MemoryCacheBackend(
+                current_app.config.get('AUTH_VERSION_MAX_ENTRIES', 100000))
+        return versions
+
+    def get_auth_version(self, user_id):
+        """
+        Current auth_version of a user, or None if the user does not exist.
+
+        Cached per process for AUTH_VERSION_TTL seconds; changes made in
+        this process are seen immediately, others within the TTL.
+        """
+        versions = self._auth_versions()
+        version = versions.get(user_id)
+        if version is None:
+            version = self.user_repo.get_auth_version(user_id)
+            if version is None:
+                return None
+            versions.set(user_id, version, current_app.config.get('AUTH_VERSION_TTL', 60))
+        return version
+
+    def remember_auth_version(self, user):
+        """
+        Cache the auth_version of a user just loaded (e.g. at login).
+
+        The user is also snapshotted in the entity cache, so the writes of
+        the token's holder can embed them in responses without a query.
+        """
+        self._auth_versions().set(
+            user.id, user.auth_version, current_app.config.get('AUTH_VERSION_TTL', 60))
+        self.user_repo.remember(user)
+
+    def remember_caller(self, user_id):
+        """
+        Record the authenticated caller of the current request, whose
+        token stamp matched their auth_version (so the user exists).
+        """
+        g.hbnb_caller_id = user_id
+
+    @transactional
+    def revoke_token(self, jti, expires_at=None):
+        """
+        Revoke an access token (logout).
+
+        The revocation is stored for other workers and restarts, and takes
+        effect in this process at once. Rows of tokens that have expired
+        since are purged on the way.
+
+        Args:
+            jti: The token's unique identifier
+            expires_at: The token's 'exp' claim in epoch seconds (None: never)
+        """
+        now = datetime.utcnow()
+        self.revoked_token_repo.purge_expired(now)
+        self.revoked_token_repo.add(jti, to_utc_datetime(expires_at))
+        token_blocklist.add(jti, expires_at)
+
     def get_user_by_email(self, email):
         """Get a user by email"""
         return self.user_repo.get_user_by_email(email)
 
+    @invalidates('places')
+    @transactional
     def update_user(self, user_id, user_data):
         """Update a user's information"""
-        user = self.user_repo.get(user_id)
+        # Fresh row: auth_version and the compared fields feed the write
+        user = self._get_fresh(self.user_repo, user_id)
         if not user:
             return None
 
+        # Tokens issued before a credential or privilege change become stale
+        credentials_changed = 'password' in user_data or any(
+            key in user_data and getattr(user, key) != user_data[key]
+            for key in ('email', 'is_admin'))
+
         # Update user attributes
         if 'first_name' in user_data:
             user.first_name = user_data['first_name']
@@ -68,26 +274,36 @@ class HBnBFacade:
             user.last_name = user_data['last_name']
         if 'email' in user_data:
             user.email = user_data['email']
+            login_throttle.forget_unknown(user.email)
         if 'password' in user_data:
             user.hash_password(user_data['password'])
         if 'is_admin' in user_data:
             user.is_admin = user_data['is_admin']
 
+        if credentials_changed:
+            user.auth_version += 1
+            self._auth_versions().delete(user.id)
+
         # Validate the updated user
         user.validate()
         user.save()
+        return user
 
-        # Update in repository
-        self.user_repo.update(user_id, user_data)
+    @transactional
+    def rehash_password(self, user, password):
+        """Re-hash a just-verified password with the current bcrypt cost"""
+        user.hash_password(password)
+        user.save()
         return user
 
     # ===== Place Management Methods =====
 
+    @invalidates('places')
+    @transactional
     def create_place(self, place_data):
         """Create a new place with owner and amenities"""
-        # Validate owner exists
-        owner = self.user_repo.get(place_data['owner_id'])
-        if not owner:
+        # Validate owner exists (free for the authenticated caller)
+        if not self._user_exists(place_data['owner_id']):
             raise ValueError("Owner not found")
 
         # Create place with owner_id
@@ -100,27 +316,124 @@ class HBnBFacade:
             owner_id=place_data['owner_id']
         )
 
-        # Add amenities if provided
+        # Add amenities if provided (one query for all of them)
         if 'amenities' in place_data and place_data['amenities']:
-            for amenity_id in place_data['amenities']:
-                amenity = self.amenity_repo.get(amenity_id)
-                if amenity:
-                    place.amenities.append(amenity)
+            amenities = self._get_many(self.amenity_repo, place_data['amenities'])
+            place.amenities = [
+                amenities[amenity_id] for amenity_id in place_data['amenities']
+                if amenity_id in amenities
+            ]
 
         self.place_repo.add(place)
         return place
 
+    @invalidates('places')
+    @transactional
+    def create_places_bulk(self, places_data, owner_id=None):
+        """
+        Create many places with one validation query per entity type and
+        a single executemany INSERT per table, committed once.
+
+        Args:
+            places_data: List of place dicts (same shape as create_place)
+            owner_id: If given, items owned by anyone else are rejected
+
+        Returns:
+            One result per item, in order:
+            {'index', 'status': 'created', 'id'} or
+            {'index', 'status': 'failed', 'error'}
+        """
+        owners = self._get_many(self.user_repo, [p.get('owner_id') for p in places_data])
+        amenities = self._get_many(self.amenity_repo, [
+            amenity_id for p in places_data for amenity_id in p.get('amenities') or []
+        ])
+
+        results, places, links = [], [], []
+        for index, data in enumerate(places_data):
+            try:
+                if owner_id is not None and data.get('owner_id') != owner_id:
+                    raise ValueError("You can only create places for yourself")
+                if data.get('owner_id') not in owners:
+                    raise ValueError("Owner not found")
+                missing = [a for a in data.get('amenities') or [] if a not in amenities]
+                if missing:
+                    raise ValueError(f"Amenity with ID {missing[0]} not found")
+                place = Place(
+                    title=data.get('title'),
+                    description=data.get('description', ''),
+                    price=data.get('price'),
+                    latitude=data.get('latitude'),
+                    longitude=data.get('longitude'),
+                    owner_id=data['owner_id'],
+                    id=str(uuid.uuid4())
+                )
+            except ValueError as e:
+                results.append({'index': index, 'status': 'failed', 'error': str(e)})
+                continue
+            places.append(place)
+            links.extend((place.id, a) for a in dict.fromkeys(data.get('amenities') or []))
+            results.append({'index': index, 'status': 'created', 'id': place.id})
+
+        self.place_repo.add_many(places)
+        self.place_repo.add_amenity_links(links)
+        return results
+
     def get_place(self, place_id):
         """Get a place by ID"""
-        return self.place_repo.get(place_id)
+        return self._get(self.place_repo, place_id)
 
     def get_all_places(self):
-        """Get all places"""
-        return self.place_repo.get_all()
-
+        """Get all places with owner, amenities and reviews eagerly loaded"""
+        return self.place_repo.get_all_with_details()
+
+    def get_places_page(self, limit=None, cursor=None, fields=None, filters=None, sort=None):
+        """Get one page of places matching the search filters as (places, next_cursor)"""
+        if sort is not None and sort not in self.place_repo.SORT_ORDERS:
+            raise ValueError(
+                f"sort must be one of: {', '.join(sorted(self.place_repo.SORT_ORDERS))}")
+        if filters:
+            if filters.get('amenity_match', 'all') not in ('all', 'any'):
+                raise ValueError("amenity_match must be 'all' or 'any'")
+            min_price, max_price = filters.get('min_price'), filters.get('max_price')
+            if min_price is not None and max_price is not None and min_price > max_price:
+                raise ValueError("min_price must not exceed max_price")
+            min_lat, max_lat = filters.get('min_lat'), filters.get('max_lat')
+            if min_lat is not None and max_lat is not None and min_lat > max_lat:
+                raise ValueError("min_lat must not exceed max_lat")
+        return self.place_repo.get_page_with_details(limit, cursor, fields, filters, sort)
+
+    def get_place_version(self, place_id):
+        """Version of a place and what it embeds, or None if it does not exist"""
+        return self.place_repo.version(place_id)
+
+    def get_places_version(self):
+        """Aggregate version of the place collection (for ETags)"""
+        return self.place_repo.collection_version()
+
+    def iter_places_for_export(self, batch_size=1000):
+        """Stream all places with owner and amenities, batch_size rows at a time"""
+        return self.place_repo.iter_for_export(batch_size)
+
+    def get_places_near(self, latitude, longitude, radius_km, limit=None):
+        """Get places within radius_km of a point as (place, distance_km), nearest first"""
+        if not all(map(math.isfinite, (latitude, longitude, radius_km))):
+            raise ValueError("lat, lon and radius_km must be finite numbers")
+        if not -90 <= latitude <= 90:
+            raise ValueError("lat must be between -90 and 90")
+        if not -180 <= longitude <= 180:
+            raise ValueError("lon must be between -180 and 180")
+        if radius_km <= 0:
+            raise ValueError("radius_km must be a positive number")
+        max_radius_km = current_app.config.get('PLACES_NEAR_MAX_RADIUS_KM', 1000)
+        if radius_km > max_radius_km:
+            raise ValueError(f"radius_km must be at most {max_radius_km}")
+        return self.place_repo.get_near(latitude, longitude, radius_km, limit)
+
+    @invalidates('places')
+    @transactional
     def update_place(self, place_id, place_data):
         """Update a place's information"""
-        place = self.place_repo.get(place_id)
+        place = self._get(self.place_repo, place_id)
         if not place:
             return None
 
@@ -138,50 +451,95 @@ class HBnBFacade:
 
         # Update owner if provided
         if 'owner_id' in place_data:
-            owner = self.user_repo.get(place_data['owner_id'])
-            if not owner:
+            if not self._user_exists(place_data['owner_id']):
                 raise ValueError("Owner not found")
             place.owner_id = place_data['owner_id']
 
-        # Update amenities if provided
+        # Update amenities if provided (one query for all of them)
         if 'amenities' in place_data:
-            place.amenities = []
-            for amenity_id in place_data['amenities']:
-                amenity = self.amenity_repo.get(amenity_id)
-                if amenity:
-                    place.amenities.append(amenity)
+            amenities = self._get_many(self.amenity_repo, place_data['amenities'])
+            place.amenities = [
+                amenities[amenity_id] for amenity_id in place_data['amenities']
+                if amenity_id in amenities
+            ]
 
         # Validate and save
         place.validate()
         place.save()
-
-        # Update in repository
-        self.place_repo.update(place_id, place_data)
         return place
 
+    @invalidates('places')
+    @transactional
+    def delete_place(self, place_id):
+        """Delete a place"""
+        if not self._get(self.place_repo, place_id):
+            return False
+        self.place_repo.delete(place_id)
+        self._forget(Place, place_id)
+        return True
+
     # ===== Amenity Management Methods =====
 
+    @invalidates('amenities')
     def create_amenity(self, amenity_data):
         """Create a new amenity"""
         amenity = Amenity(**amenity_data)
         self.amenity_repo.add(amenity)
         return amenity
 
+    @invalidates('amenities')
+    @transactional
+    def create_amenities_bulk(self, amenities_data):
+        """
+        Create many amenities with one uniqueness query and one INSERT.
+
+        Returns:
+            One result per item, in order (see create_places_bulk)
+        """
+        taken = self.amenity_repo.existing_names(
+            a.get('name') for a in amenities_data if isinstance(a.get('name'), str)
+        )
+        results, amenities = [], []
+        for index, data in enumerate(amenities_data):
+            try:
+                amenity = Amenity(name=data.get('name'), id=str(uuid.uuid4()))
+                if amenity.name in taken:
+                    raise ValueError("Amenity with this name already exists")
+            except ValueError as e:
+                results.append({'index': index, 'status': 'failed', 'error': str(e)})
+                continue
+            taken.add(amenity.name)
+            amenities.append(amenity)
+            results.append({'index': index, 'status': 'created', 'id': amenity.id})
+
+        self.amenity_repo.add_many(amenities)
+        return results
+
     def get_amenity(self, amenity_id):
         """Get an amenity by ID"""
-        return self.amenity_repo.get(amenity_id)
+        return self._get(self.amenity_repo, amenity_id)
 
     def get_all_amenities(self):
         """Get all amenities"""
         return self.amenity_repo.get_all()
 
+    def get_amenities_page(self, limit=None, cursor=None, fields=None):
+        """Get one page of amenities as (amenities, next_cursor)"""
+        return self.amenity_repo.get_page(limit, cursor, fields)
+
+    def get_amenities_version(self):
+        """Aggregate version of the amenity collection (for ETags)"""
+        return self.amenity_repo.collection_version()
+
     def get_amenity_by_name(self, name):
         """Get an amenity by name"""
         return self.amenity_repo.get_by_attribute('name', name)
 
+    @invalidates('amenities', 'places')
+    @transactional
     def update_amenity(self, amenity_id, amenity_data):
         """Update an amenity's information"""
-        amenity = self.amenity_repo.get(amenity_id)
+        amenity = self._get(self.amenity_repo, amenity_id)
         if not amenity:
             return None
 
@@ -192,21 +550,19 @@ class HBnBFacade:
         # Validate the updated amenity
         amenity.validate()
         amenity.save()
-
-        # Update in repository
-        self.amenity_repo.update(amenity_id, amenity_data)
         return amenity
 
     # ===== Review Management Methods =====
 
+    @invalidates('places')
+    @transactional
     def create_review(self, review_data):
         """Create a new review"""
         # Validate that user and place exist
-        user = self.user_repo.get(review_data['user_id'])
-        if not user:
+        if not self._user_exists(review_data['user_id']):
             raise ValueError("User not found")
 
-        place = self.place_repo.get(review_data['place_id'])
+        place = self._get(self.place_repo, review_data['place_id'])
         if not place:
             raise ValueError("Place not found")
 
@@ -218,35 +574,102 @@ class HBnBFacade:
             place_id=review_data['place_id']
         )
 
+        # Committed together with the review, once its INSERT succeeded
         self.review_repo.add(review)
+        place.change_ratings(added=[review.rating])
         return review
 
+    @invalidates('places')
+    @transactional
+    def create_reviews_bulk(self, reviews_data, user_id=None):
+        """
+        Create many reviews with one validation query per entity type, one
+        INSERT and one executemany UPDATE of the place rating aggregates.
+
+        Args:
+            reviews_data: List of review dicts (same shape as create_review)
+            user_id: If given, reviews written as anyone else are rejected
+
+        Returns:
+            One result per item, in order (see create_places_bulk)
+        """
+        users = self._get_many(self.user_repo, [r.get('user_id') for r in reviews_data])
+        places = self._get_many(self.place_repo, [r.get('place_id') for r in reviews_data])
+        seen = self.review_repo.existing_pairs(
+            (r.get('user_id'), r.get('place_id')) for r in reviews_data
+        )
+
+        results, reviews, ratings_by_place = [], [], {}
+        for index, data in enumerate(reviews_data):
+            pair = (data.get('user_id'), data.get('place_id'))
+            try:
+                if user_id is not None and pair[0] != user_id:
+                    raise ValueError("You can only create reviews as yourself")
+                if pair[0] not in users:
+                    raise ValueError("User not found")
+                place = places.get(pair[1])
+                if place is None:
+                    raise ValueError("Place not found")
+                if place.owner_id == pair[0]:
+                    raise ValueError("You cannot review your own place")
+                if pair in seen:
+                    raise ValueError("You have already reviewed this place")
+                review = Review(text=data.get('text'), rating=data.get('rating'),
+                                user_id=pair[0], place_id=pair[1], id=str(uuid.uuid4()))
+            except ValueError as e:
+                results.append({'index': index, 'status': 'failed', 'error': str(e)})
+                continue
+            seen.add(pair)
+            reviews.append(review)
+            ratings_by_place.setdefault(pair[1], []).append(review.rating)
+            results.append({'index': index, 'status': 'created', 'id': review.id})
+
+        self.review_repo.add_many(reviews)
+        self.place_repo.add_ratings_many(ratings_by_place)
+        # The stored aggregates changed behind the ORM's back
+        for place_id in ratings_by_place:
+            self.place_repo.expire(places[place_id])
+        return results
+
     def get_review(self, review_id):
         """Get a review by ID"""
-        return self.review_repo.get(review_id)
+        return self._get(self.review_repo, review_id)
 
     def get_all_reviews(self):
         """Get all reviews"""
         return self.review_repo.get_all()
 
+    def get_reviews_page(self, limit=None, cursor=None, fields=None):
+        """Get one page of reviews as (reviews, next_cursor)"""
+        return self.review_repo.get_page_with_author(limit, cursor, fields)
+
+    def has_reviewed(self, user_id, place_id):
+        """Check whether a user has already reviewed a place"""
+        return self.review_repo.exists_for(user_id, place_id)
+
     def get_reviews_by_place(self, place_id):
         """Get all reviews for a specific place"""
-        place = self.place_repo.get(place_id)
+        place = self._get(self.place_repo, place_id)
         if not place:
             return []
         return place.reviews  # Now works with relationships!
 
+    @invalidates('places')
+    @transactional
     def update_review(self, review_id, review_data):
         """Update a review's information"""
-        review = self.review_repo.get(review_id)
+        # Fresh row: the old rating and place are subtracted from aggregates
+        review = self._get_fresh(self.review_repo, review_id)
         if not review:
             return None
+        old_rating, old_place_id = review.rating, review.place_id
 
-    def update_review(self, review_id, review_data):
-        """Update a review's information"""
-        review = self.review_repo.get(review_id)
-        if not review:
-            return None
+        # Moving the review onto a (user, place) pair that already has one
+        new_pair = (review_data.get('user_id', review.user_id),
+                    review_data.get('place_id', review.place_id))
+        if (new_pair != (review.user_id, review.place_id)
+                and self.review_repo.exists_for(*new_pair)):
+            raise DuplicateReviewError()
 
         # Update basic attributes
         if 'text' in review_data:
@@ -256,30 +679,46 @@ class HBnBFacade:
 
         # Validate and update user_id if provided
         if 'user_id' in review_data:
-            user = self.user_repo.get(review_data['user_id'])
-            if not user:
+            if not self._user_exists(review_data['user_id']):
                 raise ValueError("User not found")
             review.user_id = review_data['user_id']
 
         # Validate and update place_id if provided
         if 'place_id' in review_data:
-            place = self.place_repo.get(review_data['place_id'])
+            place = self._get(self.place_repo, review_data['place_id'])
             if not place:
                 raise ValueError("Place not found")
             review.place_id = review_data['place_id']
 
         # Validate and save
         review.validate()
+        self._move_rating(old_place_id, old_rating, review.place_id, review.rating)
         review.save()
-
-        # Update in repository
-        self.review_repo.update(review_id, review_data)
         return review
 
+    def _move_rating(self, old_place_id, old_rating, new_place_id, new_rating):
+        """Keep place rating aggregates in step with an edited review"""
+        if old_place_id != new_place_id:
+            old_place = self._get(self.place_repo, old_place_id)
+            if old_place:
+                old_place.change_ratings(removed=[old_rating])
+            self._get(self.place_repo, new_place_id).change_ratings(added=[new_rating])
+        elif old_rating != new_rating:
+            self._get(self.place_repo, new_place_id).change_ratings(
+                added=[new_rating], removed=[old_rating])
+
+    @invalidates('places')
+    @transactional
     def delete_review(self, review_id):
         """Delete a review"""
-        review = self.review_repo.get(review_id)
+        # Fresh row: its rating is subtracted from the place aggregates
+        review = self._get_fresh(self.review_repo, review_id)
         if review:
+            place = self._get(self.place_repo, review.place_id)
+            if place:
+                # Committed together with the deletion
+                place.change_ratings(removed=[review.rating])
             self.review_repo.delete(review_id)
+            self._forget(Review, review_id)
             return True
         return False
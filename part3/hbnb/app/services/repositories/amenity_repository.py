@@ -12,3 +12,11 @@ class AmenityRepository(SQLAlchemyRepository):
     def get_by_name(self, name: str):
         """Get amenity by name"""
         return self.get_by_attribute('name', name)
+
+    def existing_names(self, names):
+        """Return the subset of names already taken, with a single query"""
+        names = set(names)
+        if not names:
+            return set()
+        rows = self.model.query.with_entities(Amenity.name).filter(Amenity.name.in_(names))
+        return {name for (name,) in rows}
@@ -1,10 +1,314 @@
 """Place Repository"""
+from sqlalchemy import and_, bindparam, case, func, or_, select
+from sqlalchemy.orm import joinedload, lazyload, selectinload, subqueryload
+
+from hbnb.app.models import place_amenity
 from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
 from hbnb.app.persistence.repository import SQLAlchemyRepository
+from hbnb.app.persistence.routing import replica_read
+from hbnb.app.persistence.unit_of_work import commit
+from hbnb.app.utils.geo import (
+    bounding_box, covering_prefixes, haversine_km, prefix_range
+)
 
 
 class PlaceRepository(SQLAlchemyRepository):
     """Repository for Place entity with SQLAlchemy"""
 
+    # Keyset orders accepted by get_page_with_details(sort=...)
+    SORT_ORDERS = {
+        'created_at': [('created_at', False)],
+        'rating': [('rating_avg', True)],
+    }
+    # Serialized fields computed from several columns (used for projection)
+    DERIVED_FIELDS = {
+        'average_rating': ('review_count', 'rating_sum'),
+        'rating_histogram': tuple(f'rating_count_{r}' for r in range(1, 6)),
+    }
+
     def __init__(self):
         super().__init__(Place)
+
+    def _with_details(self, fields=None):
+        """
+        Build a Place query that eagerly loads everything the API serializes.
+
+        The owner is joined in the main SELECT; amenities and reviews (with
+        their authors joined) each cost one extra query built from the
+        parent query. Subquery loading is used rather than IN-list loading,
+        which is batched and would grow with the number of places.
+
+        Args:
+            fields: If given, only the relationships named in it are loaded;
+                    the others are left lazy (the mapper default for
+                    amenities is subquery loading, so it is overridden).
+        """
+        options = []
+        if not fields or 'owner' in fields:
+            options.append(joinedload(Place.owner))
+        if not fields or 'amenities' in fields:
+            options.append(subqueryload(Place.amenities))
+        else:
+            options.append(lazyload(Place.amenities))
+        if not fields or 'reviews' in fields:
+            options.append(subqueryload(Place.reviews).joinedload(Review.user))
+        return self.model.query.options(*options)
+
+    def apply_filters(self, query, filters):
+        """
+        Translate search filters into SQL conditions on a Place query.
+
+        Supported keys (all optional):
+            min_price, max_price: inclusive price range
+            min_rating: minimum average rating (uses the stored aggregate)
+            owner_id: only places of this owner
+            amenities: list of amenity IDs
+            amenity_match: 'all' (default) or 'any' for the amenity list
+            min_lat, max_lat, min_lon, max_lon: bounding box; when
+                min_lon > max_lon the box crosses the antimeridian
+
+        Returns:
+            The filtered query
+        """
+        if not filters:
+            return query
+
+        if filters.get('owner_id') is not None:
+            query = query.filter(Place.owner_id == filters['owner_id'])
+        if filters.get('min_price') is not None:
+            query = query.filter(Place.price >= filters['min_price'])
+        if filters.get('max_price') is not None:
+            query = query.filter(Place.price <= filters['max_price'])
+        if filters.get('min_rating') is not None:
+            query = query.filter(Place.rating_avg >= filters['min_rating'])
+
+        if filters.get('min_lat') is not None:
+            query = query.filter(Place.latitude >= filters['min_lat'])
+        if filters.get('max_lat') is not None:
+            query = query.filter(Place.latitude <= filters['max_lat'])
+        min_lon, max_lon = filters.get('min_lon'), filters.get('max_lon')
+        if min_lon is not None and max_lon is not None and min_lon > max_lon:
+            query = query.filter(or_(Place.longitude >= min_lon, Place.longitude <= max_lon))
+        else:
+            if min_lon is not None:
+                query = query.filter(Place.longitude >= min_lon)
+            if max_lon is not None:
+                query = query.filter(Place.longitude <= max_lon)
+
+        amenity_ids = set(filters.get('amenities') or [])
+        if amenity_ids:
+            matching = (
+                select(place_amenity.c.place_id)
+                .where(place_amenity.c.amenity_id.in_(amenity_ids))
+            )
+            if filters.get('amenity_match', 'all') == 'all':
+                matching = matching.group_by(place_amenity.c.place_id).having(
+                    func.count(place_amenity.c.amenity_id) == len(amenity_ids)
+                )
+            query = query.filter(Place.id.in_(matching))
+
+        return query
+
+    def add_many(self, places):
+        """Bulk-insert places, filling in the geohash the mapper event would set"""
+        for place in places:
+            place.refresh_geohash()
+        super().add_many(places)
+
+    def add_amenity_links(self, links):
+        """
+        Bulk-insert place/amenity associations.
+
+        Args:
+            links: Iterable of (place_id, amenity_id) pairs
+        """
+        from hbnb.app import db
+        rows = [{'place_id': place_id, 'amenity_id': amenity_id}
+                for place_id, amenity_id in links]
+        if rows:
+            db.session.execute(place_amenity.insert(), rows)
+        commit()
+
+    def add_ratings_many(self, ratings_by_place):
+        """
+        Add many new ratings to the place aggregates with one executemany UPDATE.
+
+        Args:
+            ratings_by_place: Dict mapping place_id -> list of new ratings
+        """
+        from hbnb.app import db
+        if not ratings_by_place:
+            return
+        table = Place.__table__
+        c = table.c
+        new_count = c.review_count + bindparam('n')
+        new_sum = c.rating_sum + bindparam('total')
+        values = {
+            'review_count': new_count,
+            'rating_sum': new_sum,
+            'rating_avg': case((new_count > 0, new_sum * 1.0 / new_count), else_=0.0),
+        }
+        for rating in range(1, 6):
+            column = f'rating_count_{rating}'
+            values[column] = c[column] + bindparam(f'r{rating}')
+        statement = table.update().where(c.id == bindparam('place_id')).values(values)
+        params = []
+        for place_id, ratings in ratings_by_place.items():
+            row = {'place_id': place_id, 'n': len(ratings), 'total': sum(ratings)}
+            row.update({f'r{r}': ratings.count(r) for r in range(1, 6)})
+            params.append(row)
+        db.session.execute(statement, params)
+        for place_id in ratings_by_place:
+            self.invalidate(place_id)
+        commit()
+
+    def iter_for_export(self, batch_size=1000):
+        """
+        Stream every place with its owner and amenities, batch by batch.
+
+        Rows are fetched with yield_per from a server-side cursor: the
+        owner is joined and each batch's amenities are loaded with one IN
+        query, so memory is bounded by the batch size, not the table.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Place objects
+        """
+        from hbnb.app import db
+        # Executed as a 2.0 statement: the legacy Query would uniquify the
+        # joined rows, which cannot be combined with yield_per
+        query = self.model.query.options(
+            joinedload(Place.owner),
+            selectinload(Place.amenities),
+        ).order_by(Place.created_at, Place.id)
+        result = db.session.execute(query.statement,
+                                    execution_options={'yield_per': batch_size})
+        try:
+            for batch in result.scalars().partitions():
+                yield from batch
+        finally:
+            result.close()
+
+    @staticmethod
+    def _related_versions(correlated=True):
+        """Scalar subqueries for MAX(updated_at) of what a place embeds"""
+        from hbnb.app.models.amenity import Amenity
+        from hbnb.app.models.user import User
+        owner = select(func.max(User.updated_at))
+        amenities = select(func.max(Amenity.updated_at))
+        reviews = select(func.max(Review.updated_at))
+        if correlated:
+            owner = owner.where(User.id == Place.owner_id)
+            amenities = amenities.join(
+                place_amenity, place_amenity.c.amenity_id == Amenity.id
+            ).where(place_amenity.c.place_id == Place.id)
+            reviews = reviews.where(Review.place_id == Place.id)
+        return [q.scalar_subquery() for q in (owner, amenities, reviews)]
+
+    @replica_read
+    def version(self, place_id):
+        """
+        Version of one place's representation, for conditional GETs.
+
+        Review and amenity-link changes always update the place row itself
+        (rating aggregates, save()), so the place's updated_at plus the
+        latest updated_at of its owner, amenities and reviews changes
+        whenever the serialized place could. All lookups are index probes.
+
+        Returns:
+            Tuple of datetimes, or None if the place does not exist
+        """
+        from hbnb.app import db
+        row = db.session.query(Place.updated_at, *self._related_versions()).filter(
+            Place.id == place_id).one_or_none()
+        return None if row is None else tuple(row)
+
+    @replica_read
+    def collection_version(self):
+        """Table version (see SQLAlchemyRepository) widened to the embedded tables"""
+        from hbnb.app import db
+        return tuple(db.session.query(
+            *self._table_version(), *self._related_versions(correlated=False)).one())
+
+    @replica_read
+    def get_all_with_details(self):
+        """
+        Retrieve all places with owner, amenities and reviews loaded.
+
+        Returns:
+            List of Place objects
+        """
+        return self._with_details().all()
+
+    def get_page_with_details(self, limit=None, cursor=None, fields=None, filters=None,
+                              sort=None):
+        """
+        Retrieve one keyset page of places with their relationships loaded.
+
+        Args:
+            filters: Search filters, see apply_filters()
+            sort: Key of SORT_ORDERS (default: 'created_at')
+
+        Returns:
+            (places, next_cursor)
+        """
+        query = self.apply_filters(self._with_details(fields), filters)
+        if fields:
+            fields = list(fields) + [
+                column for name in fields for column in self.DERIVED_FIELDS.get(name, ())
+            ]
+        return self.get_page(limit, cursor, fields, query=query,
+                             order_by=self.SORT_ORDERS[sort or 'created_at'])
+
+    @replica_read
+    def get_near(self, latitude, longitude, radius_km, limit=None):
+        """
+        Find places within radius_km of a point, nearest first.
+
+        Candidates are narrowed with geohash prefix ranges, one range scan
+        of the covering idx_places_geohash index per cell, reading only id
+        and coordinates. When the radius is too large for any prefix, the
+        bounding box is used instead. Exact haversine distances are
+        computed for the candidates and only the winning places are
+        loaded in full.
+
+        Returns:
+            List of (place, distance_km) tuples
+        """
+        query = self.model.query.with_entities(Place.id, Place.latitude, Place.longitude)
+
+        prefixes = covering_prefixes(latitude, longitude, radius_km)
+        if prefixes:
+            query = query.filter(or_(*[
+                and_(Place.geohash >= low, Place.geohash < high)
+                for low, high in map(prefix_range, prefixes)
+            ]))
+        else:
+            min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+            query = query.filter(Place.latitude.between(min_lat, max_lat))
+            if min_lon is not None:
+                query = self.apply_filters(query, {'min_lon': min_lon, 'max_lon': max_lon})
+
+        hits = []
+        for place_id, lat, lon in query:
+            distance = haversine_km(latitude, longitude, lat, lon)
+            if distance <= radius_km:
+                hits.append((distance, place_id))
+        hits.sort()
+        if limit is not None:
+            hits = hits[:limit]
+        if not hits:
+            return []
+
+        # The result set is bounded by limit, so IN-list loading is cheaper
+        # here than re-running the candidate query as a subquery
+        places = self.model.query.options(
+            joinedload(Place.owner),
+            selectinload(Place.amenities),
+            selectinload(Place.reviews).joinedload(Review.user),
+        ).filter(Place.id.in_([pid for _, pid in hits]))
+        places = {place.id: place for place in places}
+        return [(places[pid], distance) for distance, pid in hits if pid in places]
@@ -1,6 +1,12 @@
 """Review Repository"""
+from sqlalchemy import exists, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+
 from hbnb.app.models.review import Review
 from hbnb.app.persistence.repository import SQLAlchemyRepository
+from hbnb.app.persistence.unit_of_work import commit, savepoint
+from hbnb.app.services.exceptions import DuplicateReviewError
 
 
 class ReviewRepository(SQLAlchemyRepository):
@@ -8,3 +14,68 @@ class ReviewRepository(SQLAlchemyRepository):
 
     def __init__(self):
         super().__init__(Review)
+
+    def add(self, review):
+        """
+        Add a review, flushing it so a duplicate is detected immediately.
+
+        The INSERT runs in a savepoint: a duplicate only undoes the review,
+        not the rest of an enclosing unit of work.
+
+        Raises:
+            DuplicateReviewError: If the user already reviewed the place
+                                  (enforced by the uq_reviews_user_place index)
+        """
+        try:
+            with savepoint() as session:
+                session.add(review)
+                session.flush()
+        except IntegrityError:
+            if self.exists_for(review.user_id, review.place_id):
+                raise DuplicateReviewError()
+            raise
+        commit()
+
+    def exists_for(self, user_id, place_id):
+        """
+        Check whether a user has reviewed a place.
+
+        A single EXISTS probe on the (user_id, place_id) unique index.
+
+        Returns:
+            True if the review exists
+        """
+        from hbnb.app import db
+        return db.session.query(exists().where(
+            Review.user_id == user_id, Review.place_id == place_id
+        )).scalar()
+
+    def existing_pairs(self, pairs):
+        """
+        Find which (user_id, place_id) pairs already have a review.
+
+        Args:
+            pairs: Iterable of (user_id, place_id) tuples
+
+        Returns:
+            Set of the pairs that exist, fetched with a single query
+        """
+        pairs = set(pairs)
+        if not pairs:
+            return set()
+        rows = self.model.query.with_entities(Review.user_id, Review.place_id).filter(
+            tuple_(Review.user_id, Review.place_id).in_(pairs)
+        )
+        return {(user_id, place_id) for user_id, place_id in rows}
+
+    def get_page_with_author(self, limit=None, cursor=None, fields=None):
+        """
+        Retrieve one keyset page of reviews with their author joined.
+
+        Returns:
+            (reviews, next_cursor)
+        """
+        query = self.model.query
+        if not fields or 'user' in fields:
+            query = query.options(joinedload(Review.user))
+        return self.get_page(limit, cursor, fields, query=query)
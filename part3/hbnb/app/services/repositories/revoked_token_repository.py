@@ -0,0 +1,52 @@
+"""Revoked Token Repository"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from hbnb.app import db
+from hbnb.app.models.revoked_token import RevokedToken
+from hbnb.app.persistence.unit_of_work import commit
+
+
+class RevokedTokenRepository:
+    """
+    Persists the token blocklist so revocations survive restarts and reach
+    every worker. Rows are keyed by jti rather than a UUID id, so this does
+    not extend SQLAlchemyRepository.
+    """
+
+    model = RevokedToken
+
+    def add(self, jti: str, expires_at: datetime | None) -> RevokedToken:
+        """Record a revocation (revoking the same token twice is a no-op)"""
+        token = db.session.get(RevokedToken, jti)
+        if token is None:
+            token = RevokedToken(jti=jti, expires_at=expires_at, revoked_at=datetime.utcnow())
+            db.session.add(token)
+            commit()
+        return token
+
+    def revoked_since(self, since: datetime | None, now: datetime):
+        """
+        Revocations of tokens still valid at now.
+
+        Args:
+            since: Only rows revoked at or after this time (None for all)
+            now: Current UTC time; rows of expired tokens are skipped
+
+        Returns:
+            List of (jti, expires_at, revoked_at) tuples
+        """
+        query = db.session.query(
+            RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at
+        ).filter(db.or_(RevokedToken.expires_at.is_(None), RevokedToken.expires_at > now))
+        if since is not None:
+            query = query.filter(RevokedToken.revoked_at >= since)
+        return [tuple(row) for row in query]
+
+    def purge_expired(self, now: datetime) -> int:
+        """Delete the rows of tokens that have expired; return how many"""
+        deleted = db.session.query(RevokedToken).filter(
+            RevokedToken.expires_at <= now).delete(synchronize_session=False)
+        commit()
+        return deleted
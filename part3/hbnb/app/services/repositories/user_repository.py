@@ -22,4 +22,14 @@ class UserRepository(SQLAlchemyRepository):
         Returns:
             User object if found, None otherwise
         """
-        return self.model.query.filter_by(email=email).first()
+        return self.get_by_attribute('email', email)
+
+    def get_auth_version(self, user_id: str) -> int | None:
+        """
+        Read only the auth_version column of a user.
+
+        Returns:
+            The version, or None if the user does not exist
+        """
+        return self.model.query.with_entities(User.auth_version).filter_by(
+            id=user_id).scalar()
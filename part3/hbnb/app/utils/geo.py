@@ -0,0 +1,123 @@
+"""
+Geospatial helpers: geohash encoding and great-circle distances.
+
+Places store a geohash of their coordinates in an indexed column. Points
+that are close together share a geohash prefix, so a radius search can be
+answered with a handful of index range scans over the cells covering the
+search area instead of a full table scan.
+"""
+from __future__ import annotations
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+GEOHASH_PRECISION = 9
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# First character after the geohash alphabet: prefix <= h < prefix + _UPPER
+_UPPER = "{"
+
+
+def encode_geohash(latitude: float, longitude: float,
+                   precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate as a geohash string of the given length"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    chars = []
+    bits, value, even = 0, 0, True
+    while len(chars) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if longitude >= mid:
+                value = (value << 1) | 1
+                lon_lo = mid
+            else:
+                value <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if latitude >= mid:
+                value = (value << 1) | 1
+                lat_lo = mid
+            else:
+                value <<= 1
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """Return (height, width) in degrees of a geohash cell"""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = (5 * precision) // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlam = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float):
+    """
+    Return (min_lat, max_lat, min_lon, max_lon) enclosing the circle.
+
+    Longitude bounds are None when the circle reaches a pole or spans the
+    whole globe; min_lon > max_lon means the box crosses the antimeridian.
+    """
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    min_lat, max_lat = latitude - dlat, latitude + dlat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), None, None
+    dlon = dlat / math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if dlon >= 180:
+        return min_lat, max_lat, None, None
+    min_lon = (longitude - dlon + 180) % 360 - 180
+    max_lon = (longitude + dlon + 180) % 360 - 180
+    return min_lat, max_lat, min_lon, max_lon
+
+
+def covering_prefixes(latitude: float, longitude: float, radius_km: float,
+                      max_cells: int = 16) -> list[str]:
+    """
+    Geohash prefixes whose cells together cover the circle's bounding box.
+
+    Picks the longest prefix length for which the box is covered by at
+    most max_cells cells and returns those cells. Returns an empty list
+    when no prefix is coarse enough (the caller should fall back to a
+    plain bounding-box scan).
+    """
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    if min_lon is None:
+        return []
+    lon_span = (max_lon - min_lon) % 360
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_size(precision)
+        first_row = math.floor((min_lat + 90) / height)
+        rows = math.floor((max_lat + 90) / height) - first_row + 1
+        first_col = math.floor((min_lon + 180) / width)
+        cols = math.floor((min_lon + lon_span + 180) / width) - first_col + 1
+        if rows * cols > max_cells:
+            continue
+        prefixes = set()
+        for row in range(rows):
+            lat = min((first_row + row + 0.5) * height - 90, 90.0 - 1e-9)
+            for col in range(cols):
+                lon = ((first_col + col + 0.5) * width) % 360 - 180
+                prefixes.add(encode_geohash(lat, lon, precision))
+        return sorted(prefixes)
+    return []
+
+
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """Return the half-open [low, high) string range matching a prefix"""
+    return prefix, prefix + _UPPER
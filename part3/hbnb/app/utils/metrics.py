@@ -0,0 +1,25 @@
+"""
+Registry of runtime counters exposed by GET /api/v1/metrics/.
+
+Components register a callable returning a JSON-serializable dict; the
+endpoint calls every source of the current app on each request.
+"""
+from flask import current_app
+
+
+def register_metrics(app, name, source):
+    """
+    Register a metrics source on app.
+
+    Args:
+        app: Flask application
+        name: Key of the source in the metrics document
+        source: Callable returning a dict of counters
+    """
+    app.extensions.setdefault('hbnb_metrics', {})[name] = source
+
+
+def collect_metrics():
+    """Return {name: counters} for every source of the current app"""
+    sources = current_app.extensions.get('hbnb_metrics', {})
+    return {name: source() for name, source in sources.items()}
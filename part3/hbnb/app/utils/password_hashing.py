@@ -0,0 +1,181 @@
+"""
+Password hashing executor.
+
+bcrypt is deliberately slow. Run inline, a burst of logins occupies every
+worker thread with hashing while cheap requests queue behind it. The
+PasswordHasher sends hashing and verification to a bounded executor
+instead, so at most PASSWORD_HASH_WORKERS hashes run at once:
+
+    'thread'   ThreadPoolExecutor; bcrypt releases the GIL while hashing
+    'process'  ProcessPoolExecutor, created on first use
+    None       Inline in the calling thread (the previous behaviour)
+
+The work itself is done by the Flask-Bcrypt instance, so the other
+BCRYPT_* settings apply unchanged.
+
+Cost factor: with BCRYPT_TARGET_MS set, the number of rounds is calibrated
+to the highest cost whose hash fits the budget on this machine (never
+below BCRYPT_MIN_ROUNDS); otherwise BCRYPT_LOG_ROUNDS is used. Calibration
+hashes a few times, so init_app() runs it on a background thread instead
+of delaying startup or a request; the first hash waits for it if needed.
+The cost is part of every bcrypt hash ($2b$<cost>$...), so needs_rehash()
+can tell which stored hashes were made with a lower cost and login
+upgrades them. Hashes with a higher cost are kept: workers calibrated on
+different machines would otherwise rewrite each other's hashes at every
+login, some of them downgrading the cost.
+"""
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from hbnb.app.utils.metrics import register_metrics
+
+_EXECUTORS = {'thread': ThreadPoolExecutor, 'process': ProcessPoolExecutor}
+
+# bcrypt accepts costs 4..31; each extra round doubles the work
+MIN_COST, MAX_COST = 4, 31
+CALIBRATION_COST = 8
+
+
+def hash_cost(pw_hash):
+    """Return the cost factor recorded in a bcrypt hash, or None if unreadable"""
+    try:
+        return int(pw_hash.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def calibrate_rounds(bcrypt, target_ms, min_rounds=MIN_COST, samples=3):
+    """
+    Find the highest cost whose hash takes at most target_ms here.
+
+    Times a few hashes at a cheap cost and extrapolates, since every
+    additional round doubles the time.
+
+    Args:
+        bcrypt: Flask-Bcrypt instance
+        target_ms: Latency budget for one hash
+        min_rounds: Lower bound on the result
+
+    Returns:
+        Number of log rounds
+    """
+    fastest = math.inf
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.generate_password_hash('calibration', CALIBRATION_COST)
+        fastest = min(fastest, time.perf_counter() - start)
+    ratio = target_ms / 1000 / max(fastest, 1e-6)
+    rounds = CALIBRATION_COST + (math.floor(math.log2(ratio)) if ratio > 0 else -MAX_COST)
+    return max(min_rounds, MIN_COST, min(MAX_COST, rounds))
+
+
+class PasswordHasher:
+    """Runs Flask-Bcrypt hashing on a bounded executor and counts the queue"""
+
+    def __init__(self, bcrypt):
+        self._bcrypt = bcrypt
+        self._executor = None
+        self._executor_class = None
+        self.workers = 0
+        self._rounds = 12
+        self._calibration = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+
+    def init_app(self, app):
+        """Configure the executor from app.config (last app initialized wins)"""
+        kind = app.config.get('PASSWORD_HASH_EXECUTOR', 'thread')
+        if kind not in (None, *_EXECUTORS):
+            raise ValueError(f"Unknown PASSWORD_HASH_EXECUTOR: {kind!r}")
+        self.shutdown()
+        self._executor_class = _EXECUTORS.get(kind)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS') or os.cpu_count() or 1
+        target_ms = app.config.get('BCRYPT_TARGET_MS')
+        if target_ms:
+            self._rounds = None
+            self._calibration = threading.Thread(
+                target=self._calibrate, name='bcrypt-calibration', daemon=True,
+                args=(target_ms, app.config.get('BCRYPT_MIN_ROUNDS', MIN_COST)))
+            self._calibration.start()
+        else:
+            self._rounds = app.config.get('BCRYPT_LOG_ROUNDS', 12)
+            self._calibration = None
+        register_metrics(app, 'password_hashing', self.stats)
+
+    def _calibrate(self, target_ms, min_rounds):
+        rounds = calibrate_rounds(self._bcrypt, target_ms, min_rounds)
+        # A later init_app() or an explicit setting supersedes this run
+        if self._calibration is threading.current_thread():
+            self._rounds = rounds
+
+    @property
+    def rounds(self):
+        """bcrypt cost of new hashes, waiting for a calibration in progress"""
+        calibration = self._calibration
+        if self._rounds is None and calibration is not None:
+            calibration.join()
+        return self._rounds
+
+    @rounds.setter
+    def rounds(self, rounds):
+        self._calibration = None
+        self._rounds = rounds
+
+    def shutdown(self):
+        """Stop the current executor; queued work still completes"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @property
+    def queue_depth(self):
+        """Requests waiting for a free hashing worker"""
+        return max(0, self.in_flight - self.workers) if self._executor_class else 0
+
+    def hash(self, password):
+        """Return the bcrypt hash of password, at the current cost, as a str"""
+        return self._run(
+            self._bcrypt.generate_password_hash, password, self.rounds).decode('utf-8')
+
+    def verify(self, pw_hash, password):
+        """Check password against a bcrypt hash in constant time"""
+        return self._run(self._bcrypt.check_password_hash, pw_hash, password)
+
+    def needs_rehash(self, pw_hash):
+        """True if pw_hash was made with a lower cost than the current one"""
+        cost = hash_cost(pw_hash)
+        return cost is None or cost < self.rounds
+
+    def _run(self, func, *args):
+        if self._executor_class is None:
+            return func(*args)
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._executor_class(max_workers=self.workers)
+            executor = self._executor
+            self.in_flight += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            return executor.submit(func, *args).result()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+
+    def stats(self):
+        """Counters for the metrics endpoint"""
+        return {
+            'executor': self._executor_class.__name__ if self._executor_class else 'inline',
+            'workers': self.workers,
+            # None while the cost is being calibrated
+            'bcrypt_rounds': self._rounds,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queue_depth,
+            'peak_queue_depth': self.peak_queue_depth,
+            'completed': self.completed,
+        }
@@ -0,0 +1,246 @@
+"""
+Login throttling: token buckets per client IP and per email, plus a
+short-lived negative cache of emails that match no user.
+
+Every login attempt takes one token from the bucket of its IP and one
+from the bucket of its email before any database lookup or bcrypt work;
+an empty bucket answers 429 straight away, and the token already taken
+from the IP bucket is given back: hammering one locked email must not
+use up the budget of every other account behind the same IP (e.g. a
+shared NAT). Buckets refill continuously, so a burst of LOGIN_*_BURST
+attempts is allowed, then LOGIN_*_PER_MINUTE.
+
+Backends (LOGIN_THROTTLE_BACKEND):
+    memory  Per-process buckets (each worker throttles on its own)
+    redis   Buckets shared by every worker, updated atomically with a Lua
+            script; needs LOGIN_THROTTLE_URL
+    None    Throttling disabled
+
+Any object with take(key, capacity, rate) -> (allowed, retry_after) can
+be plugged in with LoginThrottle.use_backend(), e.g. a local stand-in;
+refund(key, capacity) is used when the backend has it.
+
+The unknown-email cache is always in-process with a short TTL
+(LOGIN_UNKNOWN_EMAIL_TTL); the facade clears an email from it when a
+user registers with it or changes to it in this process. It is keyed on
+the exact email looked up, since user lookups are case-sensitive: a miss
+for 'alice@example.com' says nothing about 'Alice@Example.com'. Buckets
+are keyed on the normalized email, so case variants share one limit.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from hbnb.app.persistence.cache import MemoryCacheBackend
+from hbnb.app.utils.metrics import register_metrics
+
+
+class MemoryBucketBackend:
+    """Thread-safe token buckets, least recently used dropped beyond max_keys"""
+
+    def __init__(self, max_keys=100000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate):
+        """
+        Take one token from the bucket under key.
+
+        Args:
+            key: Bucket identifier
+            capacity: Bucket size (allowed burst)
+            rate: Tokens added per second
+
+        Returns:
+            (allowed, retry_after_seconds)
+        """
+        with self._lock:
+            now = self._clock()
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                allowed, retry_after = True, 0.0
+            else:
+                allowed, retry_after = False, (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return allowed, retry_after
+
+    def refund(self, key, capacity):
+        """Give back a token taken from the bucket under key"""
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated = self._buckets[key]
+                self._buckets[key] = (min(capacity, tokens + 1), updated)
+
+
+class RedisBucketBackend:
+    """Token buckets shared through Redis"""
+
+    SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed, retry = 0, 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(retry)}
+"""
+
+    REFUND_SCRIPT = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+    redis.call('HSET', KEYS[1], 'tokens', math.min(tonumber(ARGV[1]), tokens + 1))
+end
+return 0
+"""
+
+    def __init__(self, client, prefix='hbnb:login:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        """Connect with redis-py, which is only needed for this backend"""
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "LOGIN_THROTTLE_BACKEND='redis' requires the redis package") from e
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def take(self, key, capacity, rate):
+        """Take one token from the shared bucket; see MemoryBucketBackend.take"""
+        allowed, retry_after = self.client.eval(
+            self.SCRIPT, 1, self.prefix + key, capacity, rate, time.time())
+        return bool(int(allowed)), float(retry_after)
+
+    def refund(self, key, capacity):
+        """Give back a token to the shared bucket; see MemoryBucketBackend.refund"""
+        self.client.eval(self.REFUND_SCRIPT, 1, self.prefix + key, capacity)
+
+
+class LoginThrottle:
+    """Decides whether a login attempt may reach the database and bcrypt"""
+
+    def __init__(self):
+        self.backend = None
+        self.unknown_emails = None
+        self._limits = {}
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.attempts = 0
+        self.throttled_ip = 0
+        self.throttled_email = 0
+        self.unknown_email_hits = 0
+
+    def init_app(self, app):
+        """Configure from app.config (last app initialized wins)"""
+        self._reset_counters()
+        self._limits = {
+            'ip': (app.config.get('LOGIN_IP_BURST', 20),
+                   app.config.get('LOGIN_IP_PER_MINUTE', 10) / 60),
+            'email': (app.config.get('LOGIN_EMAIL_BURST', 5),
+                      app.config.get('LOGIN_EMAIL_PER_MINUTE', 1) / 60),
+        }
+        backend = app.config.get('LOGIN_THROTTLE_BACKEND')
+        if backend == 'memory':
+            self.backend = MemoryBucketBackend()
+        elif backend == 'redis':
+            self.backend = RedisBucketBackend.from_url(app.config['LOGIN_THROTTLE_URL'])
+        elif backend is None:
+            self.backend = None
+        else:
+            raise ValueError(f"Unknown LOGIN_THROTTLE_BACKEND: {backend!r}")
+
+        ttl = app.config.get('LOGIN_UNKNOWN_EMAIL_TTL', 30)
+        self.unknown_emails = MemoryCacheBackend(max_entries=100000) if ttl else None
+        self._unknown_ttl = ttl
+        register_metrics(app, 'login_throttle', self.stats)
+
+    def use_backend(self, backend):
+        """Replace the bucket backend (e.g. with a shared or stand-in one)"""
+        self.backend = backend
+
+    @staticmethod
+    def _normalize(email):
+        return email.strip().lower()
+
+    def check(self, ip, email):
+        """
+        Count an attempt and take a token for its IP and its email.
+
+        A refused attempt takes no token: the IP token is given back when
+        the email bucket is empty.
+
+        Returns:
+            Seconds to wait before retrying, or None if the attempt may proceed
+        """
+        self.attempts += 1
+        if self.backend is None:
+            return None
+        taken = []
+        for kind, key in (('ip', ip), ('email', self._normalize(email))):
+            capacity, rate = self._limits[kind]
+            allowed, retry_after = self.backend.take(f'{kind}:{key}', capacity, rate)
+            if not allowed:
+                if kind == 'ip':
+                    self.throttled_ip += 1
+                else:
+                    self.throttled_email += 1
+                self._refund(taken)
+                return retry_after
+            taken.append((f'{kind}:{key}', capacity))
+        return None
+
+    def _refund(self, taken):
+        refund = getattr(self.backend, 'refund', None)
+        if refund is not None:
+            for key, capacity in taken:
+                refund(key, capacity)
+
+    def is_unknown(self, email):
+        """True if email recently matched no user"""
+        if self.unknown_emails is None:
+            return False
+        if self.unknown_emails.get(email):
+            self.unknown_email_hits += 1
+            return True
+        return False
+
+    def remember_unknown(self, email):
+        """Cache that email matches no user"""
+        if self.unknown_emails is not None:
+            self.unknown_emails.set(email, True, self._unknown_ttl)
+
+    def forget_unknown(self, email):
+        """Drop email from the unknown-email cache (a user now has it)"""
+        if self.unknown_emails is not None and isinstance(email, str):
+            self.unknown_emails.delete(email)
+
+    def stats(self):
+        """Counters for the metrics endpoint"""
+        return {
+            'backend': type(self.backend).__name__ if self.backend else None,
+            'attempts': self.attempts,
+            'throttled_ip': self.throttled_ip,
+            'throttled_email': self.throttled_email,
+            'unknown_email_hits': self.unknown_email_hits,
+            'shed': self.throttled_ip + self.throttled_email + self.unknown_email_hits,
+        }
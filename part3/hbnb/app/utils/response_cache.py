@@ -0,0 +1,210 @@
+"""
+Full-response cache for public, read-mostly GET endpoints.
+
+A cached endpoint's serialized body, status and headers are stored under
+its path plus normalized query string (arguments sorted, blanks dropped),
+so a hit skips the queries and the JSON encoding altogether:
+
+    @api.route('/')
+    class AmenityList(Resource):
+        @cached_response('amenities')
+        def get(self): ...
+
+Entries belong to a group ('places', 'amenities'). Every group has a
+generation token that is part of each key; the facade write methods are
+decorated with invalidates(...) and replace the token after their
+transaction commits, which makes every older entry unreachable at once
+(the LRU reclaims them). A request that read the database before the
+write stores its body under the old token, so it cannot bring stale data
+back. With the memory backend each worker only sees its own writes and
+RESPONSE_CACHE_TTL bounds staleness after writes elsewhere; with the
+redis backend the tokens, and so the invalidations, are shared.
+
+Responses carry Cache-Control (RESPONSE_CACHE_CONTROL) and X-Cache
+(HIT/MISS). A request sent with Cache-Control: no-cache skips the lookup
+and refreshes the entry. If-None-Match is answered with 304 from the
+cached ETag.
+
+Configuration (see config.py):
+    RESPONSE_CACHE_BACKEND      'memory', 'redis' or None to disable
+    RESPONSE_CACHE_TTL          Seconds an entry stays valid
+    RESPONSE_CACHE_MAX_ENTRIES  LRU capacity of the memory backend
+    RESPONSE_CACHE_URL          Redis URL for the redis backend
+    RESPONSE_CACHE_CONTROL      Cache-Control header of cached endpoints
+"""
+import uuid
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import Response, current_app, has_app_context, request
+
+from hbnb.app.persistence.cache import MemoryCacheBackend, RedisCacheBackend
+from hbnb.app.persistence.unit_of_work import on_commit
+from hbnb.app.serializers import output_json
+from hbnb.app.utils.metrics import register_metrics
+
+# Response headers worth replaying on a hit
+_STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Link', 'X-Next-Cursor')
+# Generation tokens must outlive every entry keyed on them
+_GENERATION_TTL = 10 * 365 * 24 * 3600
+
+
+class ResponseCache:
+    """Serialized responses keyed by group generation, path and query string"""
+
+    def __init__(self, backend, ttl=60, cache_control=None):
+        self.backend = backend
+        self.ttl = ttl
+        self.cache_control = cache_control
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+        self.bytes_served = 0
+
+    def generation(self, group):
+        """Current generation token of group (created on first use)"""
+        key = f'gen:{group}'
+        token = self.backend.get(key)
+        if token is None:
+            token = uuid.uuid4().hex
+            self.backend.set(key, token, _GENERATION_TTL)
+        return token
+
+    def invalidate(self, *groups):
+        """Make every entry of the groups unreachable"""
+        for group in groups:
+            self.invalidations += 1
+            self.backend.set(f'gen:{group}', uuid.uuid4().hex, _GENERATION_TTL)
+
+    @staticmethod
+    def request_key(group, generation):
+        """Key of the current request: path plus normalized query string"""
+        args = sorted((k, v) for k, v in request.args.items(multi=True) if v != '')
+        return f'{group}:{generation}:{request.path}?{urlencode(args)}'
+
+    def get(self, key):
+        entry = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.bytes_served += len(entry[1])
+        return entry
+
+    def set(self, key, response):
+        """Store a 200 response (status, body, replayable headers)"""
+        headers = [(name, response.headers[name])
+                   for name in _STORED_HEADERS if name in response.headers]
+        self.backend.set(key, (response.status_code, response.get_data(), headers), self.ttl)
+        self.stores += 1
+
+    def stats(self):
+        """Counters for the metrics endpoint"""
+        lookups = self.hits + self.misses
+        stats = {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            'stores': self.stores,
+            'invalidations': self.invalidations,
+            'bytes_saved': self.bytes_served,
+        }
+        if isinstance(self.backend, MemoryCacheBackend):
+            stats['entries'] = len(self.backend)
+            stats['evictions'] = self.backend.evictions
+        return stats
+
+
+def get_response_cache():
+    """Return the current app's response cache, or None if disabled"""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('hbnb_response_cache')
+
+
+def _unpack(result):
+    """(data, code, headers) from a Resource method's return value"""
+    if not isinstance(result, tuple):
+        return result, 200, None
+    data, code, headers = (*result, None, None)[:3]
+    return data, code or 200, headers
+
+
+def _finish(response, cache, state):
+    if cache.cache_control:
+        response.headers['Cache-Control'] = cache.cache_control
+    response.headers['X-Cache'] = state
+    return response
+
+
+def cached_response(group):
+    """Serve the decorated GET method from the response cache of group"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_response_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            # Read the generation before the database: see the module docstring
+            key = cache.request_key(group, cache.generation(group))
+            no_cache = 'no-cache' in request.headers.get('Cache-Control', '')
+            entry = None if no_cache else cache.get(key)
+            if entry is not None:
+                status, body, headers = entry
+                etag = dict(headers).get('ETag')
+                if etag and request.if_none_match.contains_weak(etag.strip('"')):
+                    return _finish(Response(status=304, headers=[
+                        h for h in headers if h[0] != 'Content-Type']), cache, 'HIT')
+                return _finish(Response(body, status=status, headers=headers), cache, 'HIT')
+
+            result = func(*args, **kwargs)
+            if isinstance(result, Response):
+                return _finish(result, cache, 'MISS')   # e.g. a 304 from the view
+            response = output_json(*_unpack(result))
+            response.headers['Content-Type'] = 'application/json'
+            if response.status_code == 200:
+                cache.set(key, response)
+            return _finish(response, cache, 'MISS')
+        return wrapper
+    return decorator
+
+
+def invalidates(*groups):
+    """
+    Invalidate the cached responses of groups once the decorated write
+    is committed: when it returns, or when the outermost unit of work
+    around it (e.g. facade.transaction()) commits.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            cache = get_response_cache()
+            if cache is not None:
+                on_commit(lambda: cache.invalidate(*groups))
+            return result
+        return wrapper
+    return decorator
+
+
+def init_response_cache(app):
+    """Create the cache configured for app and register it on app.extensions"""
+    backend_name = app.config.get('RESPONSE_CACHE_BACKEND')
+    if not backend_name:
+        return None
+    if backend_name == 'memory':
+        backend = MemoryCacheBackend(app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 1000))
+    elif backend_name == 'redis':
+        backend = RedisCacheBackend.from_url(
+            app.config['RESPONSE_CACHE_URL'], prefix='hbnb:response:')
+    else:
+        raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {backend_name!r}")
+
+    cache = ResponseCache(backend, ttl=app.config.get('RESPONSE_CACHE_TTL', 60),
+                          cache_control=app.config.get('RESPONSE_CACHE_CONTROL'))
+    app.extensions['hbnb_response_cache'] = cache
+    register_metrics(app, 'response_cache', cache.stats)
+    return cache
@@ -0,0 +1,94 @@
+"""
+Startup profile: how long create_app() spends in each step.
+
+create_app() runs every initialization step and namespace import inside
+StartupProfile.step(). With STARTUP_PROFILE enabled (or HBNB_STARTUP_PROFILE
+set in the environment) each step records its wall time and the modules
+it imported for the first time, the total, and the time to the first
+response. The report is logged when the first request completes and is
+served under 'startup' by the metrics endpoint. Disabled, step() does
+nothing.
+"""
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """Per-step timings of one create_app() call"""
+
+    def __init__(self, enabled=False, clock=time.perf_counter):
+        self.enabled = enabled
+        self._clock = clock
+        self.started = clock()
+        self.steps = []
+        self.total = None
+        self.first_request = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def step(self, name):
+        """Time the block as one step"""
+        if not self.enabled:
+            yield
+            return
+        before = set(sys.modules)
+        start = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            imported = sorted(set(sys.modules) - before)
+            self.steps.append((name, elapsed, imported))
+
+    def finish(self):
+        """Mark the end of create_app()"""
+        if self.enabled:
+            self.total = self._clock() - self.started
+
+    def first_response(self, app):
+        """Record the time to the first response, then log the report"""
+        with self._lock:
+            if self.first_request is not None:
+                return
+            self.first_request = self._clock() - self.started
+        app.logger.info("Startup profile:\n%s", self.report())
+
+    def report(self):
+        """Human-readable table of the steps, slowest first"""
+        lines = [f"{'step':<40} {'ms':>8} {'new modules':>12}"]
+        for name, elapsed, imported in sorted(self.steps, key=lambda s: -s[1]):
+            lines.append(f"{name:<40} {elapsed * 1000:>8.1f} {len(imported):>12}")
+        if self.total is not None:
+            lines.append(f"{'create_app total':<40} {self.total * 1000:>8.1f}")
+        if self.first_request is not None:
+            lines.append(f"{'time to first response':<40} {self.first_request * 1000:>8.1f}")
+        return '\n'.join(lines)
+
+    def stats(self):
+        """Timings for the metrics endpoint"""
+        return {
+            'steps': {name: round(elapsed * 1000, 3) for name, elapsed, _ in self.steps},
+            'create_app_ms': None if self.total is None else round(self.total * 1000, 3),
+            'first_response_ms': (None if self.first_request is None
+                                  else round(self.first_request * 1000, 3)),
+        }
+
+
+def init_startup_profile(app, profile):
+    """Attach profile to app: metrics source and first-response hook"""
+    from hbnb.app.utils.metrics import register_metrics
+
+    app.extensions['hbnb_startup'] = profile
+    if not profile.enabled:
+        return profile
+    register_metrics(app, 'startup', profile.stats)
+
+    @app.after_request
+    def _record_first_response(response):
+        if profile.first_request is None:
+            profile.first_response(app)
+        return response
+
+    return profile
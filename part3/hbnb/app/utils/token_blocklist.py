@@ -0,0 +1,202 @@
+"""
+Token blocklist: revoked JWTs, checked on every protected request.
+
+Flask-JWT-Extended calls TokenBlocklist.check_payload() for each token it
+verifies (registered with token_in_blocklist_loader in extensions.py), so
+the check must not cost a query. Revoked jtis live in memory:
+
+    bloom filter  Compact bit array answering "definitely not revoked" for
+                  almost every token in a few hash probes
+    exact set     {jti: expiry} consulted only when the filter says
+                  "maybe", which rules out the filter's false positives
+
+Revocations are persisted in the revoked_tokens table. A worker loads the
+unexpired rows on its first check and then pulls the rows revoked since
+its last sync every TOKEN_BLOCKLIST_SYNC_INTERVAL seconds, so a logout
+handled by another worker (or before a restart) is honoured within that
+interval; one made by this worker is honoured at once.
+
+Entries are only needed until the token expires: at each sync expired
+entries are dropped and the filter is rebuilt from the exact set, and the
+facade deletes expired rows whenever it records a new revocation.
+"""
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from hbnb.app.utils.metrics import register_metrics
+
+# Rows committed by another worker just before a sync may carry a
+# revoked_at slightly older than the sync; re-read that window each time
+_SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def to_utc_datetime(timestamp):
+    """Naive UTC datetime for an epoch timestamp (None stays None)"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def to_timestamp(value):
+    """Epoch timestamp for a naive UTC datetime (None stays None)"""
+    if value is None:
+        return None
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings, sized for capacity and error_rate"""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        """Add key to the filter"""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        bits = self._bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self):
+        return len(self._bits)
+
+
+class TokenBlocklist:
+    """Answers whether a token's jti was revoked, without touching the database"""
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._source = None
+        self.capacity = 100000
+        self.error_rate = 0.001
+        self.sync_interval = 30
+        self._reset()
+
+    def _reset(self):
+        self._entries = {}
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._next_sync = None      # None: nothing loaded yet
+        self._synced_at = None
+        self.checks = 0
+        self.maybe = 0
+        self.false_positives = 0
+        self.revoked_hits = 0
+        self.syncs = 0
+
+    def init_app(self, app):
+        """Configure from app.config (last app initialized wins)"""
+        self.capacity = app.config.get('TOKEN_BLOCKLIST_CAPACITY', 100000)
+        self.error_rate = app.config.get('TOKEN_BLOCKLIST_ERROR_RATE', 0.001)
+        self.sync_interval = app.config.get('TOKEN_BLOCKLIST_SYNC_INTERVAL', 30)
+        self._reset()
+        register_metrics(app, 'token_blocklist', self.stats)
+
+    def use_source(self, source):
+        """
+        Set where persisted revocations are read from.
+
+        Args:
+            source: Callable (since, now) -> [(jti, expires_at, revoked_at)]
+                with naive UTC datetimes; since is None for a full load
+        """
+        self._source = source
+
+    def add(self, jti, expires_at=None):
+        """
+        Block a token in this process.
+
+        Args:
+            jti: The token's unique identifier
+            expires_at: Epoch seconds when the token expires (None: never)
+        """
+        with self._lock:
+            self._add(jti, expires_at)
+
+    def _add(self, jti, expires_at):
+        self._entries[jti] = expires_at
+        if len(self._entries) > self._bloom.capacity:
+            self._rebuild(self._bloom.capacity * 2)
+        else:
+            self._bloom.add(jti)
+
+    def _rebuild(self, capacity):
+        bloom = BloomFilter(max(capacity, self.capacity), self.error_rate)
+        for jti in self._entries:
+            bloom.add(jti)
+        self._bloom = bloom
+
+    def is_revoked(self, jti):
+        """True if the token was revoked and has not expired yet"""
+        self.checks += 1
+        if self._source is not None and (
+                self._next_sync is None or self._clock() >= self._next_sync):
+            self.sync()
+        if jti not in self._bloom:
+            return False
+        self.maybe += 1
+        try:
+            # One lookup: a concurrent sync() may drop the entry at any time
+            expires_at = self._entries[jti]
+        except KeyError:
+            self.false_positives += 1
+            return False
+        if expires_at is not None and expires_at <= self._clock():
+            return False
+        self.revoked_hits += 1
+        return True
+
+    def check_payload(self, jwt_header, jwt_payload):
+        """token_in_blocklist_loader callback"""
+        return self.is_revoked(jwt_payload['jti'])
+
+    def sync(self):
+        """Pull new revocations from the source and drop expired entries"""
+        with self._lock:
+            now = self._clock()
+            since = None if self._synced_at is None else self._synced_at - _SYNC_OVERLAP
+            started_at = to_utc_datetime(now)
+            for jti, expires_at, _ in self._source(since, started_at):
+                self._add(jti, to_timestamp(expires_at))
+            expired = [jti for jti, exp in self._entries.items()
+                       if exp is not None and exp <= now]
+            if expired:
+                for jti in expired:
+                    del self._entries[jti]
+                self._rebuild(self._bloom.capacity)
+            self._synced_at = started_at
+            # None: load once, then rely on this process's own revocations
+            self._next_sync = math.inf if self.sync_interval is None else now + self.sync_interval
+            self.syncs += 1
+
+    def stats(self):
+        """Counters for the metrics endpoint"""
+        return {
+            'entries': len(self._entries),
+            'filter_bytes': self._bloom.nbytes,
+            'checks': self.checks,
+            'maybe': self.maybe,
+            'false_positives': self.false_positives,
+            'revoked_hits': self.revoked_hits,
+            'syncs': self.syncs,
+        }
@@ -69,6 +69,10 @@ CREATE TABLE IF NOT EXISTS place_amenity (
 
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_places_owner_id ON places(owner_id);
+CREATE INDEX IF NOT EXISTS idx_places_owner_price ON places(owner_id, price);
+CREATE INDEX IF NOT EXISTS idx_places_price ON places(price);
+CREATE INDEX IF NOT EXISTS idx_places_lat_lon ON places(latitude, longitude);
+CREATE INDEX IF NOT EXISTS idx_place_amenity_amenity_id ON place_amenity(amenity_id, place_id);
 CREATE INDEX IF NOT EXISTS idx_reviews_user_id ON reviews(user_id);
 CREATE INDEX IF NOT EXISTS idx_reviews_place_id ON reviews(place_id);
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
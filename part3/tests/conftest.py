@@ -0,0 +1,112 @@
+"""
+Shared fixtures for the hbnb application tests.
+"""
+import pytest
+from sqlalchemy import event
+
+from config import TestingConfig
+from hbnb.app import create_app, db
+from hbnb.app.api.v1.security import create_token
+from hbnb.app.models.user import User
+
+
+@pytest.fixture
+def app():
+    """Create an hbnb app bound to a fresh in-memory database"""
+    app = create_app("config.TestingConfig")
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def two_workers(tmp_path):
+    """Two apps (worker processes, each with its own caches) on one database"""
+    class Config(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'shared.db'}"
+
+    workers = (create_app(Config), create_app(Config))
+    with workers[0].app_context():
+        db.create_all()
+    yield workers
+    for worker in workers:
+        with worker.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+
+@pytest.fixture
+def hbnb_client(app):
+    """Flask test client for the hbnb app"""
+    return app.test_client()
+
+
+class QueryCounter:
+    """Collect every SQL statement sent to the engine while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+        self.executions = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.executions.append((statement, parameters))
+
+    def __enter__(self):
+        self.statements = []
+        self.executions = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    @property
+    def selects(self):
+        return [s for s in self.statements if s.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.fixture
+def count_queries(app):
+    """Return a factory for QueryCounter context managers"""
+    return lambda: QueryCounter(db.engine)
+
+
+@pytest.fixture
+def count_commits(app):
+    """Collect one entry per COMMIT issued on the engine"""
+    commits = []
+
+    def _record(conn):
+        commits.append(conn)
+
+    event.listen(db.engine, 'commit', _record)
+    yield commits
+    event.remove(db.engine, 'commit', _record)
+
+
+@pytest.fixture
+def make_user(app):
+    """Return a factory that stores a user (password 'x', not hashed)"""
+    def _make_user(email, is_admin=False):
+        user = User(first_name="Test", last_name="User", email=email, is_admin=is_admin)
+        user.password = "x"
+        db.session.add(user)
+        db.session.commit()
+        return user
+    return _make_user
+
+
+@pytest.fixture
+def auth_headers(app):
+    """Return a factory building an Authorization header for a user"""
+    def _auth_headers(user):
+        return {'Authorization': f'Bearer {create_token(user)}'}
+    return _auth_headers
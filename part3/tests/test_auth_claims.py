@@ -0,0 +1,99 @@
+"""
+Claims-first authorization with the auth_version stamp.
+"""
+from flask_jwt_extended import create_access_token
+
+from hbnb.app import db
+from hbnb.app.api.v1.security import create_token
+from hbnb.app.services import facade
+
+
+def _amenity(client, headers, name='Wi-Fi'):
+    return client.post('/api/v1/amenities/', headers=headers, json={'name': name})
+
+
+def test_current_token_is_authorized_without_loading_the_user(
+        app, hbnb_client, make_user, auth_headers, count_queries):
+    admin = make_user("admin@example.com", is_admin=True)
+    headers = auth_headers(admin)
+    db.session.remove()
+
+    with count_queries() as counter:
+        assert _amenity(hbnb_client, headers).status_code == 201
+    assert not [s for s in counter.selects if 'FROM users' in s]
+
+
+def test_demoted_admin_token_loses_admin_rights(app, hbnb_client, make_user, auth_headers):
+    admin = make_user("admin@example.com", is_admin=True)
+    headers = auth_headers(admin)
+    facade.update_user(admin.id, {'is_admin': False})
+    db.session.remove()
+
+    assert _amenity(hbnb_client, headers).status_code == 403
+
+
+def test_profile_edit_keeps_tokens_current(app, make_user):
+    user = make_user("ann@example.com")
+    version = user.auth_version
+    facade.update_user(user.id, {'first_name': 'Anna'})
+    assert facade.get_auth_version(user.id) == version
+    facade.update_user(user.id, {'password': 'new-password'})
+    assert facade.get_auth_version(user.id) == version + 1
+
+
+def test_token_of_deleted_user_is_rejected(app, hbnb_client, make_user, auth_headers):
+    user = make_user("ann@example.com")
+    headers = auth_headers(user)
+    facade.user_repo.delete(user.id)
+    app.extensions['hbnb_auth_versions'].clear()
+    db.session.remove()
+
+    assert _amenity(hbnb_client, headers).status_code == 401
+
+
+def test_unstamped_token_falls_back_to_the_database(app, hbnb_client, make_user):
+    admin = make_user("admin@example.com", is_admin=True)
+    token = create_access_token(identity=admin.id, additional_claims={'is_admin': False})
+    headers = {'Authorization': f'Bearer {token}'}
+    assert _amenity(hbnb_client, headers).status_code == 201
+
+
+def test_stale_token_is_checked_against_the_stored_user(two_workers):
+    worker_a, worker_b = two_workers
+    with worker_a.app_context():
+        admin = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                                    'email': 'admin@example.com', 'password': 'x',
+                                    'is_admin': True})
+        admin_id = admin.id
+        token = create_token(admin)
+        db.session.remove()
+    with worker_b.app_context():
+        facade.get_user(admin_id)           # snapshot cached as an admin
+        db.session.remove()
+    with worker_a.app_context():
+        facade.update_user(admin_id, {'is_admin': False})
+        db.session.remove()
+
+    headers = {'Authorization': f'Bearer {token}'}
+    assert _amenity(worker_b.test_client(), headers).status_code == 403
+
+
+def test_own_place_writes_do_not_query_users(app, hbnb_client, make_user, auth_headers,
+                                             count_queries):
+    owner = make_user("ann@example.com")
+    headers = auth_headers(owner)
+    body = {'title': 'Loft', 'price': 100.0, 'latitude': 1.0, 'longitude': 2.0,
+            'owner_id': owner.id}
+    db.session.remove()
+
+    with count_queries() as counter:
+        response = hbnb_client.post('/api/v1/places/', headers=headers, json=body)
+    assert response.status_code == 201
+    assert not [s for s in counter.selects if 'FROM users' in s]
+
+    db.session.remove()
+    with count_queries() as counter:
+        response = hbnb_client.put(f"/api/v1/places/{response.json['id']}", headers=headers,
+                                   json={**body, 'title': 'Attic'})
+    assert response.status_code == 200
+    assert not [s for s in counter.selects if 'FROM users' in s]
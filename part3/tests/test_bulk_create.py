@@ -0,0 +1,86 @@
+"""
+Bulk create endpoints: one validation query per entity type, one commit,
+per-item results.
+"""
+from hbnb.app import db
+from hbnb.app.models.place import Place
+from hbnb.app.utils.geo import encode_geohash
+
+
+def _place(owner_id, title="Loft", **extra):
+    return {'title': title, 'price': 80.0, 'latitude': 10.0, 'longitude': 20.0,
+            'owner_id': owner_id, **extra}
+
+
+def test_places_batch_reports_per_item_results(app, hbnb_client, make_user, auth_headers,
+                                               count_commits):
+    owner = make_user("owner@example.com")
+    other = make_user("other@example.com")
+    wifi = hbnb_client.post('/api/v1/amenities/batch', json=[{'name': 'Wi-Fi'}],
+                            headers=auth_headers(make_user("admin@example.com", True))).json[0]
+
+    count_commits.clear()
+    response = hbnb_client.post('/api/v1/places/batch', headers=auth_headers(owner), json=[
+        _place(owner.id, "A", amenities=[wifi['id']]),
+        _place(other.id, "B"),
+        _place(owner.id, "C", amenities=['missing']),
+        _place(owner.id, "   "),
+    ])
+
+    assert response.status_code == 207
+    statuses = [(r['index'], r['status']) for r in response.json]
+    assert statuses == [(0, 'created'), (1, 'failed'), (2, 'failed'), (3, 'failed')]
+    assert len(count_commits) == 1
+
+    created = db.session.get(Place, response.json[0]['id'])
+    assert [a.name for a in created.amenities] == ['Wi-Fi']
+    assert created.geohash == encode_geohash(10.0, 20.0)
+
+
+def test_places_batch_all_created(app, hbnb_client, make_user, auth_headers):
+    owner = make_user("owner@example.com")
+    response = hbnb_client.post('/api/v1/places/batch', headers=auth_headers(owner),
+                                json=[_place(owner.id, f"P{i}") for i in range(5)])
+    assert response.status_code == 201
+    assert Place.query.count() == 5
+
+
+def test_reviews_batch_updates_rating_aggregates(app, hbnb_client, make_user, auth_headers):
+    owner, guest, other = (make_user(f"{n}@example.com") for n in ("owner", "guest", "other"))
+    places = hbnb_client.post('/api/v1/places/batch', headers=auth_headers(owner),
+                              json=[_place(owner.id, "A"), _place(owner.id, "B")]).json
+    a, b = places[0]['id'], places[1]['id']
+
+    def review(place_id, rating, user=guest):
+        return {'text': 'ok', 'rating': rating, 'user_id': user.id, 'place_id': place_id}
+
+    response = hbnb_client.post('/api/v1/reviews/batch', headers=auth_headers(guest), json=[
+        review(a, 5), review(b, 3), review(a, 1), review(b, 4, other),
+    ])
+    assert response.status_code == 207
+    assert [r['status'] for r in response.json] == ['created', 'created', 'failed', 'failed']
+    assert response.json[2]['error'] == 'You have already reviewed this place'
+
+    place_a = hbnb_client.get(f'/api/v1/places/{a}').json
+    assert (place_a['review_count'], place_a['average_rating']) == (1, 5.0)
+    assert hbnb_client.get(f'/api/v1/places/{b}').json['rating_histogram']['3'] == 1
+
+
+def test_amenities_batch_requires_admin_and_rejects_duplicates(app, hbnb_client, make_user,
+                                                                auth_headers):
+    user, admin = make_user("u@example.com"), make_user("a@example.com", True)
+    payload = [{'name': 'Pool'}, {'name': 'Pool'}]
+    assert hbnb_client.post('/api/v1/amenities/batch', json=payload,
+                            headers=auth_headers(user)).status_code == 403
+    response = hbnb_client.post('/api/v1/amenities/batch', json=payload,
+                                headers=auth_headers(admin))
+    assert [r['status'] for r in response.json] == ['created', 'failed']
+
+
+def test_batch_limits(app, hbnb_client, make_user, auth_headers):
+    owner = make_user("owner@example.com")
+    app.config['BATCH_MAX_ITEMS'] = 2
+    headers = auth_headers(owner)
+    assert hbnb_client.post('/api/v1/places/batch', json=[_place(owner.id)] * 3,
+                            headers=headers).status_code == 413
+    assert hbnb_client.post('/api/v1/places/batch', json=[], headers=headers).status_code == 400
@@ -0,0 +1,100 @@
+"""
+ETag / Last-Modified validators and 304 responses on read endpoints.
+"""
+from hbnb.app import db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+from hbnb.app.services import facade
+
+
+def _seed():
+    owner = User(first_name="Ann", last_name="Lee", email="ann@example.com")
+    owner.password = "x"
+    wifi = Amenity(name="Wi-Fi")
+    db.session.add_all([owner, wifi])
+    db.session.flush()
+    place = Place(title="Loft", price=90, latitude=1.0, longitude=2.0, owner_id=owner.id)
+    place.amenities.append(wifi)
+    db.session.add(place)
+    db.session.commit()
+    ids = owner.id, wifi.id, place.id
+    db.session.remove()
+    return ids
+
+
+def test_place_revalidation_needs_one_query_and_no_body(app, hbnb_client, count_queries):
+    _, _, place_id = _seed()
+    first = hbnb_client.get(f'/api/v1/places/{place_id}')
+    assert first.status_code == 200
+    assert first.headers['ETag'] and first.headers['Last-Modified']
+    db.session.remove()
+
+    with count_queries() as counter:
+        response = hbnb_client.get(f'/api/v1/places/{place_id}',
+                                   headers={'If-None-Match': first.headers['ETag']})
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == first.headers['ETag']
+    assert counter.count == 1
+
+    response = hbnb_client.get(f'/api/v1/places/{place_id}',
+                               headers={'If-Modified-Since': first.headers['Last-Modified']})
+    assert response.status_code == 304
+
+
+def test_place_etag_follows_embedded_entities(app, hbnb_client):
+    owner_id, wifi_id, place_id = _seed()
+    etag = hbnb_client.get(f'/api/v1/places/{place_id}').headers['ETag']
+
+    facade.update_amenity(wifi_id, {'name': 'Fibre'})
+    db.session.remove()
+    response = hbnb_client.get(f'/api/v1/places/{place_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json['amenities'][0]['name'] == 'Fibre'
+    etag = response.headers['ETag']
+
+    reviewer = facade.create_user({'first_name': 'Bob', 'last_name': 'Ray',
+                                   'email': 'bob@example.com', 'password': 'x'})
+    facade.create_review({'text': 'Great', 'rating': 5,
+                          'user_id': reviewer.id, 'place_id': place_id})
+    db.session.remove()
+    response = hbnb_client.get(f'/api/v1/places/{place_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json['review_count'] == 1
+
+
+def test_user_and_amenity_revalidation(app, hbnb_client):
+    owner_id, wifi_id, _ = _seed()
+    for url in (f'/api/v1/users/{owner_id}', f'/api/v1/amenities/{wifi_id}'):
+        etag = hbnb_client.get(url).headers['ETag']
+        assert hbnb_client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        assert hbnb_client.get(url, headers={'If-None-Match': '"other"'}).status_code == 200
+
+    etag = hbnb_client.get(f'/api/v1/users/{owner_id}').headers['ETag']
+    facade.update_user(owner_id, {'first_name': 'Anna'})
+    db.session.remove()
+    response = hbnb_client.get(f'/api/v1/users/{owner_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json['first_name'] == 'Anna'
+
+
+def test_collection_etags_use_aggregate_versions(app, hbnb_client):
+    _seed()
+    first = hbnb_client.get('/api/v1/amenities/')
+    etag = first.headers['ETag']
+    assert hbnb_client.get('/api/v1/amenities/', headers={'If-None-Match': etag}).status_code == 304
+    # Another query string is another representation
+    response = hbnb_client.get('/api/v1/amenities/?fields=name', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+    facade.create_amenity({'name': 'Pool'})
+    db.session.remove()
+    response = hbnb_client.get('/api/v1/amenities/', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert len(response.json) == 2
+
+    etag = hbnb_client.get('/api/v1/places/').headers['ETag']
+    assert hbnb_client.get('/api/v1/places/', headers={'If-None-Match': etag}).status_code == 304
+    etag = hbnb_client.get('/api/v1/users/').headers['ETag']
+    assert hbnb_client.get('/api/v1/users/', headers={'If-None-Match': etag}).status_code == 304
@@ -0,0 +1,164 @@
+"""
+Read-through entity cache in front of the repositories.
+"""
+import pytest
+
+from hbnb.app import db
+from hbnb.app.persistence.cache import (
+    EntityCache, MemoryCacheBackend, RedisCacheBackend, get_entity_cache
+)
+from hbnb.app.services import facade
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """Local stand-in for a redis client"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_memory_backend_evicts_lru_and_expires():
+    clock = FakeClock()
+    backend = MemoryCacheBackend(max_entries=2, clock=clock)
+    backend.set('a', 1, ttl=10)
+    backend.set('b', 2, ttl=10)
+    assert backend.get('a') == 1          # 'b' is now least recently used
+    backend.set('c', 3, ttl=10)
+    assert backend.get('b') is None
+    assert backend.evictions == 1
+    clock.now = 11
+    assert backend.get('a') is None
+
+
+def test_repeated_get_is_served_from_cache(app, hbnb_client, make_user, count_queries):
+    user_id = make_user("ann@example.com").id
+    db.session.remove()
+    assert hbnb_client.get(f'/api/v1/users/{user_id}').status_code == 200
+
+    with count_queries() as counter:
+        response = hbnb_client.get(f'/api/v1/users/{user_id}')
+    assert response.json['email'] == "ann@example.com"
+    assert counter.selects == []
+    assert get_entity_cache().hits == 1
+
+
+def test_writes_invalidate_cached_entities(app, make_user):
+    user_id = make_user("ann@example.com").id
+    db.session.remove()
+    assert facade.get_user_by_email("ann@example.com").id == user_id
+    db.session.remove()
+
+    facade.update_user(user_id, {'first_name': 'Anna', 'email': 'anna@example.com'})
+    db.session.remove()
+    assert facade.get_user(user_id).first_name == 'Anna'
+    assert facade.get_user_by_email("ann@example.com") is None
+    db.session.remove()
+
+    facade.user_repo.delete(user_id)
+    db.session.remove()
+    assert facade.get_user(user_id) is None
+
+
+def test_redis_backend_with_stand_in_client(app, make_user):
+    app.extensions['hbnb_entity_cache'] = cache = EntityCache(RedisCacheBackend(FakeRedis()))
+    user_id = make_user("ann@example.com").id
+    db.session.remove()
+    facade.get_user(user_id)
+    db.session.remove()
+    assert facade.get_user(user_id).email == "ann@example.com"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_metrics_endpoint_reports_cache_counters(app, hbnb_client, make_user, auth_headers):
+    admin = make_user("admin@example.com", is_admin=True)
+    response = hbnb_client.get('/api/v1/metrics/', headers=auth_headers(admin))
+    assert response.status_code == 200
+    assert {'hits', 'misses', 'hit_ratio'} <= set(response.json['entity_cache'])
+
+    user = make_user("user@example.com")
+    assert hbnb_client.get('/api/v1/metrics/', headers=auth_headers(user)).status_code == 403
+
+
+def test_read_modify_write_ignores_another_workers_stale_snapshot(two_workers):
+    worker_a, worker_b = two_workers
+    with worker_a.app_context():
+        owner = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                                    'email': 'owner@example.com', 'password': 'x'})
+        reviewer = facade.create_user({'first_name': 'Bob', 'last_name': 'Ray',
+                                       'email': 'bob@example.com', 'password': 'x'})
+        place = facade.create_place({'title': 'Loft', 'price': 90, 'latitude': 1.0,
+                                     'longitude': 2.0, 'owner_id': owner.id})
+        review = facade.create_review({'text': 'Nice', 'rating': 5,
+                                       'user_id': reviewer.id, 'place_id': place.id})
+        ids = reviewer.id, place.id, review.id, reviewer.auth_version
+        db.session.remove()
+    reviewer_id, place_id, review_id, version = ids
+
+    with worker_b.app_context():
+        facade.get_review(review_id)        # cached with rating 5
+        facade.get_user(reviewer_id)        # cached with the first auth_version
+        db.session.remove()
+    with worker_a.app_context():
+        facade.update_review(review_id, {'rating': 3})
+        facade.update_user(reviewer_id, {'password': 'y'})
+        db.session.remove()
+    with worker_b.app_context():
+        facade.update_review(review_id, {'rating': 4})
+        facade.update_user(reviewer_id, {'is_admin': True})
+        db.session.remove()
+
+    with worker_a.app_context():
+        place = facade.place_repo.get_fresh(place_id)
+        assert (place.review_count, place.rating_sum) == (1, 4)
+        assert place.rating_histogram == {'1': 0, '2': 0, '3': 0, '4': 1, '5': 0}
+        assert facade.user_repo.get_fresh(reviewer_id).auth_version == version + 2
+
+
+def test_snapshot_read_before_the_commit_is_dropped_at_commit(two_workers):
+    worker = two_workers[0]
+    with worker.app_context():
+        amenity_id = facade.create_amenity({'name': 'Wifi'}).id
+        db.session.remove()
+
+        with facade.transaction():
+            facade.update_amenity(amenity_id, {'name': 'Fast Wifi'})
+            db.session.flush()
+            # Another request reads (and caches) the committed row meanwhile
+            with worker.app_context():
+                assert facade.get_amenity(amenity_id).name == 'Wifi'
+                db.session.remove()
+            assert get_entity_cache().store(facade.get_amenity(amenity_id)) is False
+        db.session.remove()
+
+        with worker.app_context():
+            assert facade.get_amenity(amenity_id).name == 'Fast Wifi'
+            db.session.remove()
+
+
+def test_rollback_drops_the_snapshots_it_touched(app):
+    amenity_id = facade.create_amenity({'name': 'Wifi'}).id
+    db.session.remove()
+    with pytest.raises(RuntimeError):
+        with facade.transaction():
+            facade.update_amenity(amenity_id, {'name': 'Fast Wifi'})
+            db.session.flush()
+            raise RuntimeError
+    db.session.remove()
+    assert facade.get_amenity(amenity_id).name == 'Wifi'
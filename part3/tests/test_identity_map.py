@@ -0,0 +1,61 @@
+"""
+Request-scoped identity map: one SELECT per entity per request.
+"""
+from flask import g
+
+from hbnb.app import db
+from hbnb.app.services import facade
+
+
+def _setup(app):
+    # Measure the identity map alone, without the cross-request entity cache
+    app.extensions.pop('hbnb_entity_cache', None)
+    owner = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                                'email': 'owner@example.com', 'password': 'x'})
+    reviewer = facade.create_user({'first_name': 'Bob', 'last_name': 'Ray',
+                                   'email': 'bob@example.com', 'password': 'x'})
+    wifi = facade.create_amenity({'name': 'Wi-Fi'})
+    pool = facade.create_amenity({'name': 'Pool'})
+    place = facade.create_place({'title': 'Loft', 'price': 90, 'latitude': 1.0,
+                                 'longitude': 2.0, 'owner_id': owner.id,
+                                 'amenities': [wifi.id]})
+    ids = owner, reviewer, wifi, pool, place = [
+        obj.id for obj in (owner, reviewer, wifi, pool, place)]
+    db.session.remove()
+    return ids
+
+
+def _assert_no_repeated_select(counter):
+    selects = [(s, p) for s, p in counter.executions if s.lstrip().upper().startswith("SELECT")]
+    assert selects
+    assert len(selects) == len(set(selects)), "an entity was fetched twice"
+
+
+def test_put_place_fetches_each_entity_once(app, hbnb_client, auth_headers, count_queries):
+    owner_id, _, wifi_id, pool_id, place_id = _setup(app)
+    headers = auth_headers(facade.get_user(owner_id))
+    db.session.remove()
+
+    with count_queries() as counter:
+        response = hbnb_client.put(f'/api/v1/places/{place_id}', headers=headers, json={
+            'title': 'Loft 2', 'price': 95, 'latitude': 1.0, 'longitude': 2.0,
+            'owner_id': owner_id, 'amenities': [wifi_id, pool_id]})
+    assert response.status_code == 200
+    assert len(response.json['amenities']) == 2
+    _assert_no_repeated_select(counter)
+    assert 'hbnb_identity_map' not in g
+
+
+def test_post_review_fetches_each_entity_once(app, hbnb_client, auth_headers, count_queries):
+    _, reviewer_id, _, _, place_id = _setup(app)
+    headers = auth_headers(facade.get_user(reviewer_id))
+    db.session.remove()
+
+    with count_queries() as counter:
+        response = hbnb_client.post('/api/v1/reviews/', headers=headers, json={
+            'text': 'Great', 'rating': 5, 'user_id': reviewer_id, 'place_id': place_id})
+    assert response.status_code == 201
+    _assert_no_repeated_select(counter)
+    tables = [s.split('FROM', 1)[1].split()[0] for s in counter.selects]
+    users, places = tables.count('users'), tables.count('places')
+    assert places == 1 and users == 1   # the owner is compared by owner_id
@@ -0,0 +1,103 @@
+"""
+Login throttling (token buckets per IP and email) and unknown-email caching.
+"""
+from hbnb.app.extensions import login_throttle, password_hasher
+from hbnb.app.services import facade
+from hbnb.app.utils.rate_limit import MemoryBucketBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SharedStandIn:
+    """Local stand-in for a shared bucket store: refuses listed keys"""
+
+    def __init__(self, refused):
+        self.refused = refused
+        self.keys = []
+
+    def take(self, key, capacity, rate):
+        self.keys.append(key)
+        return key not in self.refused, 42.0
+
+
+def _login(client, email, password='secret'):
+    return client.post('/api/v1/users/login', json={'email': email, 'password': password})
+
+
+def test_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    backend = MemoryBucketBackend(clock=clock)
+    assert [backend.take('k', 2, 0.5)[0] for _ in range(3)] == [True, True, False]
+    assert backend.take('k', 2, 0.5) == (False, 2.0)
+    clock.now = 2.0
+    assert backend.take('k', 2, 0.5)[0]
+
+
+def test_throttled_attempt_costs_no_query_or_hash(app, hbnb_client, count_queries):
+    app.config['LOGIN_EMAIL_BURST'] = 2
+    login_throttle.init_app(app)
+    facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                        'email': 'ann@example.com', 'password': 'secret'})
+    assert _login(hbnb_client, 'ann@example.com', 'wrong').status_code == 401
+    assert _login(hbnb_client, 'ANN@example.com', 'wrong').status_code == 401
+
+    hashes = password_hasher.completed
+    with count_queries() as counter:
+        response = _login(hbnb_client, 'ann@example.com')
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert counter.count == 0 and password_hasher.completed == hashes
+    assert login_throttle.stats()['throttled_email'] == 1
+
+
+def test_throttled_email_does_not_spend_the_ip_budget(app, hbnb_client):
+    app.config.update(LOGIN_IP_BURST=3, LOGIN_EMAIL_BURST=1)
+    login_throttle.init_app(app)
+    statuses = [_login(hbnb_client, 'victim@example.com').status_code for _ in range(5)]
+    assert statuses == [401, 429, 429, 429, 429]
+
+    # Other accounts behind the same IP keep the rest of its burst
+    assert _login(hbnb_client, 'bob@example.com').status_code == 401
+    assert _login(hbnb_client, 'eve@example.com').status_code == 401
+    assert _login(hbnb_client, 'joe@example.com').status_code == 429
+    assert login_throttle.stats()['throttled_ip'] == 1
+
+
+def test_unknown_email_is_cached_until_registered(app, hbnb_client, count_queries):
+    assert _login(hbnb_client, 'ghost@example.com').status_code == 401
+    with count_queries() as counter:
+        assert _login(hbnb_client, 'ghost@example.com').status_code == 401
+    assert counter.count == 0
+    assert login_throttle.stats()['unknown_email_hits'] == 1
+
+    facade.create_user({'first_name': 'Gus', 'last_name': 'Host',
+                        'email': 'ghost@example.com', 'password': 'secret'})
+    assert _login(hbnb_client, 'ghost@example.com').status_code == 200
+
+
+def test_unknown_email_cache_is_case_sensitive_like_the_lookup(app, hbnb_client):
+    facade.create_user({'first_name': 'Alice', 'last_name': 'Lee',
+                        'email': 'Alice@Example.com', 'password': 'secret'})
+    assert _login(hbnb_client, 'alice@example.com').status_code == 401
+    assert login_throttle.is_unknown('alice@example.com')
+    assert _login(hbnb_client, 'Alice@Example.com').status_code == 200
+
+
+def test_pluggable_backend_and_metrics(app, hbnb_client, make_user, auth_headers):
+    standin = SharedStandIn(refused={'ip:127.0.0.1'})
+    login_throttle.use_backend(standin)
+    response = _login(hbnb_client, 'ann@example.com')
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '42'
+    assert standin.keys == ['ip:127.0.0.1']
+
+    admin = make_user('admin@example.com', is_admin=True)
+    metrics = hbnb_client.get('/api/v1/metrics/', headers=auth_headers(admin)).json
+    assert metrics['login_throttle']['throttled_ip'] == 1
+    assert metrics['login_throttle']['shed'] == 1
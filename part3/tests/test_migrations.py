@@ -0,0 +1,163 @@
+"""
+Versioned schema migrations.
+"""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from config import TestingConfig
+from hbnb.app import create_app, db
+from hbnb.app.persistence import migrations
+from hbnb.app.utils.geo import encode_geohash
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'hbnb.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _schema(bind):
+    """{table: (columns, indexes)} comparable across creation paths"""
+    with bind.connect() as conn:
+        schema = {}
+        for table in inspect(conn).get_table_names():
+            if table == 'schema_migrations':
+                continue
+            columns = {(row.name, row.type, bool(row.notnull), row.pk)
+                       for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+            indexes = set()
+            for index in conn.exec_driver_sql(f"PRAGMA index_list({table})").all():
+                keys = tuple((row.name, row.desc) for row in conn.exec_driver_sql(
+                    f"PRAGMA index_xinfo({index.name})") if row.key)
+                indexes.add((keys, bool(index.unique)))
+            schema[table] = (columns, indexes)
+        return schema
+
+
+def _index_revision():
+    return next(r for r in migrations.load_revisions() if r.name == 'hot_path_indexes')
+
+
+def test_revisions_are_numbered_in_order():
+    versions = [revision.version for revision in migrations.load_revisions()]
+    assert versions == list(range(len(versions)))
+
+
+def test_migrations_build_the_schema_of_the_models(app, engine):
+    migrations.upgrade(engine)
+    assert _schema(engine) == _schema(db.engine)
+    assert migrations.pending(engine) == []
+    assert migrations.upgrade(engine) == []
+
+
+def test_upgrade_restores_dropped_indexes(app):
+    expected = _schema(db.engine)
+    module = _index_revision().module
+    for name, _, _ in module.INDEXES + module.UNIQUE_INDEXES:
+        db.session.execute(text(f"DROP INDEX {name}"))
+    db.session.commit()
+    assert _schema(db.engine) != expected
+
+    migrations.upgrade(db.engine)
+    assert _schema(db.engine) == expected
+
+
+def test_upgrade_backfills_a_first_release_database_in_chunks(engine):
+    migrations.upgrade(engine, target=0)
+    with engine.begin() as conn:
+        for user in ('u1', 'u2'):
+            conn.exec_driver_sql(
+                "INSERT INTO users (id, first_name, last_name, email, password, is_admin) "
+                f"VALUES ('{user}', 'A', 'B', '{user}@example.com', 'x', 0)")
+        for i in range(5):
+            conn.exec_driver_sql(
+                "INSERT INTO places (id, title, price, latitude, longitude, owner_id) "
+                f"VALUES ('p{i}', 'Place', 10, {i}, {i}, 'u1')")
+        for user, rating in (('u1', 2), ('u2', 5)):
+            conn.exec_driver_sql(
+                "INSERT INTO reviews (id, text, rating, user_id, place_id) "
+                f"VALUES ('r{rating}', 'ok', {rating}, '{user}', 'p3')")
+
+    log = []
+    migrations.upgrade(engine, log=log.append, chunk_size=2)
+    assert 'places: 5 rows backfilled' in '\n'.join(log)
+    assert '  places: 2 rows backfilled' in log        # committed chunk by chunk
+
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            "SELECT id, geohash, review_count, rating_sum, rating_avg, rating_count_2, "
+            "rating_count_5 FROM places ORDER BY id").all()
+        auth_version = conn.exec_driver_sql("SELECT auth_version FROM users").scalar()
+    assert [row.geohash for row in rows] == [encode_geohash(i, i) for i in range(5)]
+    assert tuple(rows[3])[2:] == (2, 7, 3.5, 1, 1)
+    assert tuple(rows[0])[2:] == (0, 0, 0.0, 0, 0)
+    assert auth_version == 1
+
+
+def test_backfill_resumes_where_it_stopped(engine):
+    migrations.upgrade(engine, target=0)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, value INTEGER)")
+        conn.exec_driver_sql("INSERT INTO items (id) VALUES (1), (2), (3)")
+    op = migrations.Operations(engine, chunk_size=1)
+
+    def fail_on_third(row):
+        if row.id == 3:
+            raise RuntimeError('interrupted')
+        return {'value': row.id * 10}
+
+    with pytest.raises(RuntimeError):
+        op.backfill('items', fail_on_third, where='value IS NULL')
+    assert op.backfill('items', {'value': 'id * 10'}, where='value IS NULL') == 1
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT value FROM items").scalars().all() == [10, 20, 30]
+
+
+def test_create_app_never_runs_ddl(tmp_path):
+    path = tmp_path / 'fresh.db'
+
+    class Config(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app(Config)
+    app.test_client().get('/api/v1/')
+    with app.app_context():
+        assert inspect(db.engine).get_table_names() == []
+        db.engine.dispose()
+
+
+def test_cli_upgrade_and_status(app):
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=['db', 'status'])
+    assert 'Pending 0001 hot_path_indexes' in result.output
+    result = runner.invoke(args=['db', 'upgrade', '--chunk-size', '10'])
+    assert 'Applied 0005 revoked_tokens' in result.output
+    assert runner.invoke(args=['db', 'status']).output.strip() == 'Database is up to date'
+
+
+def test_duplicate_reviews_are_dropped_before_the_unique_index(engine):
+    migrations.upgrade(engine, target=0)
+    with engine.begin() as conn:
+        for user in ('u1', 'u2'):
+            conn.exec_driver_sql(
+                "INSERT INTO users (id, first_name, last_name, email, password, is_admin) "
+                f"VALUES ('{user}', 'A', 'B', '{user}@example.com', 'x', 0)")
+        conn.exec_driver_sql(
+            "INSERT INTO places (id, title, price, latitude, longitude, owner_id) "
+            "VALUES ('p1', 'Place', 10, 1, 1, 'u1')")
+        for review, rating, updated in (('r1', 2, '2024-01-01'), ('r2', 4, '2024-03-01'),
+                                        ('r3', 5, '2024-02-01')):
+            conn.exec_driver_sql(
+                "INSERT INTO reviews (id, text, rating, user_id, place_id, updated_at) "
+                f"VALUES ('{review}', 'ok', {rating}, 'u2', 'p1', '{updated}')")
+
+    log = []
+    migrations.upgrade(engine, log=log.append)
+    assert '  reviews: dropping duplicate r1 (user u2, place p1)' in log
+    assert '  reviews: dropping duplicate r3 (user u2, place p1)' in log
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT id FROM reviews").scalars().all() == ['r2']
+        place = conn.exec_driver_sql(
+            "SELECT review_count, rating_sum FROM places WHERE id = 'p1'").one()
+    assert tuple(place) == (1, 4)
@@ -0,0 +1,91 @@
+"""
+Keyset pagination and field projection on the collection endpoints.
+"""
+from datetime import datetime, timedelta
+
+from hbnb.app import db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+from hbnb.app.persistence.repository import encode_cursor
+
+
+def _seed_places(n):
+    owner = User(first_name="Owner", last_name="One", email="owner@example.com")
+    owner.password = "x"
+    db.session.add(owner)
+    db.session.flush()
+    start = datetime(2024, 1, 1)
+    for i in range(n):
+        # Two places share each timestamp so the id tie-breaker is exercised
+        db.session.add(Place(title=f"Place {i}", price=10 + i, latitude=0.0,
+                             longitude=0.0, owner_id=owner.id,
+                             created_at=start + timedelta(seconds=i // 2)))
+    db.session.commit()
+
+
+def _walk(client, url):
+    seen, cursor = [], None
+    while True:
+        query = url + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(query)
+        assert response.status_code == 200
+        seen.extend(response.json)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            return seen
+
+
+def test_places_keyset_pages_cover_every_row_once(app, hbnb_client):
+    _seed_places(7)
+    items = _walk(hbnb_client, '/api/v1/places/?limit=3')
+    assert len(items) == 7
+    assert len({item['id'] for item in items}) == 7
+
+
+def test_link_header_points_at_next_page(app, hbnb_client):
+    _seed_places(3)
+    response = hbnb_client.get('/api/v1/places/?limit=2')
+    assert len(response.json) == 2
+    assert 'rel="next"' in response.headers['Link']
+    assert 'limit=2' in response.headers['Link']
+
+
+def test_unpaginated_request_returns_everything(app, hbnb_client):
+    _seed_places(4)
+    response = hbnb_client.get('/api/v1/places/')
+    assert len(response.json) == 4
+    assert 'X-Next-Cursor' not in response.headers
+
+
+def test_fields_projection_limits_payload_and_columns(app, hbnb_client, count_queries):
+    _seed_places(2)
+    db.session.expunge_all()
+    with count_queries() as counter:
+        response = hbnb_client.get('/api/v1/places/?fields=id,title')
+    assert response.status_code == 200
+    assert all(set(item) == {'id', 'title'} for item in response.json)
+    assert counter.count == 2     # the ETag version probe, then the page itself
+    assert 'description' not in counter.statements[1]
+
+
+def test_users_and_amenities_projection(app, hbnb_client):
+    _seed_places(1)
+    db.session.add(Amenity(name="Wi-Fi"))
+    db.session.commit()
+    users = hbnb_client.get('/api/v1/users/?fields=email').json
+    assert users == [{'email': 'owner@example.com'}]
+    amenities = hbnb_client.get('/api/v1/amenities/?fields=name&limit=5').json
+    assert amenities == [{'name': 'Wi-Fi'}]
+
+
+def test_invalid_parameters_are_rejected(app, hbnb_client):
+    assert hbnb_client.get('/api/v1/places/?limit=0').status_code == 400
+    assert hbnb_client.get('/api/v1/places/?limit=abc').status_code == 400
+    assert hbnb_client.get('/api/v1/places/?cursor=not-a-cursor').status_code == 400
+    for values in (["2024-01-01T00:00:00", {"a": 1}], ["2024-01-01T00:00:00", [1]],
+                   ["2024-01-01T00:00:00", True], [7, "id"]):
+        cursor = encode_cursor(values)
+        assert hbnb_client.get(f'/api/v1/places/?cursor={cursor}').status_code == 400
+        assert hbnb_client.get(f'/api/v1/users/?cursor={cursor}').status_code == 400
+    assert hbnb_client.get('/api/v1/reviews/?fields=password').status_code == 400
@@ -0,0 +1,116 @@
+"""
+bcrypt offloaded to a bounded executor, with a queue-depth metric.
+"""
+import threading
+import time
+
+from flask import Flask
+
+from hbnb.app.extensions import password_hasher
+from hbnb.app.services import facade
+from hbnb.app.utils.password_hashing import PasswordHasher, calibrate_rounds, hash_cost
+
+
+class BlockingBcrypt:
+    """Stand-in for Flask-Bcrypt whose hashing waits for a signal"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.threads = set()
+
+    def generate_password_hash(self, password, rounds=None):
+        self.threads.add(threading.get_ident())
+        self.release.wait(5)
+        return b'hashed:' + password.encode()
+
+    def check_password_hash(self, pw_hash, password):
+        self.threads.add(threading.get_ident())
+        return pw_hash == 'hashed:' + password
+
+
+def _hasher(bcrypt, executor, workers=1):
+    app = Flask(__name__)
+    app.config.update(PASSWORD_HASH_EXECUTOR=executor, PASSWORD_HASH_WORKERS=workers)
+    hasher = PasswordHasher(bcrypt)
+    hasher.init_app(app)
+    return hasher
+
+
+def test_pool_bounds_concurrency_and_reports_queue_depth():
+    bcrypt = BlockingBcrypt()
+    hasher = _hasher(bcrypt, 'thread', workers=1)
+    callers = [threading.Thread(target=hasher.hash, args=(f'pw{i}',)) for i in range(4)]
+    for caller in callers:
+        caller.start()
+    deadline = time.monotonic() + 5
+    while hasher.in_flight < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert hasher.stats()['queue_depth'] == 3
+    bcrypt.release.set()
+    for caller in callers:
+        caller.join()
+    stats = hasher.stats()
+    assert (stats['queue_depth'], stats['peak_queue_depth'], stats['completed']) == (0, 3, 4)
+    assert threading.get_ident() not in bcrypt.threads
+    hasher.shutdown()
+
+
+def test_inline_mode_runs_in_the_caller():
+    bcrypt = BlockingBcrypt()
+    bcrypt.release.set()
+    hasher = _hasher(bcrypt, None)
+    assert hasher.verify(hasher.hash('secret'), 'secret')
+    assert bcrypt.threads == {threading.get_ident()}
+
+
+def test_login_and_user_writes_use_the_executor(app, hbnb_client):
+    completed = password_hasher.completed
+    user = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                               'email': 'ann@example.com', 'password': 'secret'})
+    facade.update_user(user.id, {'password': 'changed'})
+    response = hbnb_client.post('/api/v1/users/login',
+                                json={'email': 'ann@example.com', 'password': 'changed'})
+    assert response.status_code == 200
+    assert password_hasher.stats()['executor'] == 'ThreadPoolExecutor'
+    assert password_hasher.completed - completed == 3
+
+
+class TimedBcrypt:
+    """Stand-in whose hash takes 1 ms at cost 8, doubling per round"""
+
+    def generate_password_hash(self, password, rounds):
+        time.sleep(0.001 * 2 ** (rounds - 8))
+        return b'$2b$%02d$' % rounds
+
+
+def test_rounds_are_calibrated_to_the_latency_budget():
+    assert calibrate_rounds(TimedBcrypt(), target_ms=24) == 12
+    assert calibrate_rounds(TimedBcrypt(), target_ms=0.01, min_rounds=10) == 10
+    assert hash_cost('$2b$11$abcdefghijklmnopqrstuv') == 11
+    assert hash_cost('not a hash') is None
+
+
+def test_login_rehashes_outdated_cost(app, hbnb_client):
+    user = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                               'email': 'ann@example.com', 'password': 'secret'})
+    assert hash_cost(user.password) == 4
+    password_hasher.rounds = 5
+
+    response = hbnb_client.post('/api/v1/users/login',
+                                json={'email': 'ann@example.com', 'password': 'secret'})
+    assert response.status_code == 200
+    user = facade.get_user_by_email('ann@example.com')
+    assert hash_cost(user.password) == 5
+    assert user.verify_password('secret')
+    assert not user.password_needs_rehash()
+
+
+def test_hashes_with_a_higher_cost_are_kept(app):
+    user = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                               'email': 'ann@example.com', 'password': 'secret'})
+    assert hash_cost(user.password) == 4
+    password_hasher.rounds = 4
+    assert not user.password_needs_rehash()
+    password_hasher.rounds = 3
+    assert not user.password_needs_rehash()
+    assert password_hasher.needs_rehash('not a hash')
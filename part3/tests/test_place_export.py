@@ -0,0 +1,56 @@
+"""
+Streaming NDJSON export of places (HTTP endpoint and CLI command).
+"""
+import gzip
+import json
+
+from hbnb.app import db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+
+
+def _seed(owner, n):
+    wifi = Amenity(name="Wi-Fi")
+    db.session.add(wifi)
+    for i in range(n):
+        place = Place(title=f"Place {i}", price=10 + i, latitude=1.0, longitude=2.0,
+                      owner_id=owner.id)
+        place.amenities = [wifi]
+        db.session.add(place)
+    db.session.commit()
+
+
+def test_export_streams_one_line_per_place(app, hbnb_client, make_user, auth_headers):
+    admin = make_user("admin@example.com", is_admin=True)
+    _seed(admin, 5)
+    app.config['EXPORT_BATCH_SIZE'] = 2
+    response = hbnb_client.get('/api/v1/places/export', headers=auth_headers(admin))
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.is_streamed
+    records = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert len(records) == 5
+    assert records[0]['owner']['email'] == "admin@example.com"
+    assert records[0]['amenities'] == [{'id': records[0]['amenities'][0]['id'], 'name': 'Wi-Fi'}]
+
+
+def test_export_gzip_and_admin_only(app, hbnb_client, make_user, auth_headers):
+    admin = make_user("admin@example.com", is_admin=True)
+    _seed(admin, 3)
+    response = hbnb_client.get('/api/v1/places/export?gzip=1', headers=auth_headers(admin))
+    assert response.mimetype == 'application/gzip'
+    assert len(gzip.decompress(response.data).splitlines()) == 3
+
+    user = make_user("user@example.com")
+    assert hbnb_client.get('/api/v1/places/export',
+                           headers=auth_headers(user)).status_code == 403
+
+
+def test_export_cli_command(app, make_user, tmp_path):
+    admin = make_user("admin@example.com", is_admin=True)
+    _seed(admin, 4)
+    output = tmp_path / "places.ndjson.gz"
+    result = app.test_cli_runner().invoke(
+        args=['export-places', '--output', str(output), '--gzip', '--batch-size', '3'])
+    assert result.exit_code == 0, result.output
+    assert len(gzip.decompress(output.read_bytes()).splitlines()) == 4
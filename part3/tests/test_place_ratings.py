@@ -0,0 +1,98 @@
+"""
+Denormalized rating aggregates on places, kept in step by the facade.
+"""
+from hbnb.app import db
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+from hbnb.app.services import facade
+
+
+def _users(n):
+    users = []
+    for i in range(n):
+        user = User(first_name="User", last_name=str(i), email=f"user{i}@example.com")
+        user.password = "x"
+        users.append(user)
+    db.session.add_all(users)
+    db.session.commit()
+    return users
+
+
+def _place(owner, title="Cabin"):
+    place = Place(title=title, price=50, latitude=0.0, longitude=0.0, owner_id=owner.id)
+    db.session.add(place)
+    db.session.commit()
+    return place
+
+
+def _review(user, place, rating):
+    return facade.create_review({'text': 'ok', 'rating': rating,
+                                 'user_id': user.id, 'place_id': place.id})
+
+
+def test_create_update_delete_keep_aggregates_consistent(app):
+    owner, a, b = _users(3)
+    place = _place(owner)
+    first = _review(a, place, 5)
+    _review(b, place, 2)
+    assert (place.review_count, place.rating_sum) == (2, 7)
+    assert place.average_rating == 3.5
+    assert place.rating_histogram == {'1': 0, '2': 1, '3': 0, '4': 0, '5': 1}
+
+    facade.update_review(first.id, {'rating': 3})
+    assert place.rating_histogram == {'1': 0, '2': 1, '3': 1, '4': 0, '5': 0}
+    assert place.rating_avg == 2.5
+
+    facade.delete_review(first.id)
+    assert (place.review_count, place.rating_sum, place.rating_avg) == (1, 2, 2.0)
+
+
+def test_moving_a_review_updates_both_places(app):
+    owner, a = _users(2)
+    cabin, villa = _place(owner, "Cabin"), _place(owner, "Villa")
+    review = _review(a, cabin, 4)
+    facade.update_review(review.id, {'place_id': villa.id})
+    assert (cabin.review_count, villa.review_count) == (0, 1)
+    assert cabin.average_rating is None
+    assert villa.rating_count_4 == 1
+
+
+def test_sort_and_min_rating_on_place_list(app, hbnb_client, count_queries):
+    owner, a, b = _users(3)
+    low, high, unrated = _place(owner, "Low"), _place(owner, "High"), _place(owner, "None")
+    _review(a, low, 2)
+    _review(a, high, 5)
+    _review(b, high, 4)
+    assert (unrated.review_count, unrated.average_rating) == (0, None)
+
+    titles = [p['title'] for p in hbnb_client.get('/api/v1/places/?sort=rating').json]
+    assert titles == ["High", "Low", "None"]
+
+    pages = []
+    response = hbnb_client.get('/api/v1/places/?sort=rating&limit=1')
+    while True:
+        pages.append(response.json[0]['title'])
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+        response = hbnb_client.get(f'/api/v1/places/?sort=rating&limit=1&cursor={cursor}')
+    assert pages == ["High", "Low", "None"]
+
+    db.session.expunge_all()
+    with count_queries() as counter:
+        response = hbnb_client.get('/api/v1/places/?min_rating=3&fields=title,average_rating')
+    assert response.json == [{'title': 'High', 'average_rating': 4.5}]
+    assert counter.count == 2     # the ETag version probe, then the page itself
+    assert 'reviews' not in counter.statements[1]
+
+    assert hbnb_client.get('/api/v1/places/?sort=price').status_code == 400
+
+
+def test_place_detail_exposes_aggregates(app, hbnb_client):
+    owner, a = _users(2)
+    place = _place(owner)
+    _review(a, place, 4)
+    body = hbnb_client.get(f'/api/v1/places/{place.id}').json
+    assert body['review_count'] == 1
+    assert body['average_rating'] == 4.0
+    assert body['rating_histogram']['4'] == 1
@@ -0,0 +1,71 @@
+"""
+Server-side place search filters on GET /api/v1/places/.
+"""
+from hbnb.app import db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+
+
+def _seed():
+    alice = User(first_name="Alice", last_name="A", email="alice@example.com")
+    bob = User(first_name="Bob", last_name="B", email="bob@example.com")
+    alice.password = bob.password = "x"
+    wifi, pool = Amenity(name="Wi-Fi"), Amenity(name="Pool")
+    db.session.add_all([alice, bob, wifi, pool])
+    db.session.flush()
+    specs = [
+        ("Paris", 80, 48.85, 2.35, alice, [wifi, pool]),
+        ("Lyon", 50, 45.76, 4.83, alice, [wifi]),
+        ("Fiji", 200, -17.7, 178.0, bob, [pool]),
+        ("Samoa", 120, -13.8, -172.0, bob, []),
+    ]
+    for title, price, lat, lon, owner, amenities in specs:
+        place = Place(title=title, price=price, latitude=lat, longitude=lon,
+                      owner_id=owner.id)
+        place.amenities = amenities
+        db.session.add(place)
+    db.session.commit()
+    return {'alice': alice.id, 'wifi': wifi.id, 'pool': pool.id}
+
+
+def _titles(client, query):
+    response = client.get('/api/v1/places/?' + query)
+    assert response.status_code == 200, response.json
+    return sorted(place['title'] for place in response.json)
+
+
+def test_price_range_and_owner(app, hbnb_client):
+    ids = _seed()
+    assert _titles(hbnb_client, 'min_price=60&max_price=150') == ['Paris', 'Samoa']
+    assert _titles(hbnb_client, f"owner_id={ids['alice']}&max_price=60") == ['Lyon']
+
+
+def test_amenity_all_and_any(app, hbnb_client):
+    ids = _seed()
+    both = f"amenity={ids['wifi']},{ids['pool']}"
+    assert _titles(hbnb_client, both) == ['Paris']
+    assert _titles(hbnb_client, both + '&amenity_match=any') == ['Fiji', 'Lyon', 'Paris']
+    repeated = f"amenity={ids['wifi']}&amenity={ids['pool']}"
+    assert _titles(hbnb_client, repeated) == ['Paris']
+
+
+def test_bounding_box_including_antimeridian(app, hbnb_client):
+    _seed()
+    assert _titles(hbnb_client, 'min_lat=40&max_lat=50&min_lon=0&max_lon=5') == ['Lyon', 'Paris']
+    assert _titles(hbnb_client, 'min_lat=-20&max_lat=-10&min_lon=170&max_lon=-170') == ['Fiji', 'Samoa']
+
+
+def test_invalid_filters_are_rejected(app, hbnb_client):
+    assert hbnb_client.get('/api/v1/places/?min_price=cheap').status_code == 400
+    assert hbnb_client.get('/api/v1/places/?min_price=nan').status_code == 400
+    assert hbnb_client.get('/api/v1/places/?max_price=inf').status_code == 400
+    assert hbnb_client.get('/api/v1/places/?min_price=10&max_price=5').status_code == 400
+    assert hbnb_client.get('/api/v1/places/?amenity=x&amenity_match=some').status_code == 400
+
+
+def test_amenity_filter_uses_reverse_index(app):
+    plan = db.session.execute(db.text(
+        "EXPLAIN QUERY PLAN SELECT place_id FROM place_amenity WHERE amenity_id IN ('a', 'b')"
+    )).all()
+    assert any('idx_place_amenity_amenity_id' in row[-1] for row in plan)
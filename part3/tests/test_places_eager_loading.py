@@ -0,0 +1,66 @@
+"""
+The place list endpoint must issue a fixed number of SQL statements,
+whatever the number of places, amenities and reviews.
+"""
+from hbnb.app import db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+
+
+def _seed(n_places):
+    owner = User(first_name="Owner", last_name="One", email="owner@example.com")
+    owner.password = "x"
+    guest = User(first_name="Guest", last_name="Two", email="guest@example.com")
+    guest.password = "x"
+    wifi = Amenity(name="Wi-Fi")
+    pool = Amenity(name="Pool")
+    db.session.add_all([owner, guest, wifi, pool])
+    db.session.flush()
+    for i in range(n_places):
+        place = Place(title=f"Place {i}", price=10 + i, latitude=1.0,
+                      longitude=2.0, owner_id=owner.id)
+        place.amenities = [wifi, pool]
+        db.session.add(place)
+        db.session.flush()
+        db.session.add(Review(text="Nice", rating=4, user_id=guest.id,
+                              place_id=place.id))
+    db.session.commit()
+    db.session.expunge_all()
+
+
+def _list_query_count(client, count_queries):
+    with count_queries() as counter:
+        response = client.get('/api/v1/places/')
+    assert response.status_code == 200
+    return len(response.json), counter.count
+
+
+def test_place_list_query_count_is_constant(app, hbnb_client, count_queries):
+    _seed(3)
+    size, small = _list_query_count(hbnb_client, count_queries)
+    assert size == 3
+
+    db.session.remove()
+    Review.query.delete()
+    db.session.execute(db.text("DELETE FROM place_amenity"))
+    Place.query.delete()
+    User.query.delete()
+    Amenity.query.delete()
+    db.session.commit()
+
+    _seed(40)
+    # Written around the facade, so the cached first page is still current
+    app.extensions['hbnb_response_cache'].invalidate('places')
+    size, large = _list_query_count(hbnb_client, count_queries)
+    assert size == 40
+    assert small == large
+
+
+def test_place_list_payload_includes_relations(app, hbnb_client):
+    _seed(1)
+    place = hbnb_client.get('/api/v1/places/').json[0]
+    assert place['owner']['email'] == "owner@example.com"
+    assert sorted(a['name'] for a in place['amenities']) == ["Pool", "Wi-Fi"]
+    assert place['reviews'][0]['rating'] == 4
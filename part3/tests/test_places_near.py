@@ -0,0 +1,73 @@
+"""
+Geohash-indexed radius search on GET /api/v1/places/near.
+"""
+from hbnb.app import db
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+from hbnb.app.utils.geo import encode_geohash, haversine_km
+
+
+def _seed():
+    owner = User(first_name="Owner", last_name="One", email="owner@example.com")
+    owner.password = "x"
+    db.session.add(owner)
+    db.session.flush()
+    coords = {
+        "Louvre": (48.8606, 2.3376),
+        "Eiffel": (48.8584, 2.2945),
+        "Versailles": (48.8049, 2.1204),
+        "Lyon": (45.7640, 4.8357),
+        "Suva": (-18.1248, 178.4501),
+        "Taveuni": (-16.8500, -179.9700),
+    }
+    for title, (lat, lon) in coords.items():
+        db.session.add(Place(title=title, price=100, latitude=lat, longitude=lon,
+                             owner_id=owner.id))
+    db.session.commit()
+
+
+def test_geohash_is_kept_in_sync(app):
+    _seed()
+    place = Place.query.filter_by(title="Lyon").one()
+    assert place.geohash == encode_geohash(45.7640, 4.8357)
+    place.latitude, place.longitude = 48.8606, 2.3376
+    db.session.commit()
+    assert place.geohash == encode_geohash(48.8606, 2.3376)
+
+
+def test_results_are_ordered_by_distance(app, hbnb_client):
+    _seed()
+    response = hbnb_client.get('/api/v1/places/near?lat=48.8606&lon=2.3376&radius_km=30')
+    assert response.status_code == 200
+    assert [p['title'] for p in response.json] == ["Louvre", "Eiffel", "Versailles"]
+    distances = [p['distance_km'] for p in response.json]
+    assert distances == sorted(distances)
+    assert abs(distances[1] - haversine_km(48.8606, 2.3376, 48.8584, 2.2945)) < 0.01
+
+
+def test_limit_and_antimeridian(app, hbnb_client):
+    _seed()
+    near = hbnb_client.get('/api/v1/places/near?lat=48.8606&lon=2.3376&radius_km=30&limit=1')
+    assert [p['title'] for p in near.json] == ["Louvre"]
+    fiji = hbnb_client.get('/api/v1/places/near?lat=-17.5&lon=179.9&radius_km=250')
+    assert sorted(p['title'] for p in fiji.json) == ["Suva", "Taveuni"]
+
+
+def test_invalid_parameters(app, hbnb_client):
+    assert hbnb_client.get('/api/v1/places/near?lat=1&lon=2').status_code == 400
+    assert hbnb_client.get('/api/v1/places/near?lat=x&lon=2&radius_km=1').status_code == 400
+    assert hbnb_client.get('/api/v1/places/near?lat=95&lon=2&radius_km=1').status_code == 400
+    assert hbnb_client.get('/api/v1/places/near?lat=1&lon=2&radius_km=0').status_code == 400
+
+
+def test_non_finite_and_oversized_parameters_are_rejected(app, hbnb_client):
+    for query in ('radius_km=nan', 'radius_km=inf', 'lat=nan', 'lon=-inf'):
+        params = {'lat': '1', 'lon': '2', 'radius_km': '1'}
+        params.update([query.split('=')])
+        response = hbnb_client.get('/api/v1/places/near', query_string=params)
+        assert response.status_code == 400
+        assert response.json['message'] == 'lat, lon and radius_km must be finite numbers'
+
+    response = hbnb_client.get('/api/v1/places/near?lat=1&lon=2&radius_km=1001')
+    assert response.status_code == 400
+    assert response.json['message'] == 'radius_km must be at most 1000'
@@ -0,0 +1,163 @@
+"""
+Query plans of the repository queries.
+
+Every repository query is run against a small database, and each SELECT
+it sends is replayed through EXPLAIN QUERY PLAN. A plain "SCAN <table>"
+step means SQLite reads the whole table, which is only acceptable for
+the few queries that return the whole table anyway (FULL_SCANS).
+"""
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from config import TestingConfig
+from hbnb.app import create_app, db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+from hbnb.app.services import facade
+
+# Queries that read every row by design
+FULL_SCANS = {
+    'UserRepository.get_all',
+    'AmenityRepository.get_all',
+    'ReviewRepository.get_all',
+    'PlaceRepository.get_all_with_details',
+    'PlaceRepository.iter_for_export',
+}
+
+SCAN = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+
+
+class PlanConfig(TestingConfig):
+    ENTITY_CACHE_BACKEND = None
+    RESPONSE_CACHE_BACKEND = None
+
+
+@pytest.fixture(scope='module')
+def seeded():
+    app = create_app(PlanConfig)
+    with app.app_context():
+        db.create_all()
+        owner = User(first_name='O', last_name='W', email='owner@example.com')
+        guest = User(first_name='G', last_name='U', email='guest@example.com')
+        owner.password = guest.password = 'x'
+        wifi = Amenity(name='Wifi')
+        db.session.add_all([owner, guest, wifi])
+        db.session.flush()
+        place = Place(title='Flat', price=80, latitude=48.85, longitude=2.35,
+                      owner_id=owner.id)
+        place.amenities = [wifi]
+        db.session.add(place)
+        db.session.flush()
+        review = Review(text='Nice', rating=5, user_id=guest.id, place_id=place.id)
+        db.session.add(review)
+        db.session.commit()
+        ids = {'owner': owner.id, 'guest': guest.id, 'amenity': wifi.id,
+               'place': place.id, 'review': review.id}
+        db.session.remove()
+        yield app, ids
+        db.session.remove()
+        db.drop_all()
+
+
+def repository_queries(ids):
+    """(label, call) for every read query the repositories send"""
+    users, places = facade.user_repo, facade.place_repo
+    amenities, reviews = facade.amenity_repo, facade.review_repo
+    tokens = facade.revoked_token_repo
+    now = datetime.utcnow()
+    filters = {'owner_id': ids['owner'], 'min_price': 10, 'max_price': 100,
+               'min_rating': 1, 'min_lat': 40, 'max_lat': 50, 'min_lon': 0,
+               'max_lon': 10, 'amenities': [ids['amenity']]}
+    queries = []
+    for repo, key in ((users, 'owner'), (amenities, 'amenity'),
+                      (reviews, 'review'), (places, 'place')):
+        name = type(repo).__name__
+        queries += [
+            (f'{name}.get', lambda r=repo, k=key: r.get(ids[k])),
+            (f'{name}.get_many', lambda r=repo, k=key: r.get_many([ids[k], 'missing'])),
+            (f'{name}.exists', lambda r=repo: r.exists()),
+            (f'{name}.count', lambda r=repo: r.count()),
+            (f'{name}.collection_version', lambda r=repo: r.collection_version()),
+            (f'{name}.get_page', lambda r=repo: r.get_page(limit=1)),
+            (f'{name}.get_page(cursor)',
+             lambda r=repo: r.get_page(limit=1, cursor=r.get_page(limit=1)[1])),
+        ]
+        if repo is not places:
+            queries.append((f'{name}.get_all', lambda r=repo: r.get_all()))
+    queries += [
+        ('UserRepository.get_by_attribute', lambda: users.get_user_by_email('owner@example.com')),
+        ('UserRepository.get_auth_version', lambda: users.get_auth_version(ids['owner'])),
+        ('AmenityRepository.get_by_attribute', lambda: amenities.get_by_name('Wifi')),
+        ('AmenityRepository.existing_names', lambda: amenities.existing_names(['Wifi', 'Pool'])),
+        ('ReviewRepository.exists_for', lambda: reviews.exists_for(ids['guest'], ids['place'])),
+        ('ReviewRepository.existing_pairs',
+         lambda: reviews.existing_pairs([(ids['guest'], ids['place'])])),
+        ('ReviewRepository.get_page_with_author', lambda: reviews.get_page_with_author(limit=1)),
+        ('PlaceRepository.get_all_with_details', lambda: places.get_all_with_details()),
+        ('PlaceRepository.get_page_with_details', lambda: places.get_page_with_details(limit=1)),
+        ('PlaceRepository.get_page_with_details(filters)',
+         lambda: places.get_page_with_details(limit=1, filters=filters)),
+        ('PlaceRepository.get_page_with_details(any amenity)',
+         lambda: places.get_page_with_details(limit=1, filters={
+             'amenities': [ids['amenity'], 'missing'], 'amenity_match': 'any'})),
+        ('PlaceRepository.get_page_with_details(rating)',
+         lambda: places.get_page_with_details(limit=1, sort='rating',
+                                              filters={'min_rating': 1})),
+        ('PlaceRepository.get_page_with_details(owner)',
+         lambda: places.get_page_with_details(limit=1, filters={'owner_id': ids['owner']})),
+        ('PlaceRepository.get_page_with_details(price)',
+         lambda: places.get_page_with_details(limit=1, filters={'min_price': 10})),
+        ('PlaceRepository.version', lambda: places.version(ids['place'])),
+        ('PlaceRepository.get_near', lambda: places.get_near(48.85, 2.35, 5)),
+        ('PlaceRepository.get_near(bbox)', lambda: places.get_near(48.85, 2.35, 3000)),
+        ('PlaceRepository.iter_for_export', lambda: list(places.iter_for_export())),
+        ('Place.reviews', lambda: places.get(ids['place']).reviews),
+        ('User.places', lambda: users.get(ids['owner']).places),
+        ('RevokedTokenRepository.revoked_since', lambda: tokens.revoked_since(now, now)),
+        ('RevokedTokenRepository.revoked_since(all)', lambda: tokens.revoked_since(None, now)),
+    ]
+    return queries
+
+
+def capture_selects(call):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', _record)
+    try:
+        call()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _record)
+        db.session.remove()
+    return statements
+
+
+def full_scans(statement, parameters):
+    with db.engine.connect() as conn:
+        plan = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).all()
+    tables = db.metadata.tables
+    return [detail for _, _, _, detail in plan
+            if (match := SCAN.match(detail)) and match.group(1) in tables]
+
+
+def test_repository_queries_use_indexes(seeded):
+    app, ids = seeded
+    problems = []
+    with app.app_context():
+        for label, call in repository_queries(ids):
+            statements = capture_selects(call)
+            assert statements, f'{label} sent no query'
+            if label in FULL_SCANS:
+                continue
+            for statement, parameters in statements:
+                for detail in full_scans(statement, parameters):
+                    problems.append(f'{label}: {detail}\n    {statement}')
+    assert not problems, '\n'.join(problems)
@@ -0,0 +1,99 @@
+"""
+Routing of repository reads to read replicas, with read-your-writes.
+
+The replica is a copy of the primary file taken after the schema is
+created, so anything written afterwards exists only on the primary and
+shows which database answered a read.
+"""
+import shutil
+
+import pytest
+
+from config import TestingConfig
+from hbnb.app import create_app, db
+from hbnb.app.api.v1.security import create_token
+from hbnb.app.models.user import User
+from hbnb.app.persistence.routing import get_read_router
+from hbnb.app.persistence.unit_of_work import unit_of_work
+from hbnb.app.services import facade
+
+
+@pytest.fixture
+def replicated_app(tmp_path):
+    primary, replica = tmp_path / 'primary.db', tmp_path / 'replica.db'
+
+    class Config(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{primary}'
+        SQLALCHEMY_BINDS = {'replica': f'sqlite:///{replica}'}
+        READ_REPLICA_BINDS = ['replica']
+        ENTITY_CACHE_BACKEND = None
+        RESPONSE_CACHE_BACKEND = None
+
+    app = create_app(Config)
+    with app.app_context():
+        db.create_all()
+        facade.create_amenity({'name': 'Wifi'})
+        db.session.remove()
+        shutil.copy(primary, replica)
+        yield app
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def test_lookups_are_served_by_the_replica(replicated_app):
+    facade.create_amenity({'name': 'Pool'})     # primary only
+    db.session.remove()
+
+    assert [a.name for a in facade.get_all_amenities()] == ['Wifi']
+    assert facade.get_amenity_by_name('Pool') is None
+    assert get_read_router().replica_reads == 2
+
+
+def test_reads_stick_to_the_primary_after_a_write(replicated_app):
+    pool = facade.create_amenity({'name': 'Pool'})
+    assert facade.get_amenity_by_name('Pool').id == pool.id
+    assert {a.name for a in facade.get_all_amenities()} == {'Wifi', 'Pool'}
+    assert get_read_router().primary_reads == 2
+
+    db.session.remove()                         # next request
+    assert facade.get_amenity_by_name('Pool') is None
+
+
+def test_units_of_work_read_from_the_primary(replicated_app):
+    facade.create_amenity({'name': 'Pool'})
+    db.session.remove()
+    with unit_of_work():
+        assert facade.get_amenity_by_name('Pool') is not None
+    assert get_read_router().replica_reads == 0
+
+
+def test_request_reads_replica_unless_it_wrote(replicated_app):
+    admin = User(first_name='A', last_name='B', email='admin@example.com', is_admin=True)
+    admin.password = 'x'
+    facade.user_repo.add(admin)
+    headers = {'Authorization': f'Bearer {create_token(admin)}'}
+    db.session.remove()
+    client = replicated_app.test_client()
+
+    response = client.post('/api/v1/amenities/', json={'name': 'Sauna'}, headers=headers)
+    assert response.status_code == 201
+    assert response.json['name'] == 'Sauna'
+    db.session.remove()                         # end of the request
+    # A later request reads the replica, which has not caught up
+    assert client.get(f"/api/v1/amenities/{response.json['id']}").status_code == 404
+
+
+def test_without_replicas_everything_uses_the_primary(app):
+    assert get_read_router() is None
+    facade.create_amenity({'name': 'Wifi'})
+    db.session.remove()
+    assert facade.get_amenity_by_name('Wifi') is not None
+
+
+def test_unknown_replica_bind_is_rejected():
+    class Config(TestingConfig):
+        READ_REPLICA_BINDS = ['missing']
+
+    with pytest.raises(ValueError):
+        create_app(Config)
@@ -0,0 +1,114 @@
+"""
+Full-response cache of the public place and amenity listings.
+"""
+import pytest
+
+from hbnb.app import db
+from hbnb.app.services import facade
+from hbnb.app.utils.response_cache import get_response_cache
+
+
+def _get(client, url, **headers):
+    response = client.get(url, headers=headers)
+    assert response.status_code in (200, 304)
+    return response
+
+
+def test_repeated_listing_is_served_without_queries(app, hbnb_client, count_queries):
+    facade.create_amenity({'name': 'Wi-Fi'})
+    facade.create_amenity({'name': 'Pool'})
+    first = _get(hbnb_client, '/api/v1/amenities/?limit=5&fields=name')
+    assert first.headers['X-Cache'] == 'MISS'
+
+    with count_queries() as counter:
+        # Same arguments in another order: same entry
+        second = _get(hbnb_client, '/api/v1/amenities/?fields=name&limit=5&cursor=')
+    assert second.headers['X-Cache'] == 'HIT'
+    assert counter.count == 0
+    assert second.data == first.data
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert second.headers['Content-Type'] == 'application/json'
+    assert second.headers['Cache-Control'] == 'public, no-cache'
+
+    third = _get(hbnb_client, '/api/v1/amenities/?fields=name&limit=5',
+                 **{'If-None-Match': first.headers['ETag']})
+    assert third.status_code == 304 and third.data == b''
+
+
+def test_facade_writes_invalidate_listings(app, hbnb_client):
+    owner = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                                'email': 'ann@example.com', 'password': 'x'})
+    wifi = facade.create_amenity({'name': 'Wi-Fi'})
+    place = facade.create_place({'title': 'Loft', 'price': 90, 'latitude': 1.0,
+                                 'longitude': 2.0, 'owner_id': owner.id,
+                                 'amenities': [wifi.id]})
+    db.session.remove()
+    _get(hbnb_client, '/api/v1/places/')
+    assert _get(hbnb_client, '/api/v1/places/').headers['X-Cache'] == 'HIT'
+
+    facade.update_amenity(wifi.id, {'name': 'Fibre'})
+    db.session.remove()
+    response = _get(hbnb_client, '/api/v1/places/')
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.json[0]['amenities'][0]['name'] == 'Fibre'
+
+    guest = facade.create_user({'first_name': 'Bob', 'last_name': 'Ray',
+                                'email': 'bob@example.com', 'password': 'x'})
+    facade.create_review({'text': 'Great', 'rating': 5,
+                          'user_id': guest.id, 'place_id': place.id})
+    db.session.remove()
+    assert _get(hbnb_client, '/api/v1/places/').json[0]['review_count'] == 1
+
+    facade.delete_place(place.id)
+    db.session.remove()
+    assert _get(hbnb_client, '/api/v1/places/').json == []
+
+
+def test_write_during_a_miss_cannot_store_stale_data(app, hbnb_client, monkeypatch):
+    facade.create_amenity({'name': 'Wi-Fi'})
+    read_page = facade.get_amenities_page
+
+    def read_then_write(*args, **kwargs):
+        page = read_page(*args, **kwargs)
+        facade.create_amenity({'name': 'Pool'})     # commits after our read
+        return page
+
+    monkeypatch.setattr(facade, 'get_amenities_page', read_then_write)
+    assert len(_get(hbnb_client, '/api/v1/amenities/').json) == 1
+    monkeypatch.undo()
+    response = _get(hbnb_client, '/api/v1/amenities/')
+    assert response.headers['X-Cache'] == 'MISS'
+    assert len(response.json) == 2
+
+
+def test_no_cache_request_and_metrics(app, hbnb_client, make_user, auth_headers):
+    facade.create_amenity({'name': 'Wi-Fi'})
+    size = len(_get(hbnb_client, '/api/v1/amenities/').data)
+    _get(hbnb_client, '/api/v1/amenities/')
+    response = _get(hbnb_client, '/api/v1/amenities/', **{'Cache-Control': 'no-cache'})
+    assert response.headers['X-Cache'] == 'MISS'
+
+    admin = make_user("admin@example.com", is_admin=True)
+    metrics = hbnb_client.get('/api/v1/metrics/', headers=auth_headers(admin)).json
+    stats = metrics['response_cache']
+    assert (stats['hits'], stats['misses']) == (1, 1)
+    assert stats['hit_ratio'] == 0.5
+    assert stats['bytes_saved'] == size
+
+
+def test_writes_in_a_transaction_invalidate_when_it_commits(app):
+    cache = get_response_cache()
+    wifi = facade.create_amenity({'name': 'Wi-Fi'})
+    before = cache.generation('amenities')
+    with facade.transaction():
+        facade.update_amenity(wifi.id, {'name': 'Fibre'})
+        # A reader could re-cache the old listing under a new token here
+        assert cache.generation('amenities') == before
+    assert cache.generation('amenities') != before
+
+    before = cache.generation('amenities')
+    with pytest.raises(RuntimeError):
+        with facade.transaction():
+            facade.update_amenity(wifi.id, {'name': 'Wi-Fi'})
+            raise RuntimeError
+    assert cache.generation('amenities') == before
@@ -0,0 +1,84 @@
+"""
+One review per (user, place): index probe in the API, unique index in the DB.
+"""
+import pytest
+
+from hbnb.app import db
+from hbnb.app.models.place import Place
+from hbnb.app.services import facade
+from hbnb.app.services.exceptions import DuplicateReviewError
+
+
+def _setup():
+    owner = facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                                'email': 'owner@example.com', 'password': 'x'})
+    reviewer = facade.create_user({'first_name': 'Bob', 'last_name': 'Ray',
+                                   'email': 'bob@example.com', 'password': 'x'})
+    place = facade.create_place({'title': 'Loft', 'price': 90, 'latitude': 1.0,
+                                 'longitude': 2.0, 'owner_id': owner.id})
+    return reviewer, place
+
+
+def test_duplicate_post_is_rejected_without_loading_reviews(
+        app, hbnb_client, auth_headers, count_queries):
+    reviewer, place = _setup()
+    payload = {'text': 'Nice', 'rating': 4, 'user_id': reviewer.id, 'place_id': place.id}
+    headers = auth_headers(reviewer)
+    assert hbnb_client.post('/api/v1/reviews/', json=payload, headers=headers).status_code == 201
+
+    with count_queries() as counter:
+        response = hbnb_client.post('/api/v1/reviews/', json=payload, headers=headers)
+    assert response.status_code == 403
+    assert response.json['message'] == 'You have already reviewed this place'
+    assert not any(s.lstrip().startswith('SELECT reviews.') for s in counter.selects)
+    assert any('EXISTS' in s for s in counter.selects)
+    assert facade.has_reviewed(reviewer.id, place.id)
+
+
+def test_unique_index_rejects_a_duplicate_that_skipped_the_check(app):
+    reviewer, place = _setup()
+    place_id = place.id
+    data = {'text': 'Nice', 'rating': 4, 'user_id': reviewer.id, 'place_id': place_id}
+    facade.create_review(dict(data))
+    with pytest.raises(DuplicateReviewError):
+        facade.create_review(dict(data, rating=1))
+
+    db.session.remove()
+    stored = db.session.get(Place, place_id)
+    assert (stored.review_count, stored.rating_sum) == (1, 4)
+
+
+def test_duplicate_in_a_transaction_only_undoes_the_review(app):
+    reviewer, place = _setup()
+    data = {'text': 'Nice', 'rating': 4, 'user_id': reviewer.id, 'place_id': place.id}
+    facade.create_review(dict(data))
+
+    with facade.transaction():
+        loft = facade.create_place({'title': 'Barn', 'price': 50, 'latitude': 3.0,
+                                    'longitude': 4.0, 'owner_id': place.owner_id})
+        with pytest.raises(DuplicateReviewError):
+            facade.create_review(dict(data, rating=1))
+        facade.create_review(dict(data, place_id=loft.id, rating=2))
+    loft_id, place_id = loft.id, place.id
+
+    db.session.remove()
+    assert db.session.get(Place, loft_id).review_count == 1
+    stored = db.session.get(Place, place_id)
+    assert (stored.review_count, stored.rating_sum) == (1, 4)
+
+
+def test_savepoint_does_not_commit_the_enclosing_transaction(app):
+    reviewer, place = _setup()
+    with pytest.raises(RuntimeError):
+        with facade.transaction():
+            loft = facade.create_place({'title': 'Barn', 'price': 50, 'latitude': 3.0,
+                                        'longitude': 4.0, 'owner_id': place.owner_id})
+            db.session.flush()
+            facade.create_review({'text': 'Nice', 'rating': 4, 'user_id': reviewer.id,
+                                  'place_id': loft.id})
+            raise RuntimeError
+    loft_id, reviewer_id = loft.id, reviewer.id
+
+    db.session.remove()
+    assert db.session.get(Place, loft_id) is None
+    assert not facade.has_reviewed(reviewer_id, loft_id)
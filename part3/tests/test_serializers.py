@@ -0,0 +1,77 @@
+"""
+Compiled model serializers and the JSON encoder.
+"""
+import json
+from datetime import datetime
+
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+from hbnb.app.serializers import (
+    PLACE, PLACE_WRITE, USER, DateTime, Serializer, dumps, format_datetime
+)
+
+CREATED = datetime(2024, 5, 1, 12, 30, 0, 250000)
+
+
+def _place():
+    owner = User(first_name="Ann", last_name="Lee", email="ann@example.com")
+    owner.id, owner.created_at, owner.updated_at = "u1", CREATED, CREATED
+    place = Place(title="Loft", price=90, latitude=1.0, longitude=2.0, owner_id="u1")
+    place.id, place.created_at, place.updated_at = "p1", CREATED, None
+    place.owner = owner
+    wifi = Amenity(name="Wi-Fi")
+    wifi.id = "a1"
+    place.amenities = [wifi]
+    review = Review(text="Great", rating=5, user_id="u2", place_id="p1")
+    review.id = "r1"
+    place.reviews = [review]
+    return place
+
+
+def test_place_serializer_renders_nested_data():
+    data = PLACE(_place())
+    assert data['owner'] == {'id': 'u1', 'first_name': 'Ann', 'last_name': 'Lee',
+                             'email': 'ann@example.com'}
+    assert data['amenities'] == [{'id': 'a1', 'name': 'Wi-Fi'}]
+    assert data['reviews'] == [{'id': 'r1', 'text': 'Great', 'rating': 5, 'user_id': 'u2'}]
+    assert data['created_at'] == CREATED.isoformat()
+    assert data['updated_at'] is None
+    assert 'reviews' not in PLACE_WRITE(_place())
+
+
+def test_projection_keeps_declared_order_and_is_compiled_once():
+    place = _place()
+    assert list(PLACE.project(place, ['title', 'id'])) == ['id', 'title']
+    assert PLACE.many([place], ['title']) == [{'title': 'Loft'}]
+    assert ('id', 'title') in PLACE._compiled
+    assert 'title' in PLACE and 'password' not in USER
+
+
+def test_custom_fields_and_missing_nested():
+    serializer = Serializer({
+        'name': 'first_name',
+        'shout': lambda user: user.first_name.upper(),
+        'seen': DateTime('created_at'),
+    })
+    user = User(first_name="Ann", last_name="Lee", email="ann@example.com")
+    assert serializer(user) == {'name': 'Ann', 'shout': 'ANN', 'seen': None}
+    place = _place()
+    place.owner = None
+    assert PLACE.project(place, ['owner']) == {'owner': None}
+
+
+def test_dumps_and_datetime_cache():
+    assert json.loads(dumps({'a': [1, 2.5, None], 1: 'x'})) == {'a': [1, 2.5, None], '1': 'x'}
+    # Integers beyond 64 bits are refused by orjson and retried with json
+    assert json.loads(dumps({'big': 2 ** 70})) == {'big': 2 ** 70}
+    assert format_datetime(CREATED) is format_datetime(CREATED)
+    assert format_datetime(None) is None
+
+
+def test_api_responses_use_the_serializers(app, hbnb_client, make_user):
+    user = make_user("ann@example.com")
+    data = hbnb_client.get(f'/api/v1/users/{user.id}').json
+    assert data == USER(user)
+    assert set(hbnb_client.get('/api/v1/users/?fields=email').json[0]) == {'email'}
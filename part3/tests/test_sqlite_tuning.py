@@ -0,0 +1,42 @@
+"""
+Connection PRAGMAs of the SQLite production profile.
+"""
+import pytest
+from sqlalchemy import text
+
+from config import SQLiteProductionConfig, TestingConfig
+from hbnb.app import create_app, db
+from hbnb.app.persistence.sqlite import pragma_statements
+
+
+def test_production_pragmas_are_applied_to_each_connection(tmp_path):
+    class Config(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'hbnb.db'}"
+        SQLITE_PRAGMAS = SQLiteProductionConfig.SQLITE_PRAGMAS
+        SQLALCHEMY_ENGINE_OPTIONS = SQLiteProductionConfig.SQLALCHEMY_ENGINE_OPTIONS
+
+    app = create_app(Config)
+    with app.app_context():
+        with db.engine.connect() as conn:
+            read = lambda name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            assert read('journal_mode') == 'wal'
+            assert read('synchronous') == 1         # NORMAL
+            assert read('foreign_keys') == 1
+            assert read('busy_timeout') == 5000
+            assert read('cache_size') == -64000
+        assert db.engine.pool.size() == SQLiteProductionConfig.SQLALCHEMY_ENGINE_OPTIONS['pool_size']
+        db.engine.dispose()
+
+
+def test_default_profile_keeps_sqlite_defaults(app):
+    with db.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 0
+
+
+def test_pragma_values_are_validated():
+    assert pragma_statements({'foreign_keys': True, 'cache_size': -2000}) == [
+        "PRAGMA foreign_keys=ON", "PRAGMA cache_size=-2000"]
+    with pytest.raises(ValueError):
+        pragma_statements({'journal_mode': 'WAL; DROP TABLE users'})
+    with pytest.raises(ValueError):
+        pragma_statements({'x=1; --': 1})
@@ -0,0 +1,99 @@
+"""
+Application startup: profile, lazy Swagger document, deferred bcrypt
+calibration and the create-admin command.
+"""
+import threading
+
+from config import TestingConfig
+from hbnb.app import NAMESPACES, create_app
+from hbnb.app.api.v1.users import api as users_ns
+from hbnb.app.extensions import password_hasher
+from hbnb.app.services import facade
+from hbnb.app.utils import password_hashing
+from hbnb.app.utils.password_hashing import hash_cost
+from hbnb.app.utils.startup import StartupProfile
+
+
+class ProfiledConfig(TestingConfig):
+    STARTUP_PROFILE = True
+
+
+class CalibratedConfig(TestingConfig):
+    BCRYPT_TARGET_MS = 1
+    BCRYPT_MIN_ROUNDS = 4
+
+
+def test_startup_profile_times_each_step():
+    app = create_app(ProfiledConfig)
+    profile = app.extensions['hbnb_startup']
+    names = [name for name, _, _ in profile.steps]
+    assert names[:3] == ['db', 'bcrypt', 'jwt']
+    assert all(f'register {path}' in names for _, path in NAMESPACES)
+    assert profile.total >= sum(elapsed for _, elapsed, _ in profile.steps)
+    assert profile.first_request is None
+
+    app.test_client().get('/swagger.json')
+    assert profile.first_request >= profile.total
+    stats = profile.stats()
+    assert set(stats['steps']) == set(names)
+    assert 'time to first response' in profile.report()
+
+
+def test_startup_profile_disabled_records_nothing():
+    profile = StartupProfile()
+    with profile.step('db'):
+        pass
+    profile.finish()
+    assert profile.steps == [] and profile.total is None
+
+    app = create_app(TestingConfig)
+    assert app.extensions['hbnb_startup'].steps == []
+
+
+def test_swagger_document_is_built_on_first_doc_hit(app, hbnb_client):
+    api = users_ns.apis[-1]
+    assert api._schema is None
+
+    # Validated payloads resolve model references without the document
+    response = hbnb_client.post('/api/v1/users/', json={'first_name': 'Ann'})
+    assert response.status_code == 400
+    response = hbnb_client.post('/api/v1/users/', json={
+        'first_name': 'Ann', 'last_name': 'Lee', 'email': 'ann@example.com',
+        'password': 'secret'})
+    assert response.status_code == 201
+    assert api._schema is None
+
+    response = hbnb_client.get('/swagger.json')
+    assert response.status_code == 200
+    assert 'User' in response.get_json()['definitions']
+    assert api._schema is not None
+
+
+def test_bcrypt_cost_is_calibrated_off_the_startup_path(monkeypatch):
+    release = threading.Event()
+
+    def slow_calibration(bcrypt, target_ms, min_rounds):
+        release.wait(5)
+        return 5
+
+    monkeypatch.setattr(password_hashing, 'calibrate_rounds', slow_calibration)
+    app = create_app(CalibratedConfig)
+    assert password_hasher.stats()['bcrypt_rounds'] is None
+    release.set()
+    with app.app_context():
+        pw_hash = password_hasher.hash('secret')
+    assert hash_cost(pw_hash) == password_hasher.rounds == 5
+
+
+def test_create_admin_command(app):
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=['create-admin', '--email', 'root@example.com',
+                                 '--password', 'secret'])
+    assert result.output.strip() == 'Admin created: root@example.com'
+    admin = facade.get_user_by_email('root@example.com')
+    assert admin.is_admin and admin.verify_password('secret')
+
+    result = runner.invoke(args=['create-admin', '--email', 'root@example.com',
+                                 '--password', 'other'])
+    assert result.output.strip() == 'User root@example.com already exists'
+    assert facade.get_user_by_email('root@example.com').verify_password('secret')
@@ -0,0 +1,96 @@
+"""
+Logout and the in-memory token blocklist.
+"""
+import uuid
+
+from hbnb.app import db
+from hbnb.app.extensions import token_blocklist
+from hbnb.app.models.revoked_token import RevokedToken
+from hbnb.app.utils.token_blocklist import BloomFilter, TokenBlocklist
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    keys = [str(uuid.uuid4()) for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    others = sum(str(uuid.uuid4()) in bloom for _ in range(10000))
+    assert others < 300     # about 1% expected
+
+
+def test_logout_revokes_the_token(app, hbnb_client, make_user, auth_headers):
+    headers = auth_headers(make_user("ann@example.com"))
+    assert hbnb_client.post('/api/v1/users/logout', headers=headers).status_code == 200
+    assert hbnb_client.post('/api/v1/users/logout', headers=headers).status_code == 401
+    assert db.session.query(RevokedToken).count() == 1
+
+
+def test_revoked_token_is_401_without_exception_propagation(app, hbnb_client, make_user,
+                                                            auth_headers):
+    app.config['PROPAGATE_EXCEPTIONS'] = False      # as in production
+    headers = auth_headers(make_user("ann@example.com"))
+    assert hbnb_client.post('/api/v1/users/logout', headers=headers).status_code == 200
+
+    response = hbnb_client.post('/api/v1/users/logout', headers=headers)
+    assert response.status_code == 401
+    assert response.json['message'] == 'Token has been revoked'
+    response = hbnb_client.post('/api/v1/users/logout',
+                                headers={'Authorization': 'Bearer not-a-token'})
+    assert response.status_code == 401
+    assert hbnb_client.post('/api/v1/users/logout').status_code == 401
+
+
+def test_revocations_survive_a_restart(app, hbnb_client, make_user, auth_headers):
+    headers = auth_headers(make_user("ann@example.com"))
+    other = auth_headers(make_user("bob@example.com"))
+    hbnb_client.post('/api/v1/users/logout', headers=headers)
+
+    token_blocklist.init_app(app)       # a fresh worker: nothing in memory
+    assert hbnb_client.post('/api/v1/users/logout', headers=headers).status_code == 401
+    assert hbnb_client.post('/api/v1/users/logout', headers=other).status_code == 200
+
+
+def test_check_needs_no_query_between_syncs(app, hbnb_client, make_user, auth_headers,
+                                            count_queries):
+    headers = auth_headers(make_user("admin@example.com", is_admin=True))
+    assert hbnb_client.get('/api/v1/metrics/', headers=headers).status_code == 200
+
+    with count_queries() as counter:
+        response = hbnb_client.get('/api/v1/metrics/', headers=headers)
+    assert response.json['token_blocklist']['syncs'] == 1
+    assert counter.selects == []
+
+
+def test_expired_entries_are_dropped():
+    clock = FakeClock()
+    rows = []
+    blocklist = TokenBlocklist(clock=clock)
+    blocklist.sync_interval = 10
+    blocklist.use_source(lambda since, now: rows)
+    blocklist.add('old', expires_at=clock.now + 5)
+    blocklist.add('new', expires_at=clock.now + 100)
+    assert blocklist.is_revoked('old') and blocklist.is_revoked('new')
+
+    clock.now += 20         # 'old' has expired and the next check syncs
+    assert not blocklist.is_revoked('old')
+    assert blocklist.is_revoked('new')
+    assert blocklist.stats()['entries'] == 1
+
+
+def test_filter_grows_beyond_its_capacity():
+    blocklist = TokenBlocklist()
+    blocklist.capacity = 10
+    blocklist._reset()
+    for i in range(50):
+        blocklist.add(f'jti-{i}')
+    assert all(blocklist.is_revoked(f'jti-{i}') for i in range(50))
+    assert not blocklist.is_revoked('jti-x')
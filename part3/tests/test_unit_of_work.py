@@ -0,0 +1,61 @@
+"""
+Unit of work: one COMMIT per facade write, rollback on error.
+"""
+import pytest
+from hbnb.app import db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.user import User
+from hbnb.app.services import facade
+
+
+def _owner():
+    return facade.create_user({'first_name': 'Ann', 'last_name': 'Lee',
+                               'email': 'ann@example.com', 'password': 'secret'})
+
+
+def test_update_user_commits_once_and_keeps_password_hashed(app, count_commits):
+    user = _owner()
+    count_commits.clear()
+    facade.update_user(user.id, {'first_name': 'Anna', 'password': 'changed'})
+    assert len(count_commits) == 1
+    assert user.first_name == 'Anna'
+    assert user.verify_password('changed')
+
+
+def test_create_and_update_place_commit_once(app, count_commits):
+    owner = _owner()
+    wifi, pool = facade.create_amenity({'name': 'Wi-Fi'}), facade.create_amenity({'name': 'Pool'})
+    count_commits.clear()
+    place = facade.create_place({'title': 'Loft', 'price': 90, 'latitude': 1.0,
+                                 'longitude': 2.0, 'owner_id': owner.id,
+                                 'amenities': [wifi.id, pool.id]})
+    assert len(count_commits) == 1
+    assert sorted(a.name for a in place.amenities) == ['Pool', 'Wi-Fi']
+
+    count_commits.clear()
+    facade.update_place(place.id, {'title': 'Loft 2', 'amenities': [pool.id]})
+    assert len(count_commits) == 1
+    assert [a.name for a in place.amenities] == ['Pool']
+
+
+def test_transaction_groups_calls_and_rolls_back_on_error(app, count_commits):
+    _owner()
+    count_commits.clear()
+    with pytest.raises(ValueError):
+        with facade.transaction():
+            facade.create_amenity({'name': 'Sauna'})
+            facade.create_amenity({'name': ''})
+    assert Amenity.query.count() == 0
+    assert count_commits == []
+
+    with facade.transaction():
+        facade.create_amenity({'name': 'Sauna'})
+        facade.create_amenity({'name': 'Gym'})
+    assert len(count_commits) == 1
+    assert Amenity.query.count() == 2
+
+
+def test_writes_outside_a_transaction_still_commit(app):
+    _owner()
+    db.session.remove()
+    assert User.query.filter_by(email='ann@example.com').one()
@@ -0,0 +1,34 @@
+"""
+First-user bootstrap: an EXISTS probe instead of loading every user.
+"""
+from hbnb.app.services import facade
+
+
+def _payload(email):
+    return {'first_name': 'Ann', 'last_name': 'Lee', 'email': email, 'password': 'secret'}
+
+
+def test_repository_exists_and_count(app, make_user):
+    assert not facade.user_repo.exists()
+    assert facade.user_repo.count() == 0
+    make_user("a@example.com", is_admin=True)
+    make_user("b@example.com")
+    assert facade.user_repo.exists(is_admin=True)
+    assert facade.user_repo.count() == 2
+    assert facade.user_repo.count(is_admin=True) == 1
+
+
+def test_first_user_needs_no_admin_then_check_is_cached(app, hbnb_client, count_queries):
+    response = hbnb_client.post('/api/v1/users/', json=_payload("first@example.com"))
+    assert response.status_code == 201
+
+    with count_queries() as counter:
+        response = hbnb_client.post('/api/v1/users/', json=_payload("second@example.com"))
+    assert response.status_code == 403
+    assert len(counter.selects) == 1 and 'EXISTS' in counter.selects[0]
+
+    # Once a user has been seen the answer is cached: no query at all
+    with count_queries() as counter:
+        response = hbnb_client.post('/api/v1/users/', json=_payload("third@example.com"))
+    assert response.status_code == 403
+    assert counter.count == 0